@@ -57,6 +57,8 @@ from .models import (
     Session,
     Slot,
     Song,
+    SyncState,
+    Tally,
     User,
     Venue,
 )
@@ -1276,6 +1278,79 @@ class SongAdmin(admin.ModelAdmin):
     )
 
 
+@admin.register(SyncState)
+class SyncStateAdmin(admin.ModelAdmin):
+    fields = [
+        'source',
+        'updated_ts',
+        'last_id',
+    ]
+
+    readonly_fields = [
+        'source',
+    ]
+
+    list_display = [
+        'source',
+        'updated_ts',
+        'last_id',
+        'modified',
+    ]
+
+    ordering = [
+        'source',
+    ]
+    save_on_top = True
+
+
+@admin.register(Tally)
+class TallyAdmin(admin.ModelAdmin):
+    fields = [
+        'level',
+        'object_id',
+        'category',
+        'kind',
+        'points',
+        'count',
+    ]
+
+    readonly_fields = [
+        'level',
+        'object_id',
+        'category',
+        'kind',
+        'points',
+        'count',
+    ]
+
+    list_display = [
+        'object_id',
+        'level',
+        'category',
+        'kind',
+        'points',
+        'count',
+    ]
+
+    list_filter = [
+        'level',
+        'category',
+        'kind',
+    ]
+
+    search_fields = [
+        'object_id',
+    ]
+
+    ordering = [
+        'level',
+        'object_id',
+        'category',
+        'kind',
+    ]
+    save_on_top = True
+
+
 @admin.register(Venue)
 class VenueAdmin(admin.ModelAdmin):
     save_on_top = True
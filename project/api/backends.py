@@ -1,6 +1,11 @@
 # Third-Party
 from django_filters.rest_framework.backends import DjangoFilterBackend
 from dry_rest_permissions.generics import DRYPermissionFiltersBase
+from rest_framework.filters import BaseFilterBackend
+
+# Django
+from django.core.exceptions import FieldDoesNotExist
+from django.utils.module_loading import import_string
 
 
 class CoalesceFilterBackend(DjangoFilterBackend):
@@ -26,3 +31,145 @@ class ScoreFilterBackend(DRYPermissionFiltersBase):
             #         song__appearance__entry__entity__officers__person__user=request.user,
             #     )
         return queryset.none()
+
+
+def requested_fields(request, resource_name):
+    """Field names a request asks for on ``resource_name``.
+
+    Returns None when there is no `fields[type]` parameter; otherwise the
+    sparse fieldset plus the roots of any `include` paths.
+    """
+    raw = request.query_params.get('fields[{0}]'.format(resource_name))
+    if not raw:
+        return None
+    requested = set(
+        name.strip().replace('-', '_')
+        for name in raw.split(',') if name.strip()
+    )
+    requested.update(included_fields(request))
+    return requested
+
+
+def included_fields(request):
+    """Roots of the `include` paths in a request."""
+    return set(
+        path.strip().replace('-', '_').split('.')[0]
+        for path in request.query_params.get('include', '').split(',')
+        if path.strip()
+    )
+
+
+class SparseFieldsFilterBackend(BaseFilterBackend):
+    """Narrow the queryset to a JSON:API `fields[type]` sparse fieldset.
+
+    The serializer trims its own output; this backend makes the SQL match.
+    Unrequested columns are deferred, and prefetches for relationships
+    that are neither requested nor included are dropped.  Relation columns
+    stay loaded because the permission checks read them.  If a computed
+    attribute is requested, only text columns are deferred, since the
+    property may read any of the others.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        requested = requested_fields(request, getattr(view, 'resource_name', None))
+        if requested is None:
+            return queryset
+        model = queryset.model
+        fields = view.get_serializer_class().Meta.fields
+        concrete = {}
+        computed = False
+        for name in fields:
+            try:
+                field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                if name in requested and name not in ['url', 'permissions']:
+                    computed = True
+                continue
+            if field.concrete and not field.is_relation and not field.primary_key:
+                concrete[name] = field
+        deferred = [
+            name for name, field in concrete.items()
+            if name not in requested and (
+                not computed or field.get_internal_type() == 'TextField'
+            )
+        ]
+        if deferred:
+            queryset = queryset.defer(*deferred)
+        lookups = queryset._prefetch_related_lookups
+        kept = [
+            lookup for lookup in lookups
+            if getattr(lookup, 'prefetch_to', lookup).split('__')[0] in requested
+        ]
+        if len(kept) != len(lookups):
+            queryset = queryset.prefetch_related(None).prefetch_related(*kept)
+        return queryset
+
+
+class IncludeFilterBackend(BaseFilterBackend):
+    """Load the relations named in a JSON:API `include` parameter."""
+
+    def filter_queryset(self, request, queryset, view):
+        raw = request.query_params.get('include')
+        if raw:
+            paths = [
+                path.strip().replace('-', '_')
+                for path in raw.split(',') if path.strip()
+            ]
+            select, prefetch = plan_includes(view.get_serializer_class(), paths)
+            if select:
+                queryset = queryset.select_related(*select)
+            if prefetch:
+                queryset = queryset.prefetch_related(*prefetch)
+        return queryset
+
+
+def plan_includes(serializer_class, paths):
+    """Translate include paths into select_related and prefetch_related lookups.
+
+    Each path is walked through the `included_serializers` of the
+    serializers along it.  Runs of forward foreign keys from the root are
+    joined with select_related; anything reached through a to-many relation
+    is prefetched.  The to-many relationships an included resource renders
+    as linkage are prefetched too, so the number of queries stays bounded
+    by the shape of the include rather than the number of rows; those it
+    only renders as links are not.  Unknown names are skipped here and
+    reported by the serializer's validation.
+    """
+    # Local; the fields module imports this one.
+    from .fields import RelatedLinksManyField
+    select = set()
+    prefetch = set()
+    for path in paths:
+        serializer = serializer_class
+        lookups = []
+        joined = True
+        for name in path.split('.'):
+            included = getattr(serializer, 'included_serializers', None) or {}
+            if name not in included:
+                break
+            try:
+                field = serializer.Meta.model._meta.get_field(name)
+            except FieldDoesNotExist:
+                break
+            lookups.append(name)
+            lookup = '__'.join(lookups)
+            joined = joined and (field.many_to_one or field.one_to_one)
+            if joined:
+                select.add(lookup)
+            else:
+                prefetch.add(lookup)
+            serializer = included[name]
+            if isinstance(serializer, str):
+                serializer = import_string(serializer)
+            model = serializer.Meta.model
+            declared = getattr(serializer, '_declared_fields', {})
+            for related in serializer.Meta.fields:
+                if isinstance(declared.get(related), RelatedLinksManyField):
+                    continue
+                try:
+                    field = model._meta.get_field(related)
+                except FieldDoesNotExist:
+                    continue
+                if field.one_to_many or field.many_to_many:
+                    prefetch.add('{0}__{1}'.format(lookup, related))
+    return sorted(select), sorted(prefetch)
@@ -9,5 +9,11 @@ class ApiConfig(AppConfig):
 
     def ready(self):
         from .signals import (
+            office_post_save,
+            role_changed,
+            round_post_transition,
+            score_post_delete,
+            score_post_save,
+            session_post_transition,
             user_post_save,
         )
@@ -38,6 +38,7 @@ from api.models import (
     Session,
     Slot,
     Song,
+    Tally,
     User,
     Venue,
 )
@@ -342,6 +343,18 @@ class SongFactory(DjangoModelFactory):
         model = Song
 
 
+class TallyFactory(DjangoModelFactory):
+    level = Tally.LEVEL.song
+    object_id = Faker('uuid4')
+    category = Tally.CATEGORY.music
+    kind = Tally.KIND.official
+    points = FuzzyInteger(50, 90)
+    count = 1
+
+    class Meta:
+        model = Tally
+
+
 class VenueFactory(DjangoModelFactory):
     name = 'Test Convention Center'
     status = Venue.STATUS.active
@@ -1,10 +1,18 @@
 import os
+from collections import OrderedDict
 
 # Third-Party
 import pytz
 import six
 from cloudinary.models import CloudinaryField
+from rest_framework.fields import SkipField
+from rest_framework.relations import (
+    MANY_RELATION_KWARGS,
+    ManyRelatedField,
+)
+from rest_framework.reverse import reverse
 from rest_framework_json_api import serializers
+from rest_framework_json_api.relations import ResourceRelatedField
 
 # Django
 from django.core.exceptions import (
@@ -15,6 +23,9 @@ from django.db import models
 from django.utils.deconstruct import deconstructible
 from django.utils.text import slugify
 
+# Local
+from .backends import included_fields
+
 @deconstructible
 class PathAndRename(object):
     def __init__(self, sub_path='', prefix=''):
@@ -50,3 +61,44 @@ class TimezoneField(serializers.Field):
             return pytz.timezone(str(data))
         except pytz.exceptions.UnknownTimeZoneError:
             raise ValidationError('Unknown timezone')
+
+
+class RelatedLinksField(ResourceRelatedField):
+    """A to-many relationship served as links to its paginated endpoints.
+
+    Use with ``many=True``.  Resource linkage is only rendered when the
+    relationship is included, so the primary payload does not grow with
+    the number of related rows.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('read_only', True)
+        super().__init__(**kwargs)
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {'child_relation': cls(*args, **kwargs)}
+        for key in kwargs.keys():
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return RelatedLinksManyField(**list_kwargs)
+
+    def get_links(self, obj=None, lookup_field='pk'):
+        request = self.context.get('request')
+        kwargs = {
+            'pk': getattr(obj, lookup_field),
+            'related_field': self.parent.field_name,
+        }
+        name = obj._meta.model_name
+        return OrderedDict([
+            ('self', reverse('{0}-relationships'.format(name), kwargs=kwargs, request=request)),
+            ('related', reverse('{0}-related'.format(name), kwargs=kwargs, request=request)),
+        ])
+
+
+class RelatedLinksManyField(ManyRelatedField):
+    def get_attribute(self, instance):
+        request = self.context.get('request')
+        if request is None or self.field_name not in included_fields(request):
+            raise SkipField()
+        return super().get_attribute(instance)
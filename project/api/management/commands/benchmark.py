@@ -0,0 +1,330 @@
+# Standard Libary
+import json
+import platform
+import random
+import time
+import tracemalloc
+from io import StringIO
+
+# Third-Party
+from factory.random import reseed_random
+from rest_framework import status
+from rest_framework.test import APIClient
+
+# Django
+from django.core.management import call_command
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+)
+from django.db import (
+    connection,
+    transaction,
+)
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.timezone import now
+
+# First-Party
+from api.factories import (
+    AppearanceFactory,
+    AwardFactory,
+    ContestantFactory,
+    ContestFactory,
+    ConventionFactory,
+    EntryFactory,
+    GroupFactory,
+    OrganizationFactory,
+    PanelistFactory,
+    RoundFactory,
+    SessionFactory,
+    SongFactory,
+    UserFactory,
+)
+from api.models import (
+    Entry,
+    Panelist,
+    Round,
+    Score,
+    Session,
+)
+from api.scoring import score_session
+
+ENDPOINTS = [
+    'appearance-list',
+    'contestant-list',
+    'entry-list',
+    'person-list',
+    'round-list',
+    'score-list',
+    'session-list',
+    'song-list',
+]
+
+
+class Command(BaseCommand):
+    help = "Command to benchmark scoring against a synthetic session."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '-e',
+            '--entries',
+            dest='entries',
+            type=int,
+            default=20,
+            help='Entries in the session.',
+        )
+        parser.add_argument(
+            '-r',
+            '--rounds',
+            dest='rounds',
+            type=int,
+            default=2,
+            choices=[1, 2, 3],
+            help='Rounds in the session; round.finish needs at least two.',
+        )
+        parser.add_argument(
+            '-p',
+            '--panel',
+            dest='panel',
+            type=int,
+            default=3,
+            help='Judges per category.',
+        )
+        parser.add_argument(
+            '-n',
+            '--repeat',
+            dest='repeat',
+            type=int,
+            default=1,
+            help='Runs per operation; the fastest is reported.',
+        )
+        parser.add_argument(
+            '-s',
+            '--seed',
+            dest='seed',
+            type=int,
+            default=0,
+            help='Seed for the generated points and names.',
+        )
+        parser.add_argument(
+            '-o',
+            '--output',
+            dest='output',
+            default=None,
+            help='Write JSON results to this file instead of stdout.',
+        )
+        parser.add_argument(
+            '--keep',
+            action='store_true',
+            dest='keep',
+            default=False,
+            help='Keep the generated data instead of rolling it back.',
+        )
+
+    def handle(self, *args, **options):
+        if options['entries'] < 1 or options['panel'] < 1:
+            raise CommandError("Entries and panel must be positive.")
+        params = dict(
+            (k, options[k])
+            for k in ['entries', 'rounds', 'panel', 'repeat', 'seed']
+        )
+        with transaction.atomic():
+            start = time.time()
+            session = self.build(**params)
+            build = time.time() - start
+            results = self.run(session, options['repeat'])
+            if not options['keep']:
+                transaction.set_rollback(True)
+        report = {
+            'created': now().isoformat(),
+            'python': platform.python_version(),
+            'database': connection.vendor,
+            'params': params,
+            'build': round(build, 3),
+            'results': results,
+        }
+        output = json.dumps(report, indent=2, sort_keys=True)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output)
+            self.stdout.write("Results written to {0}".format(options['output']))
+        else:
+            self.stdout.write(output)
+        return
+
+    def build(self, entries, rounds, panel, seed, **kwargs):
+        """Generate a scored session with the requested shape.
+
+        Scores are bulk-created, so no score signal fires; the session is
+        then scored once.
+        """
+        rng = random.Random(seed)
+        reseed_random(seed)
+        organization = OrganizationFactory()
+        convention = ConventionFactory(
+            organization=organization,
+        )
+        session = SessionFactory(
+            convention=convention,
+            status=Session.STATUS.started,
+        )
+        award = AwardFactory(
+            organization=organization,
+            rounds=rounds,
+        )
+        contest = ContestFactory(
+            session=session,
+            award=award,
+        )
+        items = []
+        scores = []
+        for i in range(1, entries + 1):
+            entry = EntryFactory(
+                session=session,
+                group=GroupFactory(organization=organization),
+                status=Entry.STATUS.approved,
+                draw=i,
+            )
+            ContestantFactory(
+                entry=entry,
+                contest=contest,
+            )
+            items.append(entry)
+        for num in range(1, rounds + 1):
+            round = RoundFactory(
+                session=session,
+                num=num,
+                kind=rounds - num + 1,
+            )
+            panelists = [
+                PanelistFactory(
+                    round=round,
+                    kind=Panelist.KIND.official,
+                    category=category,
+                )
+                for category in [
+                    Panelist.CATEGORY.music,
+                    Panelist.CATEGORY.performance,
+                    Panelist.CATEGORY.singing,
+                ]
+                for _ in range(panel)
+            ]
+            for i, entry in enumerate(items, start=1):
+                appearance = AppearanceFactory(
+                    round=round,
+                    entry=entry,
+                    num=i,
+                )
+                for song_num in [1, 2]:
+                    song = SongFactory(
+                        appearance=appearance,
+                        num=song_num,
+                    )
+                    for panelist in panelists:
+                        scores.append(Score(
+                            song=song,
+                            panelist=panelist,
+                            category=panelist.category,
+                            kind=Score.KIND.official,
+                            points=rng.randint(50, 90),
+                        ))
+        Score.objects.bulk_create(scores)
+        score_session(session)
+        return session
+
+    def run(self, session, repeat):
+        first = session.rounds.get(num=1)
+        user = UserFactory(is_staff=True)
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        def session_finish():
+            session.status = Session.STATUS.started
+            session.finish()
+
+        def round_finish():
+            # The finals branch renders announcements remotely, and its
+            # scoring is covered by Session.finish.
+            first.status = Round.STATUS.started
+            first.finish()
+
+        def round_verify():
+            first.verify_scores()
+
+        score = Score.objects.filter(
+            song__appearance__round=first,
+        ).order_by('id').first()
+
+        def score_verify():
+            score.verify()
+
+        def recalculate():
+            call_command(
+                'recalculate',
+                session=str(session.id),
+                workers=1,
+                stdout=StringIO(),
+            )
+
+        def get(path):
+            response = client.get(path)
+            if response.status_code != status.HTTP_200_OK:
+                raise CommandError(
+                    "GET {0} returned {1}".format(path, response.status_code)
+                )
+
+        operations = [
+            ('session.finish', session_finish),
+            ('round.verify_scores', round_verify),
+            ('score.verify', score_verify),
+            ('recalculate', recalculate),
+        ]
+        if first.kind != Round.KIND.finals:
+            operations.insert(1, ('round.finish', round_finish))
+        else:
+            self.stderr.write("Skipping round.finish; it needs --rounds=2 or more.")
+        for name in ENDPOINTS:
+            path = reverse(name)
+            operations.append(
+                ('GET {0}'.format(path), lambda path=path: get(path))
+            )
+        results = []
+        for name, operation in operations:
+            runs = [measure(operation) for _ in range(max(1, repeat))]
+            result = min(runs, key=lambda r: r['wall'])
+            result['name'] = name
+            results.append(result)
+            self.stderr.write(
+                "{name}: {wall:.3f}s, {queries} queries".format(**result)
+            )
+        return results
+
+
+def measure(operation):
+    """Run ``operation`` twice, recording wall time and SQL, then peak memory.
+
+    Tracing allocations slows Python down severalfold, so the peak is
+    taken in a second run rather than the timed one.  The captured queries
+    are read before it, since each request empties the query log.  The
+    log is bounded, so it is emptied first or a full log would capture
+    nothing.
+    """
+    connection.queries_log.clear()
+    with CaptureQueriesContext(connection) as context:
+        start = time.perf_counter()
+        operation()
+        wall = time.perf_counter() - start
+    queries = context.captured_queries
+    tracemalloc.start()
+    try:
+        operation()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        'wall': round(wall, 4),
+        'queries': len(queries),
+        'sql': round(sum(float(q['time']) for q in queries), 4),
+        'peak_memory': peak,
+    }
@@ -1,5 +1,6 @@
 # Standard Libary
-from optparse import make_option
+import multiprocessing
+import time
 
 # Django
 from django.core.management.base import (
@@ -9,59 +10,129 @@ from django.core.management.base import (
 
 # First-Party
 from api.models import (
-    Appearance,
-    Contestant,
-    Entry,
+    Convention,
     Session,
-    Song,
 )
+from api.pool import imap_pool
+from api.scoring import score_session
+
+
+def recalculate_session(session_id):
+    """Score one session; runs inside a pool worker."""
+    start = time.time()
+    try:
+        session = Session.objects.get(id=session_id)
+        score_session(session)
+    except Exception as e:
+        return (session_id, time.time() - start, repr(e))
+    return (session_id, time.time() - start, None)
 
 
 class Command(BaseCommand):
-    help = "Command to denormalize names."
+    help = "Command to recalculate session scores."
 
-    option_list = BaseCommand.option_list + (
-        make_option(
-            "-s",
-            "--session",
-            dest="session",
-            help="Specify session by UUID",
-        ),
-    )
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '-s',
+            '--session',
+            dest='session',
+            default=None,
+            help='Specify session by UUID.',
+        )
+        parser.add_argument(
+            '-c',
+            '--convention',
+            dest='convention',
+            default=None,
+            help='Specify convention by UUID.',
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            dest='all',
+            default=False,
+            help='Recalculate all sessions.',
+        )
+        parser.add_argument(
+            '-w',
+            '--workers',
+            dest='workers',
+            type=int,
+            default=multiprocessing.cpu_count(),
+            help='Number of worker processes.',
+        )
+        parser.add_argument(
+            '--chunk',
+            dest='chunk',
+            type=int,
+            default=1,
+            help='Sessions handed to a worker at a time.',
+        )
 
     def handle(self, *args, **options):
-        if options['session'] is None:
-            raise CommandError("Option `--session=...` must be specified.")
-
-        try:
-            session = Session.objects.get(
-                id=options['session'],
+        scopes = [
+            options['session'],
+            options['convention'],
+            options['all'] or None,
+        ]
+        if len([s for s in scopes if s]) != 1:
+            raise CommandError(
+                "Specify exactly one of `--session=...`, `--convention=...` or `--all`."
             )
-        except Session.DoesNotExist:
-            raise CommandError("Session does not exist.")
-
-        items = Song.objects.filter(
-            appearance__round__session=session,
+        if options['session']:
+            sessions = Session.objects.filter(id=options['session'])
+            if not sessions.exists():
+                raise CommandError("Session does not exist.")
+        elif options['convention']:
+            try:
+                convention = Convention.objects.get(id=options['convention'])
+            except Convention.DoesNotExist:
+                raise CommandError("Convention does not exist.")
+            sessions = convention.sessions.all()
+        else:
+            sessions = Session.objects.all()
+        session_ids = list(
+            sessions.order_by('nomen').values_list('id', flat=True)
         )
-        for i in items:
-            i.calculate()
-            i.save()
-        items = Appearance.objects.filter(
-            round__session=session,
+        total = len(session_ids)
+        workers = max(1, min(options['workers'], total))
+
+        self.stdout.write(
+            "Recalculating {0} sessions with {1} workers...".format(total, workers)
         )
-        for i in items:
-            i.calculate()
-            i.save()
-        items = Entry.objects.filter(
-            session=session,
+        start = time.time()
+        results = self.report(
+            imap_pool(
+                recalculate_session,
+                session_ids,
+                workers,
+                chunksize=max(1, options['chunk']),
+            ),
+            total,
         )
-        for i in items:
-            i.calculate()
-            i.save()
-        items = Contestant.objects.filter(
-            contest__session=session,
+        elapsed = time.time() - start
+
+        errors = [r for r in results if r[2]]
+        for session_id, duration, error in errors:
+            self.stderr.write("{0}: {1}".format(session_id, error))
+        durations = sorted(results, key=lambda r: r[1], reverse=True)
+        self.stdout.write(
+            "Recalculated {0} sessions in {1:.1f}s ({2:.2f}s/session), {3} errors.".format(
+                total - len(errors),
+                elapsed,
+                elapsed / total if total else 0,
+                len(errors),
+            )
         )
-        for i in items:
-            i.calculate()
-            i.save()
-        return "Recalculated"
+        for session_id, duration, error in durations[:5]:
+            self.stdout.write("  {0:.2f}s {1}".format(duration, session_id))
+        return
+
+    def report(self, results, total):
+        done = []
+        for result in results:
+            done.append(result)
+            self.stdout.write("{0}/{1}".format(len(done), total), ending='\r')
+            self.stdout.flush()
+        self.stdout.write("")
+        return done
@@ -1,35 +1,102 @@
 # Standard Libary
-import datetime
+import multiprocessing
+import time
 
 # Django
 from django.core.management.base import BaseCommand
 
 # First-Party
-from api.models import (
-    Person,
-    Group,
-    Member,
-)
+from api.pool import imap_pool
 from bhs.models import (
     Human,
     Structure,
-    SMJoin,
 )
 from bhs.updaters import (
-    update_or_create_person_from_human,
-    update_or_create_member_from_smjoin,
+    crud_auth0,
+    get_high_water,
+    get_member_changes,
+    get_member_smjoins,
+    get_partitions,
+    get_sync_state,
+    get_watermark,
+    in_partition,
+    in_window,
+    iterate_changes,
+    sync_member_changes,
+    sync_members_from_smjoins,
+    sync_persons_from_humans,
     update_or_create_group_from_structure,
 )
 
-from django.db.models import Count
 
-from django.utils import (
-    timezone,
-)
+def sync_person_partition(state, low, high, mark):
+    humans = Human.objects.filter(
+        in_partition('id', low, high),
+        in_window(None, mark),
+    )
+    rows = humans.filter(in_window(get_watermark(state), mark)).count()
+    sync_persons_from_humans(humans, state=state)
+    return rows
+
+
+def sync_group_partition(state, low, high, mark):
+    structures = Structure.objects.filter(
+        in_partition('id', low, high),
+        in_window(None, mark),
+    )
+    rows = 0
+    for chunk in iterate_changes(structures, state):
+        for structure in chunk:
+            update_or_create_group_from_structure(structure)
+            rows += 1
+    return rows
+
+
+def sync_member_partition(state, low, high, mark):
+    # Partition by structure, so all SMJoins of a pair land together.
+    smjoins = get_member_smjoins().filter(
+        in_partition('structure__id', low, high),
+    )
+    if state.updated_ts is None:
+        # A full pass goes by pair, so it only checkpoints once done.
+        rows = smjoins.count()
+        sync_members_from_smjoins(smjoins)
+        return rows
+    changes = get_member_changes(smjoins).filter(
+        in_window(None, mark),
+    )
+    rows = changes.filter(in_window(get_watermark(state), mark)).count()
+    sync_member_changes(iterate_changes(changes, state), smjoins)
+    return rows
+
+
+# Phases run in this order; members need both persons and groups.
+PHASES = [
+    ('persons', Human.objects.all, sync_person_partition),
+    ('groups', Structure.objects.all, sync_group_partition),
+    ('members', get_member_smjoins, sync_member_partition),
+]
+
+
+def sync_partition(task):
+    """Sync one partition of a phase; runs inside a pool worker.
+
+    The partition resumes from, and checkpoints after each chunk to, its
+    own SyncState.
+    """
+    phase, low, high, mark = task
+    source, function = dict((name, (s, f)) for name, s, f in PHASES)[phase]
+    begin = time.time()
+    try:
+        state = get_sync_state(source().model, partition=(low, high))
+        rows = function(state, low, high, mark)
+    except Exception as e:
+        return (task, 0, time.time() - begin, repr(e))
+    return (task, rows, time.time() - begin, None)
 
 
 class Command(BaseCommand):
-    help = "Command to sync database with Auth0."
+    help = "Command to sync persons, groups and members with BHS."
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -37,92 +104,111 @@ class Command(BaseCommand):
             action='store_true',
             dest='all',
             default=False,
-            help='Update all groups.',
+            help='Sync everything, not just what changed since the last run.',
+        )
+        parser.add_argument(
+            '-w',
+            '--workers',
+            dest='workers',
+            type=int,
+            default=multiprocessing.cpu_count(),
+            help='Number of worker processes.',
+        )
+        parser.add_argument(
+            '-p',
+            '--partitions',
+            dest='partitions',
+            type=int,
+            default=16,
+            help='Id ranges each phase is split into.',
         )
 
     def handle(self, *args, **options):
-        # sync persons
-        self.stdout.write("Updating persons...")
-        if options['all']:
-            hs = Human.objects.all()
-        else:
-            now = timezone.now()
-            cursor = now - datetime.timedelta(hours=25)
-            hs = Human.objects.filter(
-                updated_ts__gt=cursor,
+        partitions = get_partitions(max(1, options['partitions']))
+        workers = max(1, min(options['workers'], len(partitions)))
+        results = []
+        for phase, source, function in PHASES:
+            model = source().model
+            state = get_sync_state(model, reset=options['all'])
+            mark = get_high_water(source())
+            if mark is None:
+                continue
+            # Each partition resumes from its own checkpoint, unless the
+            # phase as a whole is further along.
+            start = get_watermark(state)
+            for low, high in partitions:
+                checkpoint = get_sync_state(
+                    model,
+                    reset=options['all'],
+                    partition=(low, high),
+                )
+                resume = get_watermark(checkpoint)
+                if start is not None and (resume is None or resume < start):
+                    checkpoint.updated_ts, checkpoint.last_id = start
+                checkpoint.save()
+            tasks = [
+                (phase, low, high, mark)
+                for low, high in partitions
+            ]
+            self.stdout.write(
+                "Syncing {0} in {1} partitions with {2} workers...".format(
+                    phase,
+                    len(tasks),
+                    workers,
+                )
             )
-        total = hs.count()
-        i = 0
-        for h in hs:
-            i += 1
-            update_or_create_person_from_human(h)
-            self.stdout.write("{0}/{1}".format(i, total), ending='\r')
-            self.stdout.flush()
-        self.stdout.write("Updated {0} persons.".format(total))
-        # Sync Groups
-        self.stdout.write("Updating groups...")
-        if options['all']:
-            ss = Structure.objects.all()
-        else:
-            now = timezone.now()
-            cursor = now - datetime.timedelta(hours=25)
-            ss = Structure.objects.filter(
-                updated_ts__gt=cursor,
+            begin = time.time()
+            done = list(imap_pool(sync_partition, tasks, workers))
+            elapsed = time.time() - begin
+            errors = [r for r in done if r[3]]
+            for task, rows, duration, error in errors:
+                self.stderr.write("{0} {1}-{2}: {3}".format(
+                    phase,
+                    task[1],
+                    task[2] or '',
+                    error,
+                ))
+            # Finished partitions stand at the mark; the phase moves to the
+            # partition furthest behind.
+            failed = set(task[1] for task, rows, duration, error in errors)
+            marks = []
+            for low, high in partitions:
+                checkpoint = get_sync_state(model, partition=(low, high))
+                if low not in failed:
+                    checkpoint.updated_ts, checkpoint.last_id = mark
+                    checkpoint.save()
+                marks.append(get_watermark(checkpoint))
+            if None in marks:
+                state.updated_ts, state.last_id = None, ''
+            else:
+                state.updated_ts, state.last_id = min(marks)
+            state.save()
+            rows = sum(r[1] for r in done)
+            self.stdout.write(
+                "Synced {0} {1} rows in {2:.1f}s ({3:.0f} rows/s), {4} errors.".format(
+                    rows,
+                    phase,
+                    elapsed,
+                    rows / elapsed if elapsed else 0,
+                    len(errors),
+                )
             )
-        total = ss.count()
-        i = 0
-        for s in ss:
-            i += 1
-            update_or_create_group_from_structure(s)
-            self.stdout.write("{0}/{1}".format(i, total), ending='\r')
-            self.stdout.flush()
-        self.stdout.write("Updated {0} groups.".format(total))
-
-        # Sync Members
-        self.stdout.write("Updating members...")
-        if options['all']:
-            duplicates = SMJoin.objects.filter(
-                structure__kind__in=[
-                    'quartet',
-                    'chapter',
-                ],
-            ).values(
-                'structure__id',
-                'subscription__human_id',
-            ).order_by(
-            ).annotate(
-                count_id=Count('id')
-            ).filter(count_id__gt=0)
-        else:
-            now = timezone.now()
-            cursor = now - datetime.timedelta(hours=25)
-            duplicates = SMJoin.objects.filter(
-                structure__kind__in=[
-                    'quartet',
-                    'chapter',
-                ],
-                updated_ts__gt=cursor,
-            ).values(
-                'structure__id',
-                'subscription__human_id',
-            ).order_by(
-            ).annotate(
-                count_id=Count('id')
-            ).filter(count_id__gt=0)
-
-        i = 0
-        total = duplicates.count()
-        for d in duplicates:
-            i += 1
-            j = SMJoin.objects.filter(
-                structure=d['structure__id'],
-                subscription__human=d['subscription__human_id'],
-            ).order_by(
-                'status',
-                'established_date',
-            ).last()
-            update_or_create_member_from_smjoin(j)
-            self.stdout.write("{0}/{1}".format(i, total), ending='\r')
-            self.stdout.flush()
-        self.stdout.write("Updated {0} members.".format(total))
+            results.extend(done)
+            if phase == 'persons':
+                # Users were written in bulk, without the Auth0 signal.
+                self.stdout.write("Reconciling Auth0...")
+                try:
+                    crud_auth0()
+                except Exception as e:
+                    self.stderr.write("auth0: {0!r}".format(e))
+        slowest = sorted(results, key=lambda r: r[2], reverse=True)
+        self.stdout.write("Slowest partitions:")
+        for task, rows, duration, error in slowest[:5]:
+            self.stdout.write("  {0:.2f}s {1} {2}-{3} ({4} rows)".format(
+                duration,
+                task[0],
+                task[1],
+                task[2] or '',
+                rows,
+            ))
         self.stdout.write("Complete")
@@ -1,16 +1,12 @@
-# Standard Libary
-import datetime
-
 # Django
 from django.core.management.base import BaseCommand
 
 # First-Party
 from api.models import Group
 from bhs.models import Structure
-from bhs.updaters import update_or_create_group_from_structure
-
-from django.utils import (
-    timezone,
+from bhs.updaters import (
+    get_sync_state,
+    sync_groups_from_structures,
 )
 
 class Command(BaseCommand):
@@ -27,19 +23,8 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         self.stdout.write("Updating groups...")
-        if options['all']:
-            ss = Structure.objects.all()
-        else:
-            now = timezone.now()
-            cursor = now - datetime.timedelta(hours=25)
-            ss = Structure.objects.filter(
-                updated_ts__gt=cursor,
-            )
-        total = ss.count()
-        i = 0
-        for s in ss:
-            i += 1
-            update_or_create_group_from_structure(s)
-            self.stdout.write("{0}/{1}".format(i, total), ending='\r')
-            self.stdout.flush()
+        total = sync_groups_from_structures(
+            Structure.objects.all(),
+            state=get_sync_state(Structure, reset=options['all']),
+        )
         self.stdout.write("Updated {0} groups.".format(total))
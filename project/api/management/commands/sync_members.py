@@ -1,18 +1,12 @@
-# Standard Libary
-import datetime
-
 # Django
 from django.core.management.base import BaseCommand
 
 # First-Party
 from api.models import Member
 from bhs.models import SMJoin
-from bhs.updaters import update_or_create_member_from_smjoin
-
-from django.db.models import Count
-
-from django.utils import (
-    timezone,
+from bhs.updaters import (
+    get_sync_state,
+    sync_members,
 )
 
 class Command(BaseCommand):
@@ -29,49 +23,10 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         self.stdout.write("Updating members...")
-
-        if options['all']:
-            duplicates = SMJoin.objects.filter(
-                structure__kind__in=[
-                    'quartet',
-                    'chapter',
-                ],
-            ).values(
-                'structure__id',
-                'subscription__human_id',
-            ).order_by(
-            ).annotate(
-                count_id=Count('id')
-            ).filter(count_id__gt=0)
-        else:
-            now = timezone.now()
-            cursor = now - datetime.timedelta(hours=25)
-            duplicates = SMJoin.objects.filter(
-                structure__kind__in=[
-                    'quartet',
-                    'chapter',
-                ],
-                updated_ts__gt=cursor,
-            ).values(
-                'structure__id',
-                'subscription__human_id',
-            ).order_by(
-            ).annotate(
-                count_id=Count('id')
-            ).filter(count_id__gt=0)
-
-        i = 0
-        total = duplicates.count()
-        for d in duplicates:
-            i += 1
-            j = SMJoin.objects.filter(
-                structure=d['structure__id'],
-                subscription__human=d['subscription__human_id'],
-            ).order_by(
-                'status',
-                'established_date',
-            ).last()
-            update_or_create_member_from_smjoin(j)
-            self.stdout.write("{0}/{1}".format(i, total), ending='\r')
-            self.stdout.flush()
-        self.stdout.write("Updated {0} members.".format(total))
+        created, updated = sync_members(
+            get_sync_state(SMJoin),
+            full=options['all'],
+        )
+        self.stdout.write(
+            "Created {0} and updated {1} members.".format(created, updated)
+        )
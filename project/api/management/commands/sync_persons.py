@@ -1,16 +1,13 @@
-# Standard Libary
-import datetime
-
 # Django
 from django.core.management.base import BaseCommand
 
 # First-Party
 from api.models import Person
 from bhs.models import Human
-from bhs.updaters import update_or_create_person_from_human
-
-from django.utils import (
-    timezone,
+from bhs.updaters import (
+    crud_auth0,
+    get_sync_state,
+    sync_persons_from_humans,
 )
 
 class Command(BaseCommand):
@@ -27,19 +24,13 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         self.stdout.write("Updating persons...")
-        if options['all']:
-            hs = Human.objects.all()
-        else:
-            now = timezone.now()
-            cursor = now - datetime.timedelta(hours=25)
-            hs = Human.objects.filter(
-                updated_ts__gt=cursor,
-            )
-        total = hs.count()
-        i = 0
-        for h in hs:
-            i += 1
-            update_or_create_person_from_human(h)
-            self.stdout.write("{0}/{1}".format(i, total), ending='\r')
-            self.stdout.flush()
-        self.stdout.write("Updated {0} persons.".format(total))
+        created, updated = sync_persons_from_humans(
+            Human.objects.all(),
+            state=get_sync_state(Human, reset=options['all']),
+        )
+        self.stdout.write(
+            "Created {0} and updated {1} persons.".format(created, updated)
+        )
+        # Users were written in bulk, without the Auth0 signal.
+        self.stdout.write("Reconciling Auth0...")
+        crud_auth0()
@@ -0,0 +1,162 @@
+# Standard Libary
+import time
+from collections import (
+    defaultdict,
+    deque,
+)
+
+# Django
+from django.conf import settings
+from django.db import connection
+from django.db.backends.utils import CursorWrapper
+
+# Most recent API requests, newest last; per process.
+metrics = deque(maxlen=settings.METRICS_BUFFER_SIZE)
+
+
+class CountingCursorWrapper(CursorWrapper):
+    """Add the count and duration of every statement to a request's marks."""
+
+    def __init__(self, cursor, db, marks):
+        super().__init__(cursor, db)
+        self.marks = marks
+
+    def execute(self, sql, params=None):
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, params)
+        finally:
+            self.count(start)
+
+    def executemany(self, sql, param_list):
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, param_list)
+        finally:
+            self.count(start)
+
+    def count(self, start):
+        self.marks['sql_count'] += 1
+        self.marks['sql_time'] += time.perf_counter() - start
+
+
+class MetricsMiddleware(object):
+    """Record SQL, serializer and render timings for API requests.
+
+    Queries are counted and timed by wrapping the connection's cursors for
+    the duration of the request, without keeping the statements.  The view
+    phase runs until DRF hands back its unrendered response; its time
+    outside of SQL is reported as serializer time, since for these
+    viewsets that is what remains once the queryset has been fetched.
+    Rendering the JSON:API document is timed separately through a
+    post-render callback.  Nothing is recorded unless METRICS_ENABLED.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.METRICS_ENABLED:
+            return self.get_response(request)
+        if not request.path.startswith(settings.METRICS_PATH_PREFIX):
+            return self.get_response(request)
+        marks = request._metrics = {
+            'start': time.perf_counter(),
+            'sql_count': 0,
+            'sql_time': 0.0,
+        }
+        make_cursor = connection.make_cursor
+        make_debug_cursor = connection.make_debug_cursor
+        connection.make_cursor = lambda cursor: CountingCursorWrapper(
+            make_cursor(cursor), connection, marks,
+        )
+        connection.make_debug_cursor = lambda cursor: CountingCursorWrapper(
+            make_debug_cursor(cursor), connection, marks,
+        )
+        try:
+            response = self.get_response(request)
+            record = self.record(request, response)
+        finally:
+            del connection.make_cursor
+            del connection.make_debug_cursor
+        metrics.append(record)
+        response['Server-Timing'] = server_timing(record)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        marks = getattr(request, '_metrics', None)
+        if marks is not None:
+            marks['view'] = time.perf_counter()
+        return None
+
+    def process_template_response(self, request, response):
+        marks = getattr(request, '_metrics', None)
+        if marks is not None:
+            marks['rendering'] = time.perf_counter()
+            marks['view_sql'] = marks['sql_time']
+            response.add_post_render_callback(
+                lambda r: marks.update(rendered=time.perf_counter())
+            )
+        return response
+
+    def record(self, request, response):
+        marks = request._metrics
+        end = time.perf_counter()
+        view_start = marks.get('view', marks['start'])
+        view_end = marks.get('rendering', end)
+        view_sql = marks.get('view_sql', marks['sql_time'])
+        match = request.resolver_match
+        if hasattr(response, 'streaming_content'):
+            size = None
+        else:
+            size = len(response.content)
+        return {
+            'timestamp': time.time(),
+            'method': request.method,
+            'path': request.path,
+            'endpoint': match.view_name if match else None,
+            'status': response.status_code,
+            'sql_count': marks['sql_count'],
+            'sql_time': marks['sql_time'],
+            'serializer_time': max(view_end - view_start - view_sql, 0.0),
+            'render_time': marks.get('rendered', view_end) - view_end,
+            'total_time': end - marks['start'],
+            'size': size,
+        }
+
+
+def server_timing(record):
+    """Format a metrics record as a Server-Timing header value."""
+    return ", ".join([
+        'sql;dur={0:.1f};desc="{1} queries"'.format(
+            record['sql_time'] * 1000,
+            record['sql_count'],
+        ),
+        'serializer;dur={0:.1f}'.format(record['serializer_time'] * 1000),
+        'render;dur={0:.1f}'.format(record['render_time'] * 1000),
+        'total;dur={0:.1f}'.format(record['total_time'] * 1000),
+    ])
+
+
+def summarize(records):
+    """Aggregate metrics records per endpoint, slowest first."""
+    endpoints = defaultdict(list)
+    for record in records:
+        endpoints[record['endpoint'] or record['path']].append(record)
+    summary = []
+    for endpoint, items in endpoints.items():
+        n = len(items)
+        totals = sorted(r['total_time'] for r in items)
+        summary.append({
+            'endpoint': endpoint,
+            'requests': n,
+            'sql_count_mean': sum(r['sql_count'] for r in items) / n,
+            'sql_count_max': max(r['sql_count'] for r in items),
+            'sql_time_mean': sum(r['sql_time'] for r in items) / n,
+            'serializer_time_mean': sum(r['serializer_time'] for r in items) / n,
+            'render_time_mean': sum(r['render_time'] for r in items) / n,
+            'total_time_mean': sum(totals) / n,
+            'total_time_p95': totals[int(0.95 * (n - 1))],
+            'size_mean': sum(r['size'] or 0 for r in items) / n,
+        })
+    return sorted(summary, key=lambda s: s['total_time_mean'], reverse=True)
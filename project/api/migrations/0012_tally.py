@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.4 on 2026-10-18 09:30
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.utils.timezone
+import model_utils.fields
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_scoring_counts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tally',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('level', models.IntegerField(choices=[(10, 'Song'), (20, 'Appearance'), (30, 'Entry'), (40, 'Contestant')])),
+                ('object_id', models.UUIDField(help_text='\n            The Song, Appearance, Entry or Contestant (per level).')),
+                ('category', models.IntegerField(choices=[(30, 'Music'), (40, 'Performance'), (50, 'Singing')])),
+                ('kind', models.IntegerField(choices=[(10, 'Official'), (20, 'Practice'), (30, 'Composite')])),
+                ('points', models.IntegerField(default=0, help_text='\n            The sum of scored points.')),
+                ('count', models.IntegerField(default=0, help_text='\n            The number of scored points.')),
+            ],
+            options={
+                'verbose_name_plural': 'tallies',
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='tally',
+            unique_together=set([('level', 'object_id', 'category', 'kind')]),
+        ),
+    ]
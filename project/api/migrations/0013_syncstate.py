@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.4 on 2026-10-18 14:10
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.utils.timezone
+import model_utils.fields
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_tally'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncState',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('source', models.CharField(help_text='\n            The BHS view being synced.', max_length=255, unique=True)),
+                ('updated_ts', models.DateTimeField(blank=True, help_text='\n            The `updated_ts` of the last synced row.', null=True)),
+                ('last_id', models.CharField(blank=True, default='', help_text='\n            The id of the last synced row, breaking `updated_ts` ties.', max_length=255)),
+            ],
+            options={
+                'verbose_name_plural': 'sync states',
+            },
+        ),
+    ]
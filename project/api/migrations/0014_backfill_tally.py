@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from collections import defaultdict
+
+from django.db import migrations
+from django.db.models import Count, Sum
+
+BATCH_SIZE = 500
+
+SONG = 10
+APPEARANCE = 20
+ENTRY = 30
+CONTESTANT = 40
+
+
+def grouped(Score, key, *extra):
+    """Points and counts of every score grouped by `key`, kind and category."""
+    return Score.objects.values(
+        key,
+        'kind',
+        'category',
+        *extra
+    ).annotate(
+        points_sum=Sum('points'),
+        points_count=Count('points'),
+    ).order_by()
+
+
+def backfill_tally(apps, schema_editor):
+    """Rebuild every stored tally from the scores.
+
+    Scores entered before tallies existed have none, so incremental score
+    changes on those sessions would shift from zero.
+    """
+    Score = apps.get_model('api', 'Score')
+    Contestant = apps.get_model('api', 'Contestant')
+    Tally = apps.get_model('api', 'Tally')
+
+    tallies = defaultdict(lambda: [0, 0])
+    for level, key in [
+        (SONG, 'song_id'),
+        (APPEARANCE, 'song__appearance_id'),
+        (ENTRY, 'song__appearance__entry_id'),
+    ]:
+        for row in grouped(Score, key):
+            tally = tallies[(level, row[key], row['kind'], row['category'])]
+            tally[0] += row['points_sum'] or 0
+            tally[1] += row['points_count']
+
+    # Contestants only count rounds up to their award's number of rounds.
+    entry_rounds = defaultdict(list)
+    for row in grouped(Score, 'song__appearance__entry_id', 'song__appearance__round__num'):
+        entry_rounds[row['song__appearance__entry_id']].append(row)
+    contestants = Contestant.objects.values_list(
+        'id',
+        'entry_id',
+        'contest__award__rounds',
+    )
+    for contestant_id, entry_id, rounds in contestants:
+        for row in entry_rounds.get(entry_id, []):
+            if row['song__appearance__round__num'] <= rounds:
+                tally = tallies[(CONTESTANT, contestant_id, row['kind'], row['category'])]
+                tally[0] += row['points_sum'] or 0
+                tally[1] += row['points_count']
+
+    Tally.objects.all().delete()
+    Tally.objects.bulk_create(
+        [
+            Tally(
+                level=level,
+                object_id=object_id,
+                kind=kind,
+                category=category,
+                points=points,
+                count=count,
+            )
+            for (level, object_id, kind, category), (points, count) in tallies.items()
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_syncstate'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_tally, migrations.RunPython.noop),
+    ]
@@ -17,10 +17,12 @@ from dry_rest_permissions.generics import (
     allow_staff_or_superuser,
     authenticated_users,
 )
-from model_utils import Choices
+from model_utils import (
+    Choices,
+    FieldTracker,
+)
 from model_utils.models import TimeStampedModel
 from nameparser import HumanName
-from ranking import Ranking
 from timezone_field import TimeZoneField
 from cloudinary_storage.storage import RawMediaCloudinaryStorage
 
@@ -56,6 +58,21 @@ from .fields import (
 )
 from .managers import UserManager
 from .messages import send_entry, send_session
+from .permissions import (
+    PermissionContext,
+    get_permission_context,
+)
+from .scoring import (
+    BATCH_SIZE,
+    SCORING_FIELDS,
+    ScoringMixin,
+    advance_round,
+    child_tallies,
+    find_variances,
+    score_session,
+    score_tallies,
+    verify_round,
+)
 from .services import create_pdf
 from .utils import create_bbscores, create_drcj_report
 
@@ -63,7 +80,7 @@ config = api_apps.get_app_config('api')
 
 log = logging.getLogger(__name__)
 
-class Appearance(TimeStampedModel):
+class Appearance(ScoringMixin, TimeStampedModel):
     id = models.UUIDField(
         primary_key=True,
         default=uuid.uuid4,
@@ -174,6 +191,26 @@ class Appearance(TimeStampedModel):
         blank=True,
     )
 
+    mus_count = models.IntegerField(
+        null=True,
+        blank=True,
+    )
+
+    per_count = models.IntegerField(
+        null=True,
+        blank=True,
+    )
+
+    sng_count = models.IntegerField(
+        null=True,
+        blank=True,
+    )
+
+    tot_count = models.IntegerField(
+        null=True,
+        blank=True,
+    )
+
     # FKs
     round = models.ForeignKey(
         'Round',
@@ -247,80 +284,13 @@ class Appearance(TimeStampedModel):
         return "Complete"
 
     def calculate(self, *args, **kwargs):
-        self.rank = self.calculate_rank()
-        self.mus_points = self.calculate_mus_points()
-        self.per_points = self.calculate_per_points()
-        self.sng_points = self.calculate_sng_points()
-        self.tot_points = self.calculate_tot_points()
-        self.mus_score = self.calculate_mus_score()
-        self.per_score = self.calculate_per_score()
-        self.sng_score = self.calculate_sng_score()
-        self.tot_score = self.calculate_tot_score()
-
-    def calculate_rank(self):
-        return self.round.ranking(self.calculate_tot_points())
-
-    def calculate_mus_points(self):
-        return self.songs.filter(
-            scores__kind=10,
-            scores__category=30,
-        ).aggregate(
-            tot=models.Sum('scores__points')
-        )['tot']
-
-    def calculate_per_points(self):
-        return self.songs.filter(
-            scores__kind=10,
-            scores__category=40,
-        ).aggregate(
-            tot=models.Sum('scores__points')
-        )['tot']
-
-    def calculate_sng_points(self):
-        return self.songs.filter(
-            scores__kind=10,
-            scores__category=50,
-        ).aggregate(
-            tot=models.Sum('scores__points')
-        )['tot']
-
-    def calculate_tot_points(self):
-        return self.songs.filter(
-            scores__kind=10,
-        ).aggregate(
-            tot=models.Sum('scores__points')
-        )['tot']
-
-    def calculate_mus_score(self):
-        return self.songs.filter(
-            scores__kind=10,
-            scores__category=30,
-        ).aggregate(
-            tot=models.Avg('scores__points')
-        )['tot']
-
-    def calculate_per_score(self):
-        return self.songs.filter(
-            scores__kind=10,
-            scores__category=40,
-        ).aggregate(
-            tot=models.Avg('scores__points')
-        )['tot']
-
-    def calculate_sng_score(self):
-        return self.songs.filter(
-            scores__kind=10,
-            scores__category=50,
-        ).aggregate(
-            tot=models.Avg('scores__points')
-        )['tot']
-
-    def calculate_tot_score(self):
-        return self.songs.filter(
-            scores__kind=10,
-        ).aggregate(
-            tot=models.Avg('scores__points')
-        )['tot']
+        self.calculate_scores()
+
+    def get_tallies(self):
+        return child_tallies(
+            Tally.LEVEL.song,
+            self.songs.values('id'),
+        )
 
     # Appearance Permissions
     @staticmethod
@@ -336,26 +306,25 @@ class Appearance(TimeStampedModel):
     @allow_staff_or_superuser
     @authenticated_users
     def has_write_permission(request):
+        roles = get_permission_context(request)
         return any([
-            request.user.person.officers.filter(
-                office__is_scoring_manager=True,
-                status__gt=0,
-            ),
-            request.user.person.officers.filter(
-                office__is_convention_manager=True,
-                status__gt=0,
-            )
+            roles.is_officer('is_scoring_manager'),
+            roles.is_officer('is_convention_manager')
         ])
 
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_write_permission(self, request):
+        roles = get_permission_context(request)
         return any([
-            self.round.session.convention.assignments.filter(
-                person=request.user.person,
-                category__lt=30,
-                status__gt=0,
+            roles.is_assigned(
+                lambda: self.round.session.convention_id,
+                categories=[
+                    Assignment.CATEGORY.drcj,
+                    Assignment.CATEGORY.admin,
+                ],
                 kind=10,
+                active=True,
             )
         ])
 
@@ -364,21 +333,34 @@ class Appearance(TimeStampedModel):
     @fsm_log_by
     @transition(field=status, source='*', target=STATUS.started)
     def start(self, *args, **kwargs):
-        panelists = self.round.panelists.filter(
+        Song = config.get_model('Song')
+        Score = config.get_model('Score')
+        panelists = list(self.round.panelists.filter(
             category__gt=20,
-        )
-        i = 1
-        while i <= 2:  # Number songs constant
-            song = self.songs.create(
-                num=i
+        ))
+        # Keys are assigned client-side, so songs and scores are built
+        # in memory and inserted in bulk; bulk_create bypasses save(),
+        # so nomen is set here to match.
+        songs = []
+        scores = []
+        for i in range(1, 3):  # Number songs constant
+            song = Song(
+                appearance=self,
+                num=i,
             )
+            song.nomen = " ".join(map(smart_text, [self, i]))
+            songs.append(song)
             for panelist in panelists:
-                song.scores.create(
+                score = Score(
+                    song=song,
                     category=panelist.category,
                     kind=panelist.kind,
                     panelist=panelist,
                 )
-            i += 1
+                score.nomen = str(score.pk)
+                scores.append(score)
+        Song.objects.bulk_create(songs)
+        Score.objects.bulk_create(scores, batch_size=BATCH_SIZE)
         self.actual_start = now()
         return
 
@@ -493,25 +475,24 @@ class Assignment(TimeStampedModel):
     @allow_staff_or_superuser
     @authenticated_users
     def has_write_permission(request):
+        roles = get_permission_context(request)
         return any([
-            request.user.person.officers.filter(
-                office__is_judge_manager=True,
-                status__gt=0,
-            ),
-            request.user.person.officers.filter(
-                office__is_convention_manager=True,
-                status__gt=0,
-            )
+            roles.is_officer('is_judge_manager'),
+            roles.is_officer('is_convention_manager')
         ])
 
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_write_permission(self, request):
+        roles = get_permission_context(request)
         return any([
-            self.convention.assignments.filter(
-                person=request.user.person,
-                category__lt=20,
-                status__gt=0,
+            roles.is_assigned(
+                self.convention_id,
+                categories=[
+                    Assignment.CATEGORY.drcj,
+                    Assignment.CATEGORY.admin,
+                ],
+                active=True,
             )
         ])
 
@@ -782,21 +763,19 @@ class Award(TimeStampedModel):
     @allow_staff_or_superuser
     @authenticated_users
     def has_write_permission(request):
+        roles = get_permission_context(request)
         return any([
-            request.user.person.officers.filter(
-                office__is_convention_manager=True,
-                status__gt=0,
-            )
+            roles.is_officer('is_convention_manager')
         ])
 
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_write_permission(self, request):
+        roles = get_permission_context(request)
         return any([
-            self.organization.officers.filter(
-                person=request.user.person,
-                office__is_convention_manager=True,
-                status__gt=0,
+            roles.is_officer(
+                'is_convention_manager',
+                organization_id=self.organization_id,
             )
         ])
 
@@ -910,25 +889,18 @@ class Chart(TimeStampedModel):
     @allow_staff_or_superuser
     @authenticated_users
     def has_write_permission(request):
+        roles = get_permission_context(request)
         return any([
-            request.user.person.officers.filter(
-                office__is_chart_manager=True,
-                status__gt=0,
-            ),
-            request.user.person.officers.filter(
-                office__is_group_manager=True,
-                status__gt=0,
-            ),
+            roles.is_officer('is_chart_manager'),
+            roles.is_officer('is_group_manager'),
         ])
 
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_write_permission(self, request):
+        roles = get_permission_context(request)
         return any([
-            request.user.person.officers.filter(
-                office__is_chart_manager=True,
-                status__gt=0,
-            ),
+            roles.is_officer('is_chart_manager'),
         ])
 
     # Transitions
@@ -1045,35 +1017,27 @@ class Contest(TimeStampedModel):
     @allow_staff_or_superuser
     @authenticated_users
     def has_write_permission(request):
+        roles = get_permission_context(request)
         return any([
-            request.user.person.officers.filter(
-                office__is_convention_manager=True,
-                status__gt=0,
-            )
+            roles.is_officer('is_convention_manager')
         ])
 
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_write_permission(self, request):
+        roles = get_permission_context(request)
         return any([
-            self.session.convention.assignments.filter(
-                person=request.user.person,
-                category__lte=10,
+            roles.is_assigned(
+                lambda: self.session.convention_id,
+                categories=[
+                    Assignment.CATEGORY.drcj,
+                    Assignment.CATEGORY.admin,
+                ],
                 kind=10,
             )
         ])
 
     # Methods
-    def ranking(self, point_total):
-        if not point_total:
-            return None
-        contestants = self.contestants.all()
-        points = [contestant.calculate_tot_points() for contestant in contestants]
-        points = sorted(points, reverse=True)
-        ranking = Ranking(points, start=1)
-        rank = ranking.rank(point_total)
-        return rank
-
     def calculate(self, *args, **kwargs):
         if self.contest.is_qualifier:
             champion = None
@@ -1097,7 +1061,7 @@ class Contest(TimeStampedModel):
         return
 
 
-class Contestant(TimeStampedModel):
+class Contestant(ScoringMixin, TimeStampedModel):
     id = models.UUIDField(
         primary_key=True,
         default=uuid.uuid4,
@@ -1174,6 +1138,26 @@ class Contestant(TimeStampedModel):
         blank=True,
     )
 
+    mus_count = models.IntegerField(
+        null=True,
+        blank=True,
+    )
+
+    per_count = models.IntegerField(
+        null=True,
+        blank=True,
+    )
+
+    sng_count = models.IntegerField(
+        null=True,
+        blank=True,
+    )
+
+    tot_count = models.IntegerField(
+        null=True,
+        blank=True,
+    )
+
     # FKs
     entry = models.ForeignKey(
         'Entry',
@@ -1212,88 +1196,15 @@ class Contestant(TimeStampedModel):
 
     # Methods
     def calculate(self, *args, **kwargs):
-        self.mus_points = self.calculate_mus_points()
-        self.per_points = self.calculate_per_points()
-        self.sng_points = self.calculate_sng_points()
-        self.tot_points = self.calculate_tot_points()
-        self.mus_score = self.calculate_mus_score()
-        self.per_score = self.calculate_per_score()
-        self.sng_score = self.calculate_sng_score()
-        self.tot_score = self.calculate_tot_score()
-        self.rank = self.calculate_rank()
-
-    def calculate_rank(self):
-        return self.contest.ranking(self.calculate_tot_points())
-
-    def calculate_mus_points(self):
-        return self.entry.appearances.filter(
-            songs__scores__kind=10,
-            songs__scores__category=30,
-            round__num__lte=self.contest.award.rounds,
-        ).aggregate(
-            tot=models.Sum('songs__scores__points')
-        )['tot']
-
-    def calculate_per_points(self):
-        return self.entry.appearances.filter(
-            songs__scores__kind=10,
-            songs__scores__category=40,
-            round__num__lte=self.contest.award.rounds,
-        ).aggregate(
-            tot=models.Sum('songs__scores__points')
-        )['tot']
-
-    def calculate_sng_points(self):
-        return self.entry.appearances.filter(
-            songs__scores__kind=10,
-            songs__scores__category=50,
-            round__num__lte=self.contest.award.rounds,
-        ).aggregate(
-            tot=models.Sum('songs__scores__points')
-        )['tot']
-
-    def calculate_tot_points(self):
-        return self.entry.appearances.filter(
-            songs__scores__kind=10,
-            round__num__lte=self.contest.award.rounds,
-        ).aggregate(
-            tot=models.Sum('songs__scores__points')
-        )['tot']
-
-    def calculate_mus_score(self):
-        return self.entry.appearances.filter(
-            songs__scores__kind=10,
-            songs__scores__category=30,
-            round__num__lte=self.contest.award.rounds,
-        ).aggregate(
-            tot=models.Avg('songs__scores__points')
-        )['tot']
-
-    def calculate_per_score(self):
-        return self.entry.appearances.filter(
-            songs__scores__kind=10,
-            songs__scores__category=40,
-            round__num__lte=self.contest.award.rounds,
-        ).aggregate(
-            tot=models.Avg('songs__scores__points')
-        )['tot']
-
-    def calculate_sng_score(self):
-        return self.entry.appearances.filter(
-            songs__scores__kind=10,
-            songs__scores__category=50,
-            round__num__lte=self.contest.award.rounds,
-        ).aggregate(
-            tot=models.Avg('songs__scores__points')
-        )['tot']
-
-    def calculate_tot_score(self):
-        return self.entry.appearances.filter(
-            songs__scores__kind=10,
-            round__num__lte=self.contest.award.rounds,
-        ).aggregate(
-            tot=models.Avg('songs__scores__points')
-        )['tot']
+        self.calculate_scores()
+
+    def get_tallies(self):
+        return child_tallies(
+            Tally.LEVEL.appearance,
+            self.entry.appearances.filter(
+                round__num__lte=self.contest.award.rounds,
+            ).values('id'),
+        )
 
     # Permissions
     @staticmethod
@@ -1309,31 +1220,26 @@ class Contestant(TimeStampedModel):
     @allow_staff_or_superuser
     @authenticated_users
     def has_write_permission(request):
+        roles = get_permission_context(request)
         return any([
-            request.user.person.officers.filter(
-                office__is_convention_manager=True,
-                status__gt=0,
-            ),
-            request.user.person.members.filter(
-                is_admin=True,
-                status__gt=0,
-            ),
+            roles.is_officer('is_convention_manager'),
+            roles.is_admin(),
         ])
 
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_write_permission(self, request):
+        roles = get_permission_context(request)
         return any([
-            self.contest.session.convention.assignments.filter(
-                person=request.user.person,
-                category__lte=10,
+            roles.is_assigned(
+                lambda: self.contest.session.convention_id,
+                categories=[
+                    Assignment.CATEGORY.drcj,
+                    Assignment.CATEGORY.admin,
+                ],
                 kind=10,
             ),
-            self.entry.group.members.filter(
-                person=request.user.person,
-                is_admin=True,
-                status__gt=0,
-            ),
+            roles.is_admin(lambda: self.entry.group_id),
         ])
 
 
@@ -1503,20 +1409,18 @@ class Convention(TimeStampedModel):
     @allow_staff_or_superuser
     @authenticated_users
     def has_write_permission(request):
+        roles = get_permission_context(request)
         return any([
-            request.user.person.officers.filter(
-                office__is_convention_manager=True,
-                status__gt=0,
-            ),
+            roles.is_officer('is_convention_manager'),
         ])
 
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_write_permission(self, request):
+        roles = get_permission_context(request)
         return any([
-            self.organization.officers.filter(
-                person__user=request.user,
-                status__gt=0,
+            roles.is_officer(
+                organization_id=self.organization_id,
             ),
         ])
 
@@ -1546,7 +1450,7 @@ class Convention(TimeStampedModel):
         return
 
 
-class Entry(TimeStampedModel):
+class Entry(ScoringMixin, TimeStampedModel):
     id = models.UUIDField(
         primary_key=True,
         default=uuid.uuid4,
@@ -1672,6 +1576,26 @@ class Entry(TimeStampedModel):
         blank=True,
     )
 
+    mus_count = models.IntegerField(
+        null=True,
+        blank=True,
+    )
+
+    per_count = models.IntegerField(
+        null=True,
+        blank=True,
+    )
+
+    sng_count = models.IntegerField(
+        null=True,
+        blank=True,
+    )
+
+    tot_count = models.IntegerField(
+        null=True,
+        blank=True,
+    )
+
     csa_pdf = models.FileField(
         upload_to=PathAndRename(
             prefix='csa',
@@ -1721,25 +1645,15 @@ class Entry(TimeStampedModel):
 
     # Methods
     def calculate(self, *args, **kwargs):
-        self.mus_points = self.calculate_mus_points()
-        self.per_points = self.calculate_per_points()
-        self.sng_points = self.calculate_sng_points()
-        self.tot_points = self.calculate_tot_points()
-        self.mus_score = self.calculate_mus_score()
-        self.per_score = self.calculate_per_score()
-        self.sng_score = self.calculate_sng_score()
-        self.tot_score = self.calculate_tot_score()
-        self.rank = self.calculate_rank()
+        # Ranks depend on the whole session, so score it in one pass.
+        score_session(
+            self.session,
+            entries=self.session.entries.filter(pk=self.pk),
+        )
+        self.refresh_from_db(fields=SCORING_FIELDS + ['rank'])
 
     def calculate_pdf(self):
-        for appearance in self.appearances.all():
-            for song in appearance.songs.all():
-                song.calculate()
-                song.save()
-            appearance.calculate()
-            appearance.save()
         self.calculate()
-        self.save()
         return
 
     def print_csa(self):
@@ -1777,74 +1691,11 @@ class Entry(TimeStampedModel):
         entry.save()
         return "Complete"
 
-    def calculate_rank(self):
-        try:
-            primary = self.session.contests.first()
-            return self.contestants.get(contest=primary).calculate_rank()
-        except self.contestants.model.DoesNotExist:
-            return None
-
-    def calculate_mus_points(self):
-        return self.appearances.filter(
-            songs__scores__kind=10,
-            songs__scores__category=30,
-        ).aggregate(
-            tot=models.Sum('songs__scores__points')
-        )['tot']
-
-    def calculate_per_points(self):
-        return self.appearances.filter(
-            songs__scores__kind=10,
-            songs__scores__category=40,
-        ).aggregate(
-            tot=models.Sum('songs__scores__points')
-        )['tot']
-
-    def calculate_sng_points(self):
-        return self.appearances.filter(
-            songs__scores__kind=10,
-            songs__scores__category=50,
-        ).aggregate(
-            tot=models.Sum('songs__scores__points')
-        )['tot']
-
-    def calculate_tot_points(self):
-        return self.appearances.filter(
-            songs__scores__kind=10,
-        ).aggregate(
-            tot=models.Sum('songs__scores__points')
-        )['tot']
-
-    def calculate_mus_score(self):
-        return self.appearances.filter(
-            songs__scores__kind=10,
-            songs__scores__category=30,
-        ).aggregate(
-            tot=models.Avg('songs__scores__points')
-        )['tot']
-
-    def calculate_per_score(self):
-        return self.appearances.filter(
-            songs__scores__kind=10,
-            songs__scores__category=40,
-        ).aggregate(
-            tot=models.Avg('songs__scores__points')
-        )['tot']
-
-    def calculate_sng_score(self):
-        return self.appearances.filter(
-            songs__scores__kind=10,
-            songs__scores__category=50,
-        ).aggregate(
-            tot=models.Avg('songs__scores__points')
-        )['tot']
-
-    def calculate_tot_score(self):
-        return self.appearances.filter(
-            songs__scores__kind=10,
-        ).aggregate(
-            tot=models.Avg('songs__scores__points')
-        )['tot']
+    def get_tallies(self):
+        return child_tallies(
+            Tally.LEVEL.appearance,
+            self.appearances.values('id'),
+        )
 
     # Permissions
     @staticmethod
@@ -1860,31 +1711,25 @@ class Entry(TimeStampedModel):
     @allow_staff_or_superuser
     @authenticated_users
     def has_write_permission(request):
+        roles = get_permission_context(request)
         return any([
-            request.user.person.members.filter(
-                status__gt=0,
-                is_admin=True,
-            ),
-            request.user.person.officers.filter(
-                status__gt=0,
-                office__is_session_manager=True,
-            ),
+            roles.is_admin(),
+            roles.is_officer('is_session_manager'),
         ])
 
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_write_permission(self, request):
+        roles = get_permission_context(request)
         return any([
-            self.session.convention.assignments.filter(
-                person=request.user.person,
-                category__lt=10,
+            roles.is_assigned(
+                lambda: self.session.convention_id,
+                categories=[
+                    Assignment.CATEGORY.drcj,
+                ],
                 kind=10,
             ),
-            self.group.members.filter(
-                person=request.user.person,
-                status__gt=0,
-                is_admin=True,
-            ),
+            roles.is_admin(self.group_id),
         ])
 
 
@@ -2254,31 +2099,20 @@ class Group(TimeStampedModel):
     @allow_staff_or_superuser
     @authenticated_users
     def has_write_permission(request):
+        roles = get_permission_context(request)
         return any([
-            request.user.person.officers.filter(
-                office__is_group_manager=True,
-                status__gt=0,
-            ),
-            request.user.person.members.filter(
-                is_admin=True,
-                status__gt=0,
-            ),
+            roles.is_officer('is_group_manager'),
+            roles.is_admin(),
         ])
 
 
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_write_permission(self, request):
+        roles = get_permission_context(request)
         return any([
-            self.members.filter(
-                person=request.user.person,
-                is_admin=True,
-                status__gt=0,
-            ),
-            request.user.person.officers.filter(
-                office__is_group_manager=True,
-                status__gt=0,
-            ),
+            roles.is_admin(self.id),
+            roles.is_officer('is_group_manager'),
         ])
 
     # Transitions
@@ -2376,6 +2210,12 @@ class Member(TimeStampedModel):
     )
 
     # Internals
+    tracker = FieldTracker(
+        fields=[
+            'person_id',
+        ]
+    )
+
     class Meta:
         unique_together = (
             ('group', 'person',),
@@ -2412,22 +2252,17 @@ class Member(TimeStampedModel):
     @allow_staff_or_superuser
     @authenticated_users
     def has_write_permission(request):
+        roles = get_permission_context(request)
         return any([
-            request.user.person.members.filter(
-                is_admin=True,
-                status__gt=0,
-            ),
+            roles.is_admin(),
         ])
 
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_write_permission(self, request):
+        roles = get_permission_context(request)
         return any([
-            self.group.members.filter(
-                person=request.user.person,
-                is_admin=True,
-                status__gt=0,
-            ),
+            roles.is_admin(self.group_id),
         ])
 
     # Transitions
@@ -2627,6 +2462,12 @@ class Officer(TimeStampedModel):
     )
 
     # Internals
+    tracker = FieldTracker(
+        fields=[
+            'person_id',
+        ]
+    )
+
     class JSONAPIMeta:
         resource_name = "officer"
 
@@ -2877,22 +2718,18 @@ class Organization(TimeStampedModel):
     @allow_staff_or_superuser
     @authenticated_users
     def has_write_permission(request):
+        roles = get_permission_context(request)
         return any([
-            request.user.person.officers.filter(
-                office__is_organization_manager=True,
-                status__gt=0,
-            ),
+            roles.is_officer('is_organization_manager'),
         ])
 
 
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_write_permission(self, request):
+        roles = get_permission_context(request)
         return any([
-            request.user.person.officers.filter(
-                office__is_organization_manager=True,
-                status__gt=0,
-            ),
+            roles.is_officer('is_organization_manager'),
         ])
 
     # Transitions
@@ -3008,23 +2845,19 @@ class Panelist(TimeStampedModel):
     @allow_staff_or_superuser
     @authenticated_users
     def has_write_permission(request):
+        roles = get_permission_context(request)
         return any([
             True,
-            request.user.person.officers.filter(
-                office__is_judge_manager=True,
-                status__gt=0,
-            )
+            roles.is_officer('is_judge_manager')
         ])
 
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_write_permission(self, request):
+        roles = get_permission_context(request)
         return any([
             True,
-            request.user.person.officers.filter(
-                office__is_judge_manager=True,
-                status__gt=0,
-            )
+            roles.is_officer('is_judge_manager')
         ])
 
 
@@ -3113,31 +2946,26 @@ class Participant(TimeStampedModel):
     @allow_staff_or_superuser
     @authenticated_users
     def has_write_permission(request):
+        roles = get_permission_context(request)
         return any([
-            request.user.person.officers.filter(
-                office__is_convention_manager=True,
-                status__gt=0,
-            ),
-            request.user.person.members.filter(
-                is_admin=True,
-                status__gt=0,
-            ),
+            roles.is_officer('is_convention_manager'),
+            roles.is_admin(),
         ])
 
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_write_permission(self, request):
+        roles = get_permission_context(request)
         return any([
-            self.entry.session.convention.assignments.filter(
-                person=request.user.person,
-                category__lte=10,
+            roles.is_assigned(
+                lambda: self.entry.session.convention_id,
+                categories=[
+                    Assignment.CATEGORY.drcj,
+                    Assignment.CATEGORY.admin,
+                ],
                 kind=10,
             ),
-            self.entry.group.members.filter(
-                person=request.user.person,
-                is_admin=True,
-                status__gt=0,
-            ),
+            roles.is_admin(lambda: self.entry.group_id),
         ])
 
 
@@ -3353,67 +3181,45 @@ class Person(TimeStampedModel):
         default='',
     )
 
+    @cached_property
+    def roles(self):
+        return PermissionContext(self)
+
     @cached_property
     def is_convention_manager(self):
-        return bool(self.officers.filter(
-            office__is_convention_manager=True,
-            status__gt=0,
-        ))
+        return self.roles.is_officer('is_convention_manager')
 
     @cached_property
     def is_session_manager(self):
-        return bool(self.officers.filter(
-            office__is_session_manager=True,
-            status__gt=0,
-        ))
+        return self.roles.is_officer('is_session_manager')
 
     @cached_property
     def is_scoring_manager(self):
-        return bool(self.officers.filter(
-            office__is_scoring_manager=True,
-            status__gt=0,
-        ))
+        return self.roles.is_officer('is_scoring_manager')
 
     @cached_property
     def is_organization_manager(self):
-        return bool(self.officers.filter(
-            office__is_organization_manager=True,
-            status__gt=0,
-        ))
+        return self.roles.is_officer('is_organization_manager')
 
     @cached_property
     def is_group_manager(self):
-        return bool(self.members.filter(
-            status__gt=0,
-        ))
+        return bool(self.roles.groups)
 
     @cached_property
     def is_person_manager(self):
-        return bool(self.officers.filter(
-            office__is_person_manager=True,
-            status__gt=0,
-        ))
+        return self.roles.is_officer('is_person_manager')
 
     @cached_property
     def is_award_manager(self):
-        return bool(self.officers.filter(
-            office__is_award_manager=True,
-            status__gt=0,
-        ))
+        return self.roles.is_officer('is_award_manager')
 
     @cached_property
     def is_judge_manager(self):
-        return bool(self.officers.filter(
-            office__is_judge_manager=True,
-            status__gt=0,
-        ))
+        return self.roles.is_officer('is_judge_manager')
 
     @cached_property
     def is_chart_manager(self):
-        return bool(self.officers.filter(
-            office__is_chart_manager=True,
-            status__gt=0,
-        ))
+        return self.roles.is_officer('is_chart_manager')
 
 
     @cached_property
@@ -3589,39 +3395,22 @@ class Repertory(TimeStampedModel):
     @staticmethod
     @allow_staff_or_superuser
     def has_read_permission(request):
+        roles = get_permission_context(request)
         return any([
-            request.user.person.officers.filter(
-                office__is_convention_manager=True,
-                status__gt=0,
-            ),
-            request.user.person.officers.filter(
-                office__is_scoring_manager=True,
-                status__gt=0,
-            ),
-            request.user.person.members.filter(
-                is_admin=True,
-                status__gt=0,
-            ),
+            roles.is_officer('is_convention_manager'),
+            roles.is_officer('is_scoring_manager'),
+            roles.is_admin(),
         ])
 
 
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_read_permission(self, request):
+        roles = get_permission_context(request)
         return any([
-            self.group.members.filter(
-                person=request.user.person,
-                is_admin=True,
-                status__gt=0,
-            ),
-            request.user.person.officers.filter(
-                office__is_convention_manager=True,
-                status__gt=0,
-            ),
-            request.user.person.officers.filter(
-                office__is_scoring_manager=True,
-                status__gt=0,
-            ),
+            roles.is_admin(self.group_id),
+            roles.is_officer('is_convention_manager'),
+            roles.is_officer('is_scoring_manager'),
         ])
 
 
@@ -3629,38 +3418,21 @@ class Repertory(TimeStampedModel):
     @allow_staff_or_superuser
     @authenticated_users
     def has_write_permission(request):
+        roles = get_permission_context(request)
         return any([
-            request.user.person.officers.filter(
-                office__is_convention_manager=True,
-                status__gt=0,
-            ),
-            request.user.person.officers.filter(
-                office__is_scoring_manager=True,
-                status__gt=0,
-            ),
-            request.user.person.members.filter(
-                is_admin=True,
-                status__gt=0,
-            ),
+            roles.is_officer('is_convention_manager'),
+            roles.is_officer('is_scoring_manager'),
+            roles.is_admin(),
         ])
 
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_write_permission(self, request):
+        roles = get_permission_context(request)
         return any([
-            self.group.members.filter(
-                person=request.user.person,
-                is_admin=True,
-                status__gt=0,
-            ),
-            request.user.person.officers.filter(
-                office__is_convention_manager=True,
-                status__gt=0,
-            ),
-            request.user.person.officers.filter(
-                office__is_scoring_manager=True,
-                status__gt=0,
-            ),
+            roles.is_admin(self.group_id),
+            roles.is_officer('is_convention_manager'),
+            roles.is_officer('is_scoring_manager'),
         ])
 
     # Transitions
@@ -3777,34 +3549,28 @@ class Round(TimeStampedModel):
     @allow_staff_or_superuser
     @authenticated_users
     def has_write_permission(request):
+        roles = get_permission_context(request)
         return any([
-            request.user.person.officers.filter(
-                office__is_scoring_manager=True,
-                status__gt=0,
-            ),
+            roles.is_officer('is_scoring_manager'),
         ])
 
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_write_permission(self, request):
+        roles = get_permission_context(request)
         return any([
-            self.session.convention.assignments.filter(
-                person=request.user.person,
-                category__in=[10,20],
+            roles.is_assigned(
+                lambda: self.session.convention_id,
+                categories=[
+                    Assignment.CATEGORY.admin,
+                ],
                 kind=10,
             ),
         ])
 
     # Methods
-    def ranking(self, point_total):
-        if not point_total:
-            return None
-        appearances = self.appearances.all()
-        points = [appearance.calculate_tot_points() for appearance in appearances]
-        points = sorted(points, reverse=True)
-        ranking = Ranking(points, start=1)
-        rank = ranking.rank(point_total)
-        return rank
+    def verify_scores(self):
+        return verify_round(self)
 
     def print_ann(self):
         primary = self.session.contests.get(is_primary=True)
@@ -3865,22 +3631,18 @@ class Round(TimeStampedModel):
     @transition(field=status, source='*', target=STATUS.finished)
     def finish(self, *args, **kwargs):
         """Separate advancers and finishers"""
+        # Scores are complete now; flag the variant ones in one pass.
+        self.verify_scores()
         # TODO This probably should not be hard-coded.
         if self.kind == self.KIND.finals:
-            for appearance in self.appearances.all():
-                appearance.draw = -1
-                appearance.save()
+            self.appearances.update(
+                draw=-1,
+                modified=now(),
+            )
             entries = self.session.entries.exclude(
                 status=self.session.entries.model.STATUS.scratched,
             )
-            for entry in entries:
-                entry.calculate_pdf()
-                entry.save()
-            contests = self.session.contests.all()
-            for contest in contests:
-                for contestant in contest.contestants.all():
-                    contestant.calculate()
-                    contestant.save()
+            score_session(self.session, entries=entries)
             foo = self.print_ann()
             return
         if self.kind == self.KIND.quarters:
@@ -3889,42 +3651,8 @@ class Round(TimeStampedModel):
             spots = 10
         else:
             raise RuntimeError('No round kind.')
-        # Build list of advancing appearances to number of spots available
-        ordered_entries = self.session.entries.annotate(
-            tot=models.Sum('appearances__songs__scores__points')
-        ).order_by('-tot')
-        # Check for tie at cutoff
-        if spots:
-            cutoff = ordered_entries[spots-1:spots][0].tot
-            plus_one = ordered_entries[spots:spots+1][0].tot
-            while cutoff == plus_one:
-                spots += 1
-                cutoff = ordered_entries[spots-1:spots][0].tot
-                plus_one = ordered_entries[spots:spots+1][0].tot
-
-        # Get Advancers and finishers
-        advancers = list(ordered_entries[:spots])
-        cutdown = ordered_entries.filter(
-            appearances__round=self,
-        )
-        finishers = list(cutdown[spots:])
-
-        # Randomize Advancers
-        random.shuffle(list(advancers))
-
-        # Set Draw
-        i = 1
-        for entry in advancers:
-            appearance = self.appearances.get(entry=entry)
-            appearance.draw = i
-            appearance.save()
-            i += 1
-
-        # Set draw on finishers to negative one.
-        for entry in finishers:
-            appearance = self.appearances.get(entry=entry)
-            appearance.draw = -1
-            appearance.save()
+        # Order entries once, resolve ties and set the draw in bulk
+        advance_round(self, spots)
 
         # TODO Bypassing all this in favor of International-only
 
@@ -4150,6 +3878,15 @@ class Score(TimeStampedModel):
         blank=True,
     )
 
+    # Internals
+    tracker = FieldTracker(
+        fields=[
+            'points',
+            'kind',
+            'category',
+        ]
+    )
+
     class JSONAPIMeta:
         resource_name = "score"
 
@@ -4162,50 +3899,9 @@ class Score(TimeStampedModel):
 
     # Methods
     def verify(self):
-        variance = False
-        mus_avg = self.song.scores.filter(
-            kind=self.song.scores.model.KIND.official,
-            category=self.song.scores.model.CATEGORY.music,
-        ).aggregate(
-            avg=models.Avg('points')
-        )['avg']
-        if self.category == self.CATEGORY.music:
-            if abs(self.points - mus_avg) > 5:
-                log.info("Variance Music {0}".format(self))
-                variance = True
-        per_avg = self.song.scores.filter(
-            kind=self.song.scores.model.KIND.official,
-            category=self.song.scores.model.CATEGORY.performance,
-        ).aggregate(
-            avg=models.Avg('points')
-        )['avg']
-        if self.category == self.CATEGORY.performance:
-            if abs(self.points - per_avg) > 5:
-                log.info("Variance Performance {0}".format(self))
-                variance = True
-        sng_avg = self.song.scores.filter(
-            kind=self.song.scores.model.KIND.official,
-            category=self.song.scores.model.CATEGORY.singing,
-        ).aggregate(
-            avg=models.Avg('points')
-        )['avg']
-        if self.category == self.CATEGORY.singing:
-            if abs(self.points - sng_avg) > 5:
-                log.info("Variance Singing {0}".format(self))
-                variance = True
-        ordered_asc = self.song.scores.filter(
-            kind=self.song.scores.model.KIND.official,
-        ).order_by('points')
-        if ordered_asc[1].points - ordered_asc[0].points > 5 and ordered_asc[0].points == self.points:
-            log.info("Variance Low {0}".format(self))
-            variance = True
-        ordered_dsc = self.song.scores.filter(
-            kind=self.song.scores.model.KIND.official,
-        ).order_by('-points')
-        if ordered_dsc[0].points - ordered_dsc[1].points > 5 and ordered_dsc[0].points == self.points:
-            log.info("Variance High {0}".format(self))
-            variance = True
+        variance = self.id in find_variances(self.song.scores.all())
         if variance:
+            log.info("Variance {0}".format(self))
             self.original = self.points
             self.is_flagged = True
             self.save()
@@ -4216,16 +3912,11 @@ class Score(TimeStampedModel):
     @allow_staff_or_superuser
     @authenticated_users
     def has_read_permission(request):
+        roles = get_permission_context(request)
         return any([
             True,
-            request.user.person.officers.filter(
-                office__is_scoring_manager=True,
-                status__gt=0,
-            ),
-            request.user.person.officers.filter(
-                office__is_group_manager=True,
-                status__gt=0,
-            ),
+            roles.is_officer('is_scoring_manager'),
+            roles.is_officer('is_group_manager'),
         ])
 
 
@@ -4245,20 +3936,22 @@ class Score(TimeStampedModel):
     @allow_staff_or_superuser
     @authenticated_users
     def has_write_permission(request):
+        roles = get_permission_context(request)
         return any([
-            request.user.person.officers.filter(
-                office__is_scoring_manager=True,
-                status__gt=0,
-            ),
+            roles.is_officer('is_scoring_manager'),
         ])
 
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_write_permission(self, request):
+        roles = get_permission_context(request)
         return any([
-            self.song.appearance.round.session.convention.assignments.filter(
-                person=request.user.person,
-                category__lt=30,
+            roles.is_assigned(
+                lambda: self.song.appearance.round.session.convention_id,
+                categories=[
+                    Assignment.CATEGORY.drcj,
+                    Assignment.CATEGORY.admin,
+                ],
                 kind=10,
             ),
         ])
@@ -4453,20 +4146,22 @@ class Session(TimeStampedModel):
     @allow_staff_or_superuser
     @authenticated_users
     def has_write_permission(request):
+        roles = get_permission_context(request)
         return any([
-            request.user.person.officers.filter(
-                office__is_convention_manager=True,
-                status__gt=0,
-            ),
+            roles.is_officer('is_convention_manager'),
         ])
 
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_write_permission(self, request):
+        roles = get_permission_context(request)
         return any([
-            self.convention.assignments.filter(
-                person=request.user.person,
-                category__lt=30,
+            roles.is_assigned(
+                self.convention_id,
+                categories=[
+                    Assignment.CATEGORY.drcj,
+                    Assignment.CATEGORY.admin,
+                ],
                 kind=10,
             ),
         ])
@@ -4538,25 +4233,47 @@ class Session(TimeStampedModel):
             num=i,
             kind=max,
         )
+        Panelist = config.get_model('Panelist')
+        # Keys are assigned client-side, so the draw and panel are built
+        # in memory and inserted in bulk; bulk_create bypasses save(),
+        # so nomen is set here to match.
+        slots = []
+        appearances = []
         for entry in self.entries.filter(status=Entry.STATUS.approved):
-            slot = Slot.objects.create(
+            slot = Slot(
                 num=entry.draw,
                 round=round,
             )
-            round.appearances.create(
+            slot.nomen = " ".join(map(smart_text, [round, slot.num]))
+            slots.append(slot)
+            appearance = Appearance(
                 entry=entry,
+                round=round,
                 slot=slot,
                 num=entry.draw,
                 status=Appearance.STATUS.published,
             )
+            appearance.nomen = " ".join(map(smart_text, [round, entry]))
+            appearances.append(appearance)
+        panelists = []
         for assignment in self.convention.assignments.filter(
             status=Assignment.STATUS.active,
-        ):
-            round.panelists.create(
+        ).select_related('person'):
+            panelist = Panelist(
+                round=round,
                 kind=assignment.kind,
                 category=assignment.category,
                 person=assignment.person,
             )
+            panelist.nomen = " ".join(filter(None, [
+                "{0}".format(round),
+                "{0}".format(assignment.person),
+                panelist.get_kind_display(),
+            ]))
+            panelists.append(panelist)
+        Slot.objects.bulk_create(slots, batch_size=BATCH_SIZE)
+        Appearance.objects.bulk_create(appearances, batch_size=BATCH_SIZE)
+        Panelist.objects.bulk_create(panelists, batch_size=BATCH_SIZE)
         round.verify()
         round.save()
         return
@@ -4565,16 +4282,7 @@ class Session(TimeStampedModel):
     @fsm_log_by
     @transition(field=status, source=STATUS.started, target=STATUS.finished)
     def finish(self, *args, **kwargs):
-        session = self
-        for entry in session.entries.all():
-            for appearance in entry.appearances.all():
-                for song in appearance.songs.all():
-                    song.calculate()
-                    song.save()
-                appearance.calculate()
-                appearance.save()
-            entry.calculate()
-            entry.save()
+        score_session(self)
         return
 
     @fsm_log_by
@@ -4686,26 +4394,28 @@ class Slot(TimeStampedModel):
     @allow_staff_or_superuser
     @authenticated_users
     def has_write_permission(request):
+        roles = get_permission_context(request)
         return any([
-            request.user.person.officers.filter(
-                office__is_convention_manager=True,
-                status__gt=0,
-            ),
+            roles.is_officer('is_convention_manager'),
         ])
 
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_write_permission(self, request):
+        roles = get_permission_context(request)
         return any([
-            self.round.session.convention.assignments.filter(
-                person=request.user.person,
-                category__lt=30,
+            roles.is_assigned(
+                lambda: self.round.session.convention_id,
+                categories=[
+                    Assignment.CATEGORY.drcj,
+                    Assignment.CATEGORY.admin,
+                ],
                 kind=10,
             ),
         ])
 
 
-class Song(TimeStampedModel):
+class Song(ScoringMixin, TimeStampedModel):
     id = models.UUIDField(
         primary_key=True,
         default=uuid.uuid4,
@@ -4784,6 +4494,26 @@ class Song(TimeStampedModel):
         blank=True,
     )
 
+    mus_count = models.IntegerField(
+        null=True,
+        blank=True,
+    )
+
+    per_count = models.IntegerField(
+        null=True,
+        blank=True,
+    )
+
+    sng_count = models.IntegerField(
+        null=True,
+        blank=True,
+    )
+
+    tot_count = models.IntegerField(
+        null=True,
+        blank=True,
+    )
+
     # FKs
     appearance = models.ForeignKey(
         'Appearance',
@@ -4824,76 +4554,12 @@ class Song(TimeStampedModel):
 
     # Methods
     def calculate(self, *args, **kwargs):
-        self.mus_points = self.calculate_mus_points()
-        self.per_points = self.calculate_per_points()
-        self.sng_points = self.calculate_sng_points()
-        self.tot_points = self.calculate_tot_points()
-        self.mus_score = self.calculate_mus_score()
-        self.per_score = self.calculate_per_score()
-        self.sng_score = self.calculate_sng_score()
-        self.tot_score = self.calculate_tot_score()
-
-    def calculate_mus_points(self):
-        return self.scores.filter(
-            kind=10,
-            category=30,
-        ).aggregate(
-            tot=models.Sum('points')
-        )['tot']
-
-    def calculate_per_points(self):
-        return self.scores.filter(
-            kind=10,
-            category=40,
-        ).aggregate(
-            tot=models.Sum('points')
-        )['tot']
-
-    def calculate_sng_points(self):
-        return self.scores.filter(
-            kind=10,
-            category=50,
-        ).aggregate(
-            tot=models.Sum('points')
-        )['tot']
-
-    def calculate_tot_points(self):
-        return self.scores.filter(
-            kind=10,
-        ).aggregate(
-            tot=models.Sum('points')
-        )['tot']
-
-    def calculate_mus_score(self):
-        return self.scores.filter(
-            kind=10,
-            category=30,
-        ).aggregate(
-            tot=models.Avg('points')
-        )['tot']
-
-    def calculate_per_score(self):
-        return self.scores.filter(
-            kind=10,
-            category=40,
-        ).aggregate(
-            tot=models.Avg('points')
-        )['tot']
-
-    def calculate_sng_score(self):
-        return self.scores.filter(
-            kind=10,
-            category=50,
-        ).aggregate(
-            tot=models.Avg('points')
-        )['tot']
-
-    def calculate_tot_score(self):
-        return self.scores.filter(
-            kind=10,
-        ).aggregate(
-            tot=models.Avg('points')
-        )['tot']
+        self.calculate_scores()
+
+    def get_tallies(self):
+        return score_tallies(
+            self.scores.all(),
+        )
 
     # Permissions
     @staticmethod
@@ -4926,10 +4592,14 @@ class Song(TimeStampedModel):
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_write_permission(self, request):
+        roles = get_permission_context(request)
         return any([
-            self.appearance.round.session.convention.assignments.filter(
-                person=request.user.person,
-                category__lt=30,
+            roles.is_assigned(
+                lambda: self.appearance.round.session.convention_id,
+                categories=[
+                    Assignment.CATEGORY.drcj,
+                    Assignment.CATEGORY.admin,
+                ],
                 kind=10,
             ),
         ])
@@ -4941,6 +4611,126 @@ class Song(TimeStampedModel):
         return
 
 
+class SyncState(TimeStampedModel):
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+    )
+
+    source = models.CharField(
+        help_text="""
+            The BHS view being synced.""",
+        max_length=255,
+        unique=True,
+    )
+
+    updated_ts = models.DateTimeField(
+        help_text="""
+            The `updated_ts` of the last synced row.""",
+        null=True,
+        blank=True,
+    )
+
+    last_id = models.CharField(
+        help_text="""
+            The id of the last synced row, breaking `updated_ts` ties.""",
+        max_length=255,
+        blank=True,
+        default='',
+    )
+
+    # Internals
+    class Meta:
+        verbose_name_plural = 'sync states'
+
+    def __str__(self):
+        return " ".join(
+            map(
+                lambda x: smart_text(x), [
+                    self.source,
+                    self.updated_ts,
+                    self.last_id,
+                ]
+            )
+        )
+
+
+class Tally(TimeStampedModel):
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+    )
+
+    LEVEL = Choices(
+        (10, 'song', 'Song'),
+        (20, 'appearance', 'Appearance'),
+        (30, 'entry', 'Entry'),
+        (40, 'contestant', 'Contestant'),
+    )
+
+    level = models.IntegerField(
+        choices=LEVEL,
+    )
+
+    object_id = models.UUIDField(
+        help_text="""
+            The Song, Appearance, Entry or Contestant (per level).""",
+    )
+
+    CATEGORY = Choices(
+        (30, 'music', 'Music'),
+        (40, 'performance', 'Performance'),
+        (50, 'singing', 'Singing'),
+    )
+
+    category = models.IntegerField(
+        choices=CATEGORY,
+    )
+
+    KIND = Choices(
+        (10, 'official', 'Official'),
+        (20, 'practice', 'Practice'),
+        (30, 'composite', 'Composite'),
+    )
+
+    kind = models.IntegerField(
+        choices=KIND,
+    )
+
+    points = models.IntegerField(
+        help_text="""
+            The sum of scored points.""",
+        default=0,
+    )
+
+    count = models.IntegerField(
+        help_text="""
+            The number of scored points.""",
+        default=0,
+    )
+
+    # Internals
+    class Meta:
+        verbose_name_plural = 'tallies'
+        unique_together = (
+            ('level', 'object_id', 'category', 'kind',),
+        )
+
+    def __str__(self):
+        return " ".join(
+            map(
+                lambda x: smart_text(x), [
+                    self.get_level_display(),
+                    self.object_id,
+                    self.get_category_display(),
+                    self.get_kind_display(),
+                ]
+            )
+        )
+
+
 class Venue(TimeStampedModel):
     id = models.UUIDField(
         primary_key=True,
@@ -5028,21 +4818,17 @@ class Venue(TimeStampedModel):
     @allow_staff_or_superuser
     @authenticated_users
     def has_write_permission(request):
+        roles = get_permission_context(request)
         return any([
-            request.user.person.officers.filter(
-                office__is_convention_manager=True,
-                status__gt=0,
-            ),
+            roles.is_officer('is_convention_manager'),
         ])
 
     @allow_staff_or_superuser
     @authenticated_users
     def has_object_write_permission(self, request):
+        roles = get_permission_context(request)
         return any([
-            request.user.person.officers.filter(
-                office__is_convention_manager=True,
-                status__gt=0,
-            ),
+            roles.is_officer('is_convention_manager'),
         ])
 
 
@@ -0,0 +1,105 @@
+# Standard Libary
+import json
+import uuid
+from base64 import (
+    urlsafe_b64decode,
+    urlsafe_b64encode,
+)
+from collections import OrderedDict
+
+# Third-Party
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.utils.urls import (
+    remove_query_param,
+    replace_query_param,
+)
+from rest_framework_json_api.pagination import PageNumberPagination
+
+# Django
+from django.db.models import Q
+
+
+class KeysetPagination(PageNumberPagination):
+    """Page-number pagination with an opt-in keyset mode.
+
+    Sending `cursor` (empty for the first page) walks the queryset in
+    (nomen, id) order instead.  Each page seeks past the last row of the
+    previous one, so deep pages cost the same as the first, and no count
+    is run.  Only forward links are given; clients follow `next` until it
+    is null.
+    """
+    cursor_query_param = 'cursor'
+    ordering = ('nomen', 'id')
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params:
+            self.keyset = False
+            return super().paginate_queryset(queryset, request, view=view)
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+        self.keyset = True
+        self.request = request
+        cursor = self.decode_cursor(request)
+        queryset = queryset.order_by(*self.ordering)
+        if cursor is not None:
+            nomen, pk = cursor
+            queryset = queryset.filter(
+                Q(nomen__gt=nomen) | Q(nomen=nomen, id__gt=pk)
+            )
+        # One extra row tells whether there is a next page.
+        results = list(queryset[:page_size + 1])
+        self.has_next = len(results) > page_size
+        self.page = results[:page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+        next = None
+        if self.has_next:
+            next = self.encode_cursor(self.page[-1])
+        return Response({
+            'results': data,
+            'meta': {
+                'pagination': OrderedDict([
+                    ('cursor', self.request.query_params[self.cursor_query_param]),
+                    ('next', next),
+                ])
+            },
+            'links': OrderedDict([
+                ('first', self.build_cursor_link('')),
+                ('next', self.build_cursor_link(next)),
+            ]),
+        })
+
+    def build_cursor_link(self, cursor):
+        if cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params[self.cursor_query_param]
+        if not encoded:
+            return None
+        try:
+            padded = encoded + '=' * (-len(encoded) % 4)
+            nomen, pk = json.loads(
+                urlsafe_b64decode(padded.encode('ascii')).decode('utf-8')
+            )
+            pk = uuid.UUID(pk)
+        except (AttributeError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        return nomen, pk
+
+    def encode_cursor(self, item):
+        if isinstance(item, dict):
+            position = [item['nomen'], str(item['id'])]
+        else:
+            position = [item.nomen, str(item.pk)]
+        encoded = urlsafe_b64encode(json.dumps(position).encode('utf-8'))
+        return encoded.decode('ascii').rstrip('=')
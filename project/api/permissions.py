@@ -0,0 +1,147 @@
+# Django
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.functional import cached_property
+
+ROLES_CACHE_KEY = 'roles:{0}'
+
+OFFICE_FLAGS = [
+    'is_convention_manager',
+    'is_session_manager',
+    'is_scoring_manager',
+    'is_organization_manager',
+    'is_group_manager',
+    'is_person_manager',
+    'is_award_manager',
+    'is_judge_manager',
+    'is_chart_manager',
+]
+
+
+def get_roles(person):
+    """Return the person's officer and membership snapshot.
+
+    The snapshot is kept in the cache across requests, keyed by person, and
+    dropped by the Officer, Office and Member signals when a role changes.
+    """
+    key = ROLES_CACHE_KEY.format(person.pk)
+    roles = cache.get(key)
+    if roles is None:
+        roles = {
+            'officers': list(person.officers.filter(
+                status__gt=0,
+            ).values(
+                'organization_id',
+                *['office__{0}'.format(flag) for flag in OFFICE_FLAGS]
+            )),
+            'members': list(person.members.filter(
+                status__gt=0,
+            ).values(
+                'group_id',
+                'is_admin',
+            )),
+        }
+        cache.set(key, roles, settings.ROLES_CACHE_TIMEOUT)
+    return roles
+
+
+def invalidate_roles(person_ids):
+    """Drop the cached role snapshots of ``person_ids``."""
+    cache.delete_many([ROLES_CACHE_KEY.format(pk) for pk in person_ids if pk])
+
+
+class PermissionContext(object):
+    """A person's roles, loaded once per request.
+
+    Officers and memberships come from the cross-request role snapshot;
+    convention assignments cost one query the first time they are
+    consulted.  Every later check is answered in memory.  Object checks
+    may pass a callable for the related id, so relations are only walked
+    for persons who hold a matching role at all.
+    """
+
+    def __init__(self, person):
+        self.person = person
+
+    @cached_property
+    def roles(self):
+        if self.person is None:
+            return {'officers': [], 'members': []}
+        return get_roles(self.person)
+
+    @property
+    def officers(self):
+        return self.roles['officers']
+
+    @cached_property
+    def groups(self):
+        return set(member['group_id'] for member in self.roles['members'])
+
+    @cached_property
+    def admin_groups(self):
+        return set(
+            member['group_id']
+            for member in self.roles['members']
+            if member['is_admin']
+        )
+
+    @cached_property
+    def assignments(self):
+        if self.person is None:
+            return []
+        return list(self.person.assignments.values(
+            'convention_id',
+            'category',
+            'kind',
+            'status',
+        ))
+
+    @property
+    def version(self):
+        """A string that changes whenever the person's roles do."""
+        return repr([
+            sorted(repr(sorted(row.items())) for row in rows)
+            for rows in [self.officers, self.roles['members'], self.assignments]
+        ])
+
+    def is_officer(self, flag=None, organization_id=None):
+        """Active officer, optionally of an office flag and organization."""
+        return any(
+            (flag is None or officer['office__{0}'.format(flag)]) and
+            (organization_id is None or officer['organization_id'] == organization_id)
+            for officer in self.officers
+        )
+
+    def is_admin(self, group_id=None):
+        """Active admin member of any group, or of ``group_id``."""
+        if not self.admin_groups:
+            return False
+        if group_id is None:
+            return True
+        return resolve(group_id) in self.admin_groups
+
+    def is_assigned(self, convention_id, categories, kind=None, active=False):
+        """Assigned to the convention in one of ``categories``."""
+        conventions = set(
+            assignment['convention_id']
+            for assignment in self.assignments
+            if assignment['category'] in categories and
+            (kind is None or assignment['kind'] == kind) and
+            (not active or assignment['status'] > 0)
+        )
+        if not conventions:
+            return False
+        return resolve(convention_id) in conventions
+
+
+def resolve(value):
+    return value() if callable(value) else value
+
+
+def get_permission_context(request):
+    """Return the request's PermissionContext, building it on first use."""
+    context = getattr(request, '_permission_context', None)
+    if context is None:
+        context = PermissionContext(getattr(request.user, 'person', None))
+        request._permission_context = context
+    return context
@@ -0,0 +1,30 @@
+# Standard Libary
+import multiprocessing
+
+# Django
+from django.db import connections
+
+
+def close_connections():
+    """Drop inherited connections so each worker opens its own."""
+    connections.close_all()
+
+
+def imap_pool(function, tasks, workers, chunksize=1):
+    """Yield `function(task)` for every task, as each one finishes.
+
+    With a single worker the tasks run in this process.  Otherwise they
+    run in a process pool; children must not share the parent's database
+    sockets, so connections are dropped before forking and again in each
+    worker.
+    """
+    if workers == 1:
+        yield from map(function, tasks)
+        return
+    close_connections()
+    pool = multiprocessing.Pool(workers, initializer=close_connections)
+    try:
+        yield from pool.imap_unordered(function, tasks, chunksize=chunksize)
+    finally:
+        pool.close()
+        pool.join()
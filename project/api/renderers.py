@@ -1,8 +1,45 @@
+# Standard Libary
+from collections import OrderedDict
+
 # Third-Party
 from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework_json_api import renderers
+from rest_framework_json_api import utils
+
+# Local
+from .fields import RelatedLinksManyField
 
 
 class NoHTMLFormBrowsableAPIRenderer(BrowsableAPIRenderer):
 
     def get_rendered_html_form(self, *args, **kwargs):
         return ""
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    """Render link-only relationships without a `data` member."""
+
+    @classmethod
+    def extract_relationships(cls, fields, resource, resource_instance):
+        # Link-only fields are skipped by the serializer unless included, and
+        # the base renderer cannot count linkage it was never given.
+        linked = OrderedDict()
+        rest = OrderedDict()
+        for name, field in fields.items():
+            if isinstance(field, RelatedLinksManyField) and name not in resource:
+                linked[name] = field
+            else:
+                rest[name] = field
+        data = super(JSONRenderer, cls).extract_relationships(
+            rest,
+            resource,
+            resource_instance,
+        )
+        if resource_instance is None or not linked:
+            return data
+        links = OrderedDict(
+            (name, {'links': field.child_relation.get_links(resource_instance)})
+            for name, field in linked.items()
+        )
+        data.update(utils.format_keys(links))
+        return data
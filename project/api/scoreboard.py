@@ -0,0 +1,149 @@
+# Standard Libary
+import json
+
+# Third-Party
+from rest_framework.utils.encoders import JSONEncoder
+
+# Django
+from django.apps import apps as api_apps
+from django.conf import settings
+from django.core.cache import cache
+
+config = api_apps.get_app_config('api')
+
+SCOREBOARD_CACHE_KEY = 'scoreboard:{0}:{1}:{2}'
+
+TOTALS = [
+    'rank',
+    'mus_points',
+    'per_points',
+    'sng_points',
+    'tot_points',
+    'mus_score',
+    'per_score',
+    'sng_score',
+    'tot_score',
+]
+
+
+def get_scoreboard_key(kind, pk, stamp):
+    return SCOREBOARD_CACHE_KEY.format(kind, pk, stamp.isoformat())
+
+
+def get_round_scoreboard(round):
+    """Return the round's results as a JSON document, cached while announced.
+
+    The key carries the round's `modified`, so any later save misses; the
+    transition signal also drops the entry outright.
+    """
+    key = get_scoreboard_key('round', round.pk, round.modified)
+    content = cache.get(key)
+    if content is None:
+        content = render_round(round)
+        cache.set(key, content, settings.SCOREBOARD_CACHE_TIMEOUT)
+    return content
+
+
+def get_contest_scoreboard(contest, session):
+    """Return the contest's results as a JSON document, cached while announced.
+
+    Contest results are published with their session, so the key carries
+    the session's `modified`.
+    """
+    key = get_scoreboard_key('contest', contest.pk, session.modified)
+    content = cache.get(key)
+    if content is None:
+        content = render_contest(contest, session)
+        cache.set(key, content, settings.SCOREBOARD_CACHE_TIMEOUT)
+    return content
+
+
+def invalidate_round_scoreboard(round):
+    cache.delete(get_scoreboard_key('round', round.pk, round.modified))
+
+
+def invalidate_session_scoreboards(session):
+    cache.delete_many([
+        get_scoreboard_key('contest', pk, session.modified)
+        for pk in session.contests.values_list('id', flat=True)
+    ])
+
+
+def invalidate_song_scoreboards(song_id):
+    """Drop the cached scoreboards a score of the song appears on."""
+    Round = config.get_model('Round')
+    round = Round.objects.filter(
+        appearances__songs__id=song_id,
+    ).select_related('session').first()
+    if round is None:
+        return
+    invalidate_round_scoreboard(round)
+    invalidate_session_scoreboards(round.session)
+
+
+def render_round(round):
+    Appearance = config.get_model('Appearance')
+    Song = config.get_model('Song')
+    songs = {}
+    for song in Song.objects.filter(
+        appearance__round=round,
+    ).order_by(
+        'num',
+    ).values(
+        'id',
+        'num',
+        'appearance_id',
+        'chart__title',
+        *TOTALS
+    ):
+        songs.setdefault(song.pop('appearance_id'), []).append(song)
+    appearances = []
+    for appearance in Appearance.objects.filter(
+        round=round,
+    ).order_by(
+        'num',
+    ).values(
+        'id',
+        'num',
+        'draw',
+        'entry_id',
+        'entry__group__name',
+        *TOTALS
+    ):
+        appearance['songs'] = songs.get(appearance['id'], [])
+        appearances.append(appearance)
+    return json.dumps({
+        'round': {
+            'id': round.id,
+            'nomen': round.nomen,
+            'num': round.num,
+            'kind': round.get_kind_display(),
+            'status': round.get_status_display(),
+        },
+        'appearances': appearances,
+    }, cls=JSONEncoder)
+
+
+def render_contest(contest, session):
+    Contestant = config.get_model('Contestant')
+    contestants = list(Contestant.objects.filter(
+        contest=contest,
+    ).order_by(
+        'rank',
+        'nomen',
+    ).values(
+        'id',
+        'entry_id',
+        'entry__group__name',
+        *TOTALS
+    ))
+    return json.dumps({
+        'contest': {
+            'id': contest.id,
+            'nomen': contest.nomen,
+            'award': contest.award.name,
+            'session': session.id,
+            'status': session.get_status_display(),
+        },
+        'contestants': contestants,
+    }, cls=JSONEncoder)
@@ -0,0 +1,695 @@
+# Standard Libary
+import logging
+import random
+from collections import defaultdict
+
+# Third-Party
+import numpy as np
+
+# Django
+from django.apps import apps as api_apps
+from django.db import transaction
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast
+from django.utils.timezone import now
+
+config = api_apps.get_app_config('api')
+
+log = logging.getLogger(__name__)
+
+# Denormalized column prefix for each scoring category.
+CATEGORIES = [
+    ('mus', 30),
+    ('per', 40),
+    ('sng', 50),
+]
+
+OFFICIAL = 10
+
+SCORING_FIELDS = [
+    'mus_points',
+    'per_points',
+    'sng_points',
+    'tot_points',
+    'mus_score',
+    'per_score',
+    'sng_score',
+    'tot_score',
+    'mus_count',
+    'per_count',
+    'sng_count',
+    'tot_count',
+]
+
+COUNT_FIELDS = [
+    'mus_count',
+    'per_count',
+    'sng_count',
+    'tot_count',
+]
+
+BATCH_SIZE = 500
+
+
+def new_tally():
+    """A {(kind, category): [points, count]} accumulator."""
+    return defaultdict(lambda: [0, 0])
+
+
+def merge_tally(target, source):
+    for key, (points, count) in source.items():
+        target[key][0] += points
+        target[key][1] += count
+
+
+def official(tally):
+    """Reduce a (kind, category) tally to official points by category."""
+    result = {}
+    for (kind, category), value in tally.items():
+        if kind == OFFICIAL:
+            result[category] = value
+    return result
+
+
+def tally_values(tally):
+    """Convert a {category: [points, count]} tally into scoring columns.
+
+    Matches the Sum/Avg semantics of the original per-object aggregates:
+    a category with no scored points is None rather than zero.
+    """
+    values = {}
+    tot_points = 0
+    tot_count = 0
+    for prefix, category in CATEGORIES:
+        points, count = tally.get(category, (0, 0))
+        values['{0}_points'.format(prefix)] = points if count else None
+        values['{0}_score'.format(prefix)] = points / count if count else None
+        values['{0}_count'.format(prefix)] = count
+    for points, count in tally.values():
+        tot_points += points
+        tot_count += count
+    values['tot_points'] = tot_points if tot_count else None
+    values['tot_score'] = tot_points / tot_count if tot_count else None
+    values['tot_count'] = tot_count
+    return values
+
+
+def column_tally(obj):
+    """Rebuild a {category: [points, count]} tally from stored columns."""
+    tally = defaultdict(lambda: [0, 0])
+    for prefix, category in CATEGORIES:
+        tally[category][0] = getattr(obj, '{0}_points'.format(prefix)) or 0
+        tally[category][1] = getattr(obj, '{0}_count'.format(prefix))
+    return tally
+
+
+def competition_ranks(point_totals):
+    """Map each point total to its competition rank, highest first.
+
+    Ties share a rank and the following rank is skipped (1, 2, 2, 4),
+    the semantics of the `ranking` package it replaces.  Empty totals are
+    unranked.  Sorting dominates, so ranking n totals is O(n log n).
+    """
+    ranks = {}
+    points = sorted(
+        [p for p in point_totals if p],
+        reverse=True,
+    )
+    for i, value in enumerate(points, start=1):
+        if value not in ranks:
+            ranks[value] = i
+    return ranks
+
+
+def score_tallies(scores):
+    """Official points and counts by category for a Score queryset."""
+    return scores.filter(
+        kind=OFFICIAL,
+    ).values(
+        'category',
+    ).annotate(
+        points_sum=Sum('points'),
+        points_count=Count('points'),
+    ).order_by()
+
+
+def child_tallies(level, object_ids):
+    """Official points and counts by category from stored child tallies."""
+    Tally = config.get_model('Tally')
+    return Tally.objects.filter(
+        level=level,
+        object_id__in=object_ids,
+        kind=OFFICIAL,
+    ).values(
+        'category',
+    ).annotate(
+        points_sum=Sum('points'),
+        points_count=Sum('count'),
+    ).order_by()
+
+
+class ScoringMixin(object):
+    """Denormalized scoring totals for models that roll up official scores.
+
+    Models using it must define `get_tallies()`, returning official points
+    and counts grouped by category (see `score_tallies` and
+    `child_tallies`); all scoring columns are then computed from that
+    single query.  It is not declared abstract here, since ABCMeta cannot
+    be mixed with Django's model metaclass.
+    """
+
+    def aggregate_scores(self):
+        tally = defaultdict(lambda: [0, 0])
+        for row in self.get_tallies():
+            tally[row['category']][0] += row['points_sum'] or 0
+            tally[row['category']][1] += row['points_count'] or 0
+        return tally_values(tally)
+
+    def calculate_scores(self):
+        for name, value in self.aggregate_scores().items():
+            setattr(self, name, value)
+
+    def calculate_mus_points(self):
+        return self.aggregate_scores()['mus_points']
+
+    def calculate_per_points(self):
+        return self.aggregate_scores()['per_points']
+
+    def calculate_sng_points(self):
+        return self.aggregate_scores()['sng_points']
+
+    def calculate_tot_points(self):
+        return self.aggregate_scores()['tot_points']
+
+    def calculate_mus_score(self):
+        return self.aggregate_scores()['mus_score']
+
+    def calculate_per_score(self):
+        return self.aggregate_scores()['per_score']
+
+    def calculate_sng_score(self):
+        return self.aggregate_scores()['sng_score']
+
+    def calculate_tot_score(self):
+        return self.aggregate_scores()['tot_score']
+
+
+def bulk_update(model, rows, fields, batch_size=BATCH_SIZE):
+    """Write `fields` for each {pk: {field: value}} row in batched UPDATEs.
+
+    Each batch is a single `UPDATE ... SET field = CASE pk ...` statement,
+    so instance `save()` (and `nomen` rebuilding) is bypassed.
+    """
+    pks = list(rows)
+    stamp = now()
+    with transaction.atomic():
+        for i in range(0, len(pks), batch_size):
+            batch = pks[i:i + batch_size]
+            updates = {
+                'modified': stamp,
+            }
+            for name in fields:
+                field = model._meta.get_field(name)
+                whens = [
+                    When(pk=pk, then=Value(rows[pk][name], output_field=field))
+                    for pk in batch
+                ]
+                updates[name] = Cast(
+                    Case(*whens, output_field=field),
+                    output_field=field,
+                )
+            model.objects.filter(pk__in=batch).update(**updates)
+    return len(pks)
+
+
+def write_tallies(level, tallies):
+    """Replace the stored tallies of each object in {pk: tally}."""
+    Tally = config.get_model('Tally')
+    pks = list(tallies)
+    with transaction.atomic():
+        for i in range(0, len(pks), BATCH_SIZE):
+            Tally.objects.filter(
+                level=level,
+                object_id__in=pks[i:i + BATCH_SIZE],
+            ).delete()
+        Tally.objects.bulk_create(
+            [
+                Tally(
+                    level=level,
+                    object_id=pk,
+                    kind=kind,
+                    category=category,
+                    points=points,
+                    count=count,
+                )
+                for pk in pks
+                for (kind, category), (points, count) in tallies[pk].items()
+            ],
+            batch_size=BATCH_SIZE,
+        )
+    return len(pks)
+
+
+def shift_tallies(level, object_ids, delta):
+    """Add a (kind, category) delta to the stored tallies of each object."""
+    Tally = config.get_model('Tally')
+    for object_id in object_ids:
+        for (kind, category), (points, count) in delta.items():
+            if not (points or count):
+                continue
+            updated = Tally.objects.filter(
+                level=level,
+                object_id=object_id,
+                kind=kind,
+                category=category,
+            ).update(
+                points=F('points') + points,
+                count=F('count') + count,
+                modified=now(),
+            )
+            if not updated:
+                Tally.objects.create(
+                    level=level,
+                    object_id=object_id,
+                    kind=kind,
+                    category=category,
+                    points=points,
+                    count=count,
+                )
+
+
+def score_session(session, entries=None):
+    """Compute every Song, Appearance, Entry and Contestant total at once.
+
+    All scores for the session are read in a single grouped query
+    (song x kind x category) and rolled up in memory, replacing the
+    per-object `calculate()` walk.  The per-level tallies are stored and
+    the official ones written to the denormalized columns.  If `entries`
+    is given, only those entries (and their appearances and songs) have
+    their totals written back; rankings are always computed against, and
+    written for, the full session.
+    """
+    Score = config.get_model('Score')
+    Song = config.get_model('Song')
+    Appearance = config.get_model('Appearance')
+    Entry = config.get_model('Entry')
+    Contestant = config.get_model('Contestant')
+    Tally = config.get_model('Tally')
+
+    # Points and counts per song per kind and category.
+    song_tallies = defaultdict(new_tally)
+    rows = Score.objects.filter(
+        song__appearance__round__session=session,
+    ).values(
+        'song',
+        'kind',
+        'category',
+    ).annotate(
+        points_sum=Sum('points'),
+        points_count=Count('points'),
+    ).order_by()
+    for row in rows:
+        tally = song_tallies[row['song']][(row['kind'], row['category'])]
+        tally[0] += row['points_sum'] or 0
+        tally[1] += row['points_count']
+
+    songs = Song.objects.filter(
+        appearance__round__session=session,
+    ).values_list('id', 'appearance_id')
+    appearances = Appearance.objects.filter(
+        round__session=session,
+    ).values_list('id', 'round_id', 'round__num', 'entry_id')
+    contestants = Contestant.objects.filter(
+        contest__session=session,
+    ).values_list('id', 'entry_id', 'contest_id', 'contest__award__rounds')
+    entry_ids = list(
+        Entry.objects.filter(
+            session=session,
+        ).values_list('id', flat=True)
+    )
+
+    # Roll songs up into appearances.
+    appearance_tallies = defaultdict(new_tally)
+    song_values = {}
+    for song_id, appearance_id in songs:
+        tally = song_tallies[song_id]
+        merge_tally(appearance_tallies[appearance_id], tally)
+        song_values[song_id] = tally_values(official(tally))
+        song_values[song_id]['appearance_id'] = appearance_id
+
+    # Roll appearances up into entries.
+    entry_tallies = defaultdict(new_tally)
+    entry_appearances = defaultdict(list)
+    appearance_values = {}
+    for appearance_id, round_id, round_num, entry_id in appearances:
+        tally = appearance_tallies[appearance_id]
+        merge_tally(entry_tallies[entry_id], tally)
+        entry_appearances[entry_id].append((round_num, tally))
+        appearance_values[appearance_id] = tally_values(official(tally))
+        appearance_values[appearance_id]['round_id'] = round_id
+        appearance_values[appearance_id]['entry_id'] = entry_id
+
+    # Contestants only count rounds up to their award's number of rounds.
+    contestant_tallies = defaultdict(new_tally)
+    contestant_values = {}
+    for contestant_id, entry_id, contest_id, rounds in contestants:
+        tally = contestant_tallies[contestant_id]
+        for round_num, appearance_tally in entry_appearances.get(entry_id, []):
+            if round_num <= rounds:
+                merge_tally(tally, appearance_tally)
+        contestant_values[contestant_id] = tally_values(official(tally))
+        contestant_values[contestant_id]['contest_id'] = contest_id
+        contestant_values[contestant_id]['entry_id'] = entry_id
+
+    # Rankings within each round and contest.
+    round_points = defaultdict(list)
+    for values in appearance_values.values():
+        round_points[values['round_id']].append(values['tot_points'])
+    round_ranks = dict(
+        (key, competition_ranks(points)) for key, points in round_points.items()
+    )
+    for values in appearance_values.values():
+        values['rank'] = round_ranks[values['round_id']].get(values['tot_points'])
+
+    contest_points = defaultdict(list)
+    for values in contestant_values.values():
+        contest_points[values['contest_id']].append(values['tot_points'])
+    contest_ranks = dict(
+        (key, competition_ranks(points)) for key, points in contest_points.items()
+    )
+    for values in contestant_values.values():
+        values['rank'] = contest_ranks[values['contest_id']].get(values['tot_points'])
+
+    # An entry takes its rank from the session's primary contest.
+    primary = session.contests.first()
+    primary_ranks = {}
+    for values in contestant_values.values():
+        if primary and values['contest_id'] == primary.id:
+            primary_ranks[values['entry_id']] = values['rank']
+    entry_values = {}
+    for entry_id in entry_ids:
+        entry_values[entry_id] = tally_values(official(entry_tallies[entry_id]))
+        entry_values[entry_id]['rank'] = primary_ranks.get(entry_id)
+
+    appearance_ranks = {}
+    entry_ranks = {}
+    if entries is not None:
+        keep = set(entries.values_list('id', flat=True))
+        # Ranks move with any total, so every other entry's are rewritten.
+        appearance_ranks = dict(
+            (k, {'rank': v['rank']}) for k, v in appearance_values.items()
+            if v['entry_id'] not in keep
+        )
+        entry_ranks = dict(
+            (k, {'rank': v['rank']}) for k, v in entry_values.items()
+            if k not in keep
+        )
+        entry_values = dict(
+            (k, v) for k, v in entry_values.items() if k in keep
+        )
+        appearance_values = dict(
+            (k, v) for k, v in appearance_values.items() if v['entry_id'] in keep
+        )
+        song_values = dict(
+            (k, v) for k, v in song_values.items() if v['appearance_id'] in appearance_values
+        )
+
+    with transaction.atomic():
+        write_tallies(Tally.LEVEL.song, dict(
+            (pk, song_tallies[pk]) for pk in song_values
+        ))
+        write_tallies(Tally.LEVEL.appearance, dict(
+            (pk, appearance_tallies[pk]) for pk in appearance_values
+        ))
+        write_tallies(Tally.LEVEL.entry, dict(
+            (pk, entry_tallies[pk]) for pk in entry_values
+        ))
+        write_tallies(Tally.LEVEL.contestant, contestant_tallies)
+        bulk_update(Song, song_values, SCORING_FIELDS)
+        bulk_update(Appearance, appearance_values, SCORING_FIELDS + ['rank'])
+        bulk_update(Entry, entry_values, SCORING_FIELDS + ['rank'])
+        bulk_update(Contestant, contestant_values, SCORING_FIELDS + ['rank'])
+        bulk_update(Appearance, appearance_ranks, ['rank'])
+        bulk_update(Entry, entry_ranks, ['rank'])
+    log.info("Scored {0}".format(session))
+    return
+
+
+def apply_tally_delta(model, queryset, delta):
+    """Shift the stored totals of each locked row by a tally delta.
+
+    Rows whose running counts have never been computed are recalculated
+    instead.
+    """
+    rows = {}
+    for obj in queryset.select_for_update():
+        if any(getattr(obj, name) is None for name in COUNT_FIELDS):
+            obj.calculate_scores()
+            rows[obj.pk] = dict(
+                (name, getattr(obj, name)) for name in SCORING_FIELDS
+            )
+            continue
+        tally = column_tally(obj)
+        merge_tally(tally, official(delta))
+        rows[obj.pk] = tally_values(tally)
+    bulk_update(model, rows, SCORING_FIELDS)
+    return rows
+
+
+def stale_tallies(song_id, delta):
+    """Whether a song's stored tallies disagree with its scores before `delta`.
+
+    Sessions scored before tallies existed have none at all, and shifting
+    those would store partial totals.
+    """
+    Score = config.get_model('Score')
+    Tally = config.get_model('Tally')
+    expected = new_tally()
+    rows = Score.objects.filter(
+        song_id=song_id,
+    ).values(
+        'kind',
+        'category',
+    ).annotate(
+        points_sum=Sum('points'),
+        points_count=Count('points'),
+    ).order_by()
+    for row in rows:
+        tally = expected[(row['kind'], row['category'])]
+        tally[0] += row['points_sum'] or 0
+        tally[1] += row['points_count']
+    for key, (points, count) in delta.items():
+        expected[key][0] -= points
+        expected[key][1] -= count
+    stored = Tally.objects.filter(
+        level=Tally.LEVEL.song,
+        object_id=song_id,
+    ).values_list('kind', 'category', 'points', 'count')
+    return set(
+        (kind, category, points, count)
+        for kind, category, points, count in stored
+        if points or count
+    ) != set(
+        (kind, category, points, count)
+        for (kind, category), (points, count) in expected.items()
+        if points or count
+    )
+
+
+def propagate_score(song_id, previous=None, current=None):
+    """Apply a single score change to the totals that contain it.
+
+    `previous` and `current` are (kind, category, points) for the score
+    before and after the change; either may be None for a created or
+    deleted score.  Only the score's Song, Appearance, Entry and the
+    Contestants whose award covers the round are touched, so the cost is
+    constant regardless of session size.  Ranks are left for the next
+    full `score_session`.  If the song's stored tallies are stale (or were
+    never written), its entry is rescored from the scores instead.
+    """
+    Song = config.get_model('Song')
+    Appearance = config.get_model('Appearance')
+    Entry = config.get_model('Entry')
+    Contestant = config.get_model('Contestant')
+    Round = config.get_model('Round')
+    Tally = config.get_model('Tally')
+
+    delta = new_tally()
+    for values, sign in [(previous, -1), (current, 1)]:
+        if values is None:
+            continue
+        kind, category, points = values
+        if points is not None:
+            delta[(kind, category)][0] += sign * points
+            delta[(kind, category)][1] += sign
+    if not any(points or count for points, count in delta.values()):
+        return
+
+    with transaction.atomic():
+        songs = Song.objects.filter(pk=song_id)
+        # Hold the song so its tallies cannot move while they are checked.
+        if songs.select_for_update().first() is None:
+            return
+        if stale_tallies(song_id, delta):
+            entry = Entry.objects.filter(
+                appearances__songs__id=song_id,
+            ).select_related('session').first()
+            if entry:
+                score_session(
+                    entry.session,
+                    entries=Entry.objects.filter(pk=entry.pk),
+                )
+            return
+        apply_tally_delta(Song, songs, delta)
+        shift_tallies(Tally.LEVEL.song, [song_id], delta)
+        appearance = Appearance.objects.filter(
+            songs__id=song_id,
+        ).values('id', 'entry_id', 'round_id').first()
+        if not appearance:
+            return
+        appearances = Appearance.objects.filter(pk=appearance['id'])
+        apply_tally_delta(Appearance, appearances, delta)
+        shift_tallies(Tally.LEVEL.appearance, [appearance['id']], delta)
+        entries = Entry.objects.filter(pk=appearance['entry_id'])
+        apply_tally_delta(Entry, entries, delta)
+        shift_tallies(Tally.LEVEL.entry, [appearance['entry_id']], delta)
+        round_num = Round.objects.filter(
+            pk=appearance['round_id'],
+        ).values_list('num', flat=True).first()
+        contestant_ids = list(
+            Contestant.objects.filter(
+                entry_id=appearance['entry_id'],
+                contest__award__rounds__gte=round_num,
+            ).order_by('pk').values_list('id', flat=True)
+        )
+        contestants = Contestant.objects.filter(
+            pk__in=contestant_ids,
+        ).order_by('pk')
+        apply_tally_delta(Contestant, contestants, delta)
+        shift_tallies(Tally.LEVEL.contestant, contestant_ids, delta)
+    return
+
+
+def find_variances(scores):
+    """Ids of official scores that break the variance rules.
+
+    The scores are laid out as a (song x panelist) array so all songs are
+    checked in one vectorized pass.  A score is flagged when it is more
+    than 5 points from its category mean, or when it is the song's lowest
+    (highest) score and more than 5 points below (above) the next one.
+    """
+    rows = list(
+        scores.filter(
+            kind=OFFICIAL,
+        ).values_list('id', 'song_id', 'category', 'points')
+    )
+    if not rows:
+        return set()
+    songs = {}
+    widths = defaultdict(int)
+    positions = []
+    for pk, song_id, category, points in rows:
+        r = songs.setdefault(song_id, len(songs))
+        positions.append((r, widths[r]))
+        widths[r] += 1
+    shape = (len(songs), max(widths.values()))
+    points = np.full(shape, np.nan)
+    categories = np.zeros(shape, dtype=int)
+    for (r, c), (pk, song_id, category, value) in zip(positions, rows):
+        if value is not None:
+            points[r, c] = value
+        categories[r, c] = category
+    valid = ~np.isnan(points)
+    flagged = np.zeros(shape, dtype=bool)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # Category means per song.
+        for prefix, category in CATEGORIES:
+            counted = valid & (categories == category)
+            mean = np.where(counted, points, 0).sum(axis=1) / counted.sum(axis=1)
+            flagged |= counted & (np.abs(points - mean[:, None]) > 5)
+
+        # Spread between the two lowest and the two highest scores.
+        enough = valid.sum(axis=1) >= 2
+        asc = np.sort(np.where(valid, points, np.inf), axis=1)
+        dsc = -np.sort(np.where(valid, -points, np.inf), axis=1)
+        if shape[1] >= 2:
+            low = enough & (asc[:, 1] - asc[:, 0] > 5)
+            high = enough & (dsc[:, 0] - dsc[:, 1] > 5)
+            flagged |= valid & low[:, None] & (points == asc[:, :1])
+            flagged |= valid & high[:, None] & (points == dsc[:, :1])
+
+    return set(
+        row[0] for (r, c), row in zip(positions, rows) if flagged[r, c]
+    )
+
+
+def verify_round(round):
+    """Flag every variant official score in a round with one update."""
+    Score = config.get_model('Score')
+    flagged = find_variances(
+        Score.objects.filter(
+            song__appearance__round=round,
+        )
+    )
+    if flagged:
+        Score.objects.filter(
+            pk__in=flagged,
+        ).update(
+            original=F('points'),
+            is_flagged=True,
+            modified=now(),
+        )
+    log.info("Variance {0}: {1} scores".format(round, len(flagged)))
+    return flagged
+
+
+def advance_round(round, spots):
+    """Set the next draw for advancers and close out the finishers.
+
+    The round's entries are ordered by their session points total, read in
+    one grouped query.  Spots are extended in memory while the entry just
+    past the cutoff ties the last advancer.  Advancers get a random draw
+    and finishers a draw of -1, written in one statement.
+    """
+    Appearance = config.get_model('Appearance')
+    Score = config.get_model('Score')
+    appearances = dict(
+        round.appearances.values_list('entry_id', 'id')
+    )
+    totals = dict((entry_id, None) for entry_id in appearances)
+    totals.update(
+        Score.objects.filter(
+            song__appearance__entry__in=list(appearances),
+        ).values(
+            'song__appearance__entry',
+        ).annotate(
+            tot=Sum('points'),
+        ).order_by().values_list('song__appearance__entry', 'tot')
+    )
+    ordered = sorted(
+        appearances,
+        key=lambda e: (totals[e] is None, -(totals[e] or 0)),
+    )
+
+    # Check for tie at cutoff
+    while 0 < spots < len(ordered) and totals[ordered[spots - 1]] == totals[ordered[spots]]:
+        spots += 1
+    advancers = ordered[:spots]
+    finishers = ordered[spots:]
+
+    random.shuffle(advancers)
+    rows = {}
+    for i, entry_id in enumerate(advancers, start=1):
+        rows[appearances[entry_id]] = {'draw': i}
+    for entry_id in finishers:
+        rows[appearances[entry_id]] = {'draw': -1}
+    bulk_update(Appearance, rows, ['draw'])
+    return advancers, finishers
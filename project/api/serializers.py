@@ -5,7 +5,10 @@ from rest_framework.validators import UniqueTogetherValidator
 from rest_framework_json_api import serializers
 
 # Local
-from .fields import TimezoneField
+from .fields import (
+    RelatedLinksField,
+    TimezoneField,
+)
 from .models import (
     Appearance,
     Assignment,
@@ -37,11 +40,13 @@ from .models import (
 
 class AppearanceSerializer(serializers.ModelSerializer):
     permissions = DRYPermissionsField()
-    # included_serializers = {
-    #     'songs': 'api.serializers.SongSerializer',
-    #     'slot': 'api.serializers.SlotSerializer',
-    # }
-    #
+    included_serializers = {
+        'round': 'api.serializers.RoundSerializer',
+        'entry': 'api.serializers.EntrySerializer',
+        'slot': 'api.serializers.SlotSerializer',
+        'songs': 'api.serializers.SongSerializer',
+    }
+
     class Meta:
         model = Appearance
         fields = (
@@ -78,6 +83,10 @@ class AppearanceSerializer(serializers.ModelSerializer):
 
 class AssignmentSerializer(serializers.ModelSerializer):
     permissions = DRYPermissionsField()
+    included_serializers = {
+        'convention': 'api.serializers.ConventionSerializer',
+        'person': 'api.serializers.PersonSerializer',
+    }
 
     class Meta:
         model = Assignment
@@ -96,10 +105,12 @@ class AssignmentSerializer(serializers.ModelSerializer):
 
 class AwardSerializer(serializers.ModelSerializer):
     permissions = DRYPermissionsField()
-    # included_serializers = {
-    #     'children': 'api.serializers.AwardSerializer',
-    #     'contests': 'api.serializers.ContestSerializer',
-    # }
+    included_serializers = {
+        'organization': 'api.serializers.OrganizationSerializer',
+        'parent': 'api.serializers.AwardSerializer',
+        'children': 'api.serializers.AwardSerializer',
+        'contests': 'api.serializers.ContestSerializer',
+    }
 
     class Meta:
         model = Award
@@ -146,10 +157,10 @@ class AwardSerializer(serializers.ModelSerializer):
 
 class ChartSerializer(serializers.ModelSerializer):
     permissions = DRYPermissionsField()
-    # included_serializers = {
-    #     'repertories': 'api.serializers.RepertorySerializer',
-    #     'songs': 'api.serializers.SongSerializer',
-    # }
+    included_serializers = {
+        'repertories': 'api.serializers.RepertorySerializer',
+        'songs': 'api.serializers.SongSerializer',
+    }
 
     class Meta:
         model = Chart
@@ -182,9 +193,12 @@ class ChartSerializer(serializers.ModelSerializer):
 
 class ContestSerializer(serializers.ModelSerializer):
     permissions = DRYPermissionsField()
-    # included_serializers = {
-    #     'contestants': 'api.serializers.ContestantSerializer',
-    # }
+    included_serializers = {
+        'champion': 'api.serializers.EntrySerializer',
+        'session': 'api.serializers.SessionSerializer',
+        'award': 'api.serializers.AwardSerializer',
+        'contestants': 'api.serializers.ContestantSerializer',
+    }
 
     class Meta:
         model = Contest
@@ -209,6 +223,10 @@ class ContestSerializer(serializers.ModelSerializer):
 
 class ContestantSerializer(serializers.ModelSerializer):
     permissions = DRYPermissionsField()
+    included_serializers = {
+        'entry': 'api.serializers.EntrySerializer',
+        'contest': 'api.serializers.ContestSerializer',
+    }
 
     class Meta:
         model = Contestant
@@ -234,10 +252,12 @@ class ContestantSerializer(serializers.ModelSerializer):
 
 class ConventionSerializer(serializers.ModelSerializer):
     permissions = DRYPermissionsField()
-    # included_serializers = {
-    #     'sessions': 'api.serializers.SessionSerializer',
-    #     'assignments': 'api.serializers.AssignmentSerializer',
-    # }
+    included_serializers = {
+        'venue': 'api.serializers.VenueSerializer',
+        'organization': 'api.serializers.OrganizationSerializer',
+        'assignments': 'api.serializers.AssignmentSerializer',
+        'sessions': 'api.serializers.SessionSerializer',
+    }
 
     class Meta:
         model = Convention
@@ -271,11 +291,13 @@ class ConventionSerializer(serializers.ModelSerializer):
 
 class EntrySerializer(serializers.ModelSerializer):
     permissions = DRYPermissionsField()
-    # included_serializers = {
-    #     'appearances': 'api.serializers.AppearanceSerializer',
-    #     'contestants': 'api.serializers.ContestantSerializer',
-    #     'participants': 'api.serializers.ParticipantSerializer',
-    # }
+    included_serializers = {
+        'session': 'api.serializers.SessionSerializer',
+        'group': 'api.serializers.GroupSerializer',
+        'appearances': 'api.serializers.AppearanceSerializer',
+        'contestants': 'api.serializers.ContestantSerializer',
+        'participants': 'api.serializers.ParticipantSerializer',
+    }
 
     class Meta:
         model = Entry
@@ -317,6 +339,10 @@ class EntrySerializer(serializers.ModelSerializer):
 
 class GrantorSerializer(serializers.ModelSerializer):
     permissions = DRYPermissionsField()
+    included_serializers = {
+        'organization': 'api.serializers.OrganizationSerializer',
+        'session': 'api.serializers.SessionSerializer',
+    }
 
     class Meta:
         model = Grantor
@@ -333,11 +359,15 @@ class GrantorSerializer(serializers.ModelSerializer):
 
 class GroupSerializer(serializers.ModelSerializer):
     permissions = DRYPermissionsField()
-    # included_serializers = {
-    #     'entries': 'api.serializers.EntrySerializer',
-    #     'members': 'api.serializers.MemberSerializer',
-    #     'repertories': 'api.serializers.RepertorySerializer',
-    # }
+    entries = RelatedLinksField(many=True)
+    members = RelatedLinksField(many=True)
+    repertories = RelatedLinksField(many=True)
+    included_serializers = {
+        'organization': 'api.serializers.OrganizationSerializer',
+        'entries': 'api.serializers.EntrySerializer',
+        'members': 'api.serializers.MemberSerializer',
+        'repertories': 'api.serializers.RepertorySerializer',
+    }
 
     class Meta:
         model = Group
@@ -383,9 +413,11 @@ class GroupSerializer(serializers.ModelSerializer):
 
 class MemberSerializer(serializers.ModelSerializer):
     permissions = DRYPermissionsField()
-    # included_serializers = {
-    #     'participants': 'api.serializers.ParticipantSerializer',
-    # }
+    included_serializers = {
+        'group': 'api.serializers.GroupSerializer',
+        'person': 'api.serializers.PersonSerializer',
+        'participants': 'api.serializers.ParticipantSerializer',
+    }
 
     class Meta:
         model = Member
@@ -413,9 +445,9 @@ class MemberSerializer(serializers.ModelSerializer):
 
 class OfficeSerializer(serializers.ModelSerializer):
     permissions = DRYPermissionsField()
-    # included_serializers = {
-    #     'officers': 'api.serializers.OfficerSerializer',
-    # }
+    included_serializers = {
+        'officers': 'api.serializers.OfficerSerializer',
+    }
 
     class Meta:
         model = Office
@@ -447,6 +479,11 @@ class OfficeSerializer(serializers.ModelSerializer):
 
 class OfficerSerializer(serializers.ModelSerializer):
     permissions = DRYPermissionsField()
+    included_serializers = {
+        'office': 'api.serializers.OfficeSerializer',
+        'person': 'api.serializers.PersonSerializer',
+        'organization': 'api.serializers.OrganizationSerializer',
+    }
 
     class Meta:
         model = Officer
@@ -474,12 +511,18 @@ class OfficerSerializer(serializers.ModelSerializer):
 
 class OrganizationSerializer(serializers.ModelSerializer):
     permissions = DRYPermissionsField()
-    # included_serializers = {
-    #     'awards': 'api.serializers.AwardSerializer',
-    #     'conventions': 'api.serializers.ConventionSerializer',
-    #     'officers': 'api.serializers.OfficerSerializer',
-    #     'children': 'api.serializers.OrganizationSerializer',
-    # }
+    awards = RelatedLinksField(many=True)
+    conventions = RelatedLinksField(many=True)
+    groups = RelatedLinksField(many=True)
+    officers = RelatedLinksField(many=True)
+    included_serializers = {
+        'parent': 'api.serializers.OrganizationSerializer',
+        'children': 'api.serializers.OrganizationSerializer',
+        'awards': 'api.serializers.AwardSerializer',
+        'conventions': 'api.serializers.ConventionSerializer',
+        'groups': 'api.serializers.GroupSerializer',
+        'officers': 'api.serializers.OfficerSerializer',
+    }
 
     class Meta:
         model = Organization
@@ -527,9 +570,11 @@ class OrganizationSerializer(serializers.ModelSerializer):
 
 class PanelistSerializer(serializers.ModelSerializer):
     permissions = DRYPermissionsField()
-    # included_serializers = {
-    #     'scores': 'api.serializers.ScoreSerializer',
-    # }
+    included_serializers = {
+        'round': 'api.serializers.RoundSerializer',
+        'person': 'api.serializers.PersonSerializer',
+        'scores': 'api.serializers.ScoreSerializer',
+    }
 
     class Meta:
         model = Panelist
@@ -554,6 +599,10 @@ class PanelistSerializer(serializers.ModelSerializer):
 
 class ParticipantSerializer(serializers.ModelSerializer):
     permissions = DRYPermissionsField()
+    included_serializers = {
+        'entry': 'api.serializers.EntrySerializer',
+        'member': 'api.serializers.MemberSerializer',
+    }
 
     class Meta:
         model = Participant
@@ -571,13 +620,17 @@ class ParticipantSerializer(serializers.ModelSerializer):
 
 class PersonSerializer(serializers.ModelSerializer):
     permissions = DRYPermissionsField()
-    # included_serializers = {
-    #     'assignments': 'api.serializers.AssignmentSerializer',
-    #     'members': 'api.serializers.MemberSerializer',
-    #     'officers': 'api.serializers.OfficerSerializer',
-    #     'panelists': 'api.serializers.PanelistSerializer',
-    #     'user': 'api.serializers.UserSerializer',
-    # }
+    assignments = RelatedLinksField(many=True)
+    members = RelatedLinksField(many=True)
+    officers = RelatedLinksField(many=True)
+    panelists = RelatedLinksField(many=True)
+    included_serializers = {
+        'assignments': 'api.serializers.AssignmentSerializer',
+        'members': 'api.serializers.MemberSerializer',
+        'officers': 'api.serializers.OfficerSerializer',
+        'panelists': 'api.serializers.PanelistSerializer',
+        'user': 'api.serializers.UserSerializer',
+    }
 
     class Meta:
         model = Person
@@ -658,6 +711,10 @@ class PersonSerializer(serializers.ModelSerializer):
 
 class RepertorySerializer(serializers.ModelSerializer):
     permissions = DRYPermissionsField()
+    included_serializers = {
+        'group': 'api.serializers.GroupSerializer',
+        'chart': 'api.serializers.ChartSerializer',
+    }
 
     class Meta:
         model = Repertory
@@ -681,11 +738,12 @@ class RepertorySerializer(serializers.ModelSerializer):
 
 class RoundSerializer(serializers.ModelSerializer):
     permissions = DRYPermissionsField()
-    # included_serializers = {
-    #     'appearances': 'api.serializers.AppearanceSerializer',
-    #     'panelists': 'api.serializers.PanelistSerializer',
-    #     'slots': 'api.serializers.SlotSerializer',
-    # }
+    included_serializers = {
+        'session': 'api.serializers.SessionSerializer',
+        'appearances': 'api.serializers.AppearanceSerializer',
+        'panelists': 'api.serializers.PanelistSerializer',
+        'slots': 'api.serializers.SlotSerializer',
+    }
 
     class Meta:
         model = Round
@@ -713,6 +771,10 @@ class RoundSerializer(serializers.ModelSerializer):
 
 class ScoreSerializer(serializers.ModelSerializer):
     permissions = DRYPermissionsField()
+    included_serializers = {
+        'song': 'api.serializers.SongSerializer',
+        'panelist': 'api.serializers.PanelistSerializer',
+    }
 
     class Meta:
         model = Score
@@ -737,11 +799,13 @@ class ScoreSerializer(serializers.ModelSerializer):
 
 class SessionSerializer(serializers.ModelSerializer):
     permissions = DRYPermissionsField()
-    # included_serializers = {
-    #     'contests': 'api.serializers.ContestSerializer',
-    #     'entries': 'api.serializers.EntrySerializer',
-    #     'rounds': 'api.serializers.RoundSerializer',
-    # }
+    included_serializers = {
+        'convention': 'api.serializers.ConventionSerializer',
+        'contests': 'api.serializers.ContestSerializer',
+        'entries': 'api.serializers.EntrySerializer',
+        'rounds': 'api.serializers.RoundSerializer',
+        'grantors': 'api.serializers.GrantorSerializer',
+    }
 
     class Meta:
         model = Session
@@ -773,6 +837,9 @@ class SessionSerializer(serializers.ModelSerializer):
 
 class SlotSerializer(serializers.ModelSerializer):
     permissions = DRYPermissionsField()
+    included_serializers = {
+        'round': 'api.serializers.RoundSerializer',
+    }
 
     class Meta:
         model = Slot
@@ -796,9 +863,11 @@ class SlotSerializer(serializers.ModelSerializer):
 
 class SongSerializer(serializers.ModelSerializer):
     permissions = DRYPermissionsField()
-    # included_serializers = {
-    #     'scores': 'api.serializers.ScoreSerializer',
-    # }
+    included_serializers = {
+        'appearance': 'api.serializers.AppearanceSerializer',
+        'chart': 'api.serializers.ChartSerializer',
+        'scores': 'api.serializers.ScoreSerializer',
+    }
 
     class Meta:
         model = Song
@@ -831,9 +900,9 @@ class SongSerializer(serializers.ModelSerializer):
 class VenueSerializer(serializers.ModelSerializer):
     timezone = TimezoneField(allow_null=True)
     permissions = DRYPermissionsField()
-    # included_serializers = {
-    #     'conventions': 'api.serializers.ConventionSerializer',
-    # }
+    included_serializers = {
+        'conventions': 'api.serializers.ConventionSerializer',
+    }
 
 
     class Meta:
@@ -859,9 +928,9 @@ class VenueSerializer(serializers.ModelSerializer):
 
 
 class UserSerializer(serializers.ModelSerializer):
-    # included_serializers = {
-    #     'person': 'api.serializers.PersonSerializer',
-    # }
+    included_serializers = {
+        'person': 'api.serializers.PersonSerializer',
+    }
 
     class Meta:
         model = User
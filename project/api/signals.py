@@ -1,17 +1,46 @@
+# Standard Libary
+import threading
+from collections import defaultdict
+
 # Django
 # Third-Party
 from auth0.v3.management import Auth0
 from auth0.v3.management.rest import Auth0Error
+from django_fsm.signals import post_transition
 
 from django.conf import settings
 from django.db.models.signals import (
+    post_delete,
     post_save,
     pre_delete,
 )
 from django.dispatch import receiver
 
 # Local
-from .models import User
+from .models import (
+    Appearance,
+    Contestant,
+    Entry,
+    Member,
+    Office,
+    Officer,
+    Round,
+    Score,
+    Session,
+    Song,
+    Tally,
+    User,
+)
+from .permissions import invalidate_roles
+from .scoreboard import (
+    invalidate_round_scoreboard,
+    invalidate_session_scoreboards,
+    invalidate_song_scoreboards,
+)
+from .scoring import (
+    propagate_score,
+    score_session,
+)
 from .utils import get_auth0_token
 
 
@@ -58,3 +87,178 @@ def user_pre_delete(sender, instance, **kwargs):
         )
         auth0.users.delete(instance.auth0_id)
     return
+
+
+@receiver(post_save, sender=Score)
+def score_post_save(sender, instance=None, created=False, raw=False, **kwargs):
+    """Propagate a score change to its song, appearance, entry and contestants."""
+    if not raw:
+        if created:
+            previous = None
+        else:
+            previous = (
+                instance.tracker.previous('kind'),
+                instance.tracker.previous('category'),
+                instance.tracker.previous('points'),
+            )
+        current = (
+            instance.kind,
+            instance.category,
+            instance.points,
+        )
+        if previous != current:
+            propagate_score(
+                instance.song_id,
+                previous=previous,
+                current=current,
+            )
+            invalidate_song_scoreboards(instance.song_id)
+
+
+# Rows whose delete, with its cascade, is in progress on this thread.
+cascade = threading.local()
+
+
+def deleting(model):
+    """Primary keys of `model` rows being deleted on this thread."""
+    if not hasattr(cascade, 'pks'):
+        cascade.pks = defaultdict(set)
+    return cascade.pks[model]
+
+
+def rescore_entry(entry_id, round_id):
+    """Rescore an entry after it lost a song or an appearance of the round."""
+    round = Round.objects.select_related('session').get(pk=round_id)
+    score_session(round.session, entries=Entry.objects.filter(pk=entry_id))
+    invalidate_round_scoreboard(round)
+    invalidate_session_scoreboards(round.session)
+
+
+@receiver(pre_delete, sender=Session)
+@receiver(pre_delete, sender=Round)
+@receiver(pre_delete, sender=Entry)
+@receiver(pre_delete, sender=Appearance)
+@receiver(pre_delete, sender=Song)
+def scored_pre_delete(sender, instance, **kwargs):
+    """Mark a scored row as being deleted until its own post_delete.
+
+    A cascade deletes scores, songs and appearances before their parents,
+    so each level leaves the rescoring to the nearest ancestor that is
+    being deleted with it, and only the top of the cascade rescores what
+    survives, once.
+    """
+    deleting(sender).add(instance.pk)
+
+
+@receiver(post_delete, sender=Score)
+def score_post_delete(sender, instance, **kwargs):
+    """Remove a deleted score from its song, appearance, entry and contestants."""
+    if instance.song_id in deleting(Song):
+        return
+    propagate_score(
+        instance.song_id,
+        previous=(
+            instance.tracker.previous('kind'),
+            instance.tracker.previous('category'),
+            instance.tracker.previous('points'),
+        ),
+    )
+    invalidate_song_scoreboards(instance.song_id)
+
+
+TALLY_LEVELS = {
+    Song: Tally.LEVEL.song,
+    Appearance: Tally.LEVEL.appearance,
+    Entry: Tally.LEVEL.entry,
+    Contestant: Tally.LEVEL.contestant,
+}
+
+
+@receiver(post_delete, sender=Song)
+@receiver(post_delete, sender=Appearance)
+@receiver(post_delete, sender=Entry)
+@receiver(post_delete, sender=Contestant)
+def tallied_post_delete(sender, instance, **kwargs):
+    """Delete the tallies of a deleted song, appearance, entry or contestant."""
+    Tally.objects.filter(
+        level=TALLY_LEVELS[sender],
+        object_id=instance.id,
+    ).delete()
+
+
+@receiver(post_delete, sender=Song)
+def song_post_delete(sender, instance, **kwargs):
+    """Rescore the entry of a deleted song, unless its appearance goes too."""
+    deleting(Song).discard(instance.pk)
+    if instance.appearance_id in deleting(Appearance):
+        return
+    appearance = Appearance.objects.filter(
+        pk=instance.appearance_id,
+    ).values('entry_id', 'round_id').first()
+    if appearance:
+        rescore_entry(appearance['entry_id'], appearance['round_id'])
+
+
+@receiver(post_delete, sender=Appearance)
+def appearance_post_delete(sender, instance, **kwargs):
+    """Rescore the entry of a deleted appearance, unless it or the round goes too."""
+    deleting(Appearance).discard(instance.pk)
+    if instance.entry_id in deleting(Entry):
+        return
+    if instance.round_id in deleting(Round):
+        return
+    rescore_entry(instance.entry_id, instance.round_id)
+
+
+@receiver(post_delete, sender=Round)
+def round_post_delete(sender, instance, **kwargs):
+    """Rescore the session of a deleted round, unless it goes too."""
+    deleting(Round).discard(instance.pk)
+    if instance.session_id in deleting(Session):
+        return
+    session = Session.objects.get(pk=instance.session_id)
+    score_session(session)
+    invalidate_session_scoreboards(session)
+
+
+@receiver(post_delete, sender=Session)
+@receiver(post_delete, sender=Entry)
+def scored_post_delete(sender, instance, **kwargs):
+    """Unmark a deleted session or entry; the rest is left for ranking."""
+    deleting(sender).discard(instance.pk)
+
+
+@receiver(post_save, sender=Officer)
+@receiver(post_delete, sender=Officer)
+@receiver(post_save, sender=Member)
+@receiver(post_delete, sender=Member)
+def role_changed(sender, instance, **kwargs):
+    """Drop the cached roles of the officer's or member's person.
+
+    A role moved to another person also drops the previous person's.
+    """
+    invalidate_roles([
+        instance.person_id,
+        instance.tracker.previous('person_id'),
+    ])
+
+
+@receiver(post_save, sender=Office)
+def office_post_save(sender, instance, raw=False, **kwargs):
+    """Drop the cached roles of everyone holding the office."""
+    if not raw:
+        invalidate_roles(
+            instance.officers.values_list('person_id', flat=True)
+        )
+
+
+@receiver(post_transition, sender=Round)
+def round_post_transition(sender, instance, **kwargs):
+    """Drop the round's cached scoreboard on any transition."""
+    invalidate_round_scoreboard(instance)
+
+
+@receiver(post_transition, sender=Session)
+def session_post_transition(sender, instance, **kwargs):
+    """Drop the cached scoreboards of the session's contests on any transition."""
+    invalidate_session_scoreboards(instance)
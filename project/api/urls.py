@@ -1,6 +1,9 @@
 # Third-Party
 from rest_framework import routers
 
+# Django
+from django.conf.urls import url
+
 # Local
 from .views import (
     AppearanceViewSet,
@@ -8,12 +11,14 @@ from .views import (
     AwardViewSet,
     ChartViewSet,
     ContestantViewSet,
+    ContestScoreboardView,
     ContestViewSet,
     ConventionViewSet,
     EntryViewSet,
     GrantorViewSet,
     GroupViewSet,
     MemberViewSet,
+    MetricsView,
     OfficerViewSet,
     OfficeViewSet,
     OrganizationViewSet,
@@ -21,6 +26,7 @@ from .views import (
     ParticipantViewSet,
     PersonViewSet,
     RepertoryViewSet,
+    RoundScoreboardView,
     RoundViewSet,
     ScoreViewSet,
     SessionViewSet,
@@ -61,4 +67,51 @@ router.register(r'song', SongViewSet)
 router.register(r'user', UserViewSet)
 router.register(r'venue', VenueViewSet)
 router.register(r'log', StateLogViewSet)
-urlpatterns = router.urls
+
+# Paginated related and relationship endpoints for large to-many relations
+viewsets = dict(
+    (viewset.queryset.model, viewset) for prefix, viewset, base_name in router.registry
+)
+related_urlpatterns = []
+for prefix, viewset, base_name in router.registry:
+    related_fields = getattr(viewset, 'related_fields', None)
+    if not related_fields:
+        continue
+    model = viewset.queryset.model
+    related_viewsets = dict(
+        (name, viewsets[model._meta.get_field(name).related_model])
+        for name in related_fields
+    )
+    pattern = r'^{0}/(?P<pk>[^/.]+)/{1}(?P<related_field>{2})$'
+    related_urlpatterns += [
+        url(
+            pattern.format(prefix, 'relationships/', '|'.join(related_fields)),
+            viewset.as_view(
+                {'get': 'relationships'},
+                related_viewsets=related_viewsets,
+            ),
+            name='{0}-relationships'.format(base_name),
+        ),
+        url(
+            pattern.format(prefix, '', '|'.join(related_fields)),
+            viewset.as_view(
+                {'get': 'related'},
+                related_viewsets=related_viewsets,
+            ),
+            name='{0}-related'.format(base_name),
+        ),
+    ]
+
+urlpatterns = [
+    url(r'^_metrics$', MetricsView.as_view(), name='metrics'),
+    url(
+        r'^scoreboard/round/(?P<pk>[^/.]+)$',
+        RoundScoreboardView.as_view(),
+        name='scoreboard-round',
+    ),
+    url(
+        r'^scoreboard/contest/(?P<pk>[^/.]+)$',
+        ContestScoreboardView.as_view(),
+        name='scoreboard-contest',
+    ),
+] + related_urlpatterns + router.urls
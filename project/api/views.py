@@ -1,5 +1,7 @@
 # Standard Libary
+import hashlib
 import logging
+from calendar import timegm
 
 # Third-Party
 from django_filters.rest_framework import DjangoFilterBackend
@@ -23,18 +25,43 @@ from rest_framework.parsers import (
 )
 from rest_framework.permissions import (
     AllowAny,
+    IsAdminUser,
     IsAuthenticated,
 )
+from rest_framework.relations import ManyRelatedField
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework_csv.renderers import CSVRenderer
 
 # Django
-from django.db.models import Q
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import (
+    Count,
+    DateTimeField,
+    F,
+    Func,
+    IntegerField,
+    Max,
+    Q,
+    Subquery,
+)
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 
 # Local
 from .backends import (
     CoalesceFilterBackend,
+    IncludeFilterBackend,
     ScoreFilterBackend,
+    SparseFieldsFilterBackend,
+)
+from .fields import RelatedLinksManyField
+from .middleware import (
+    metrics,
+    summarize,
 )
 from .filters import (
     AwardFilter,
@@ -84,6 +111,12 @@ from .models import (
     Venue,
 )
 
+from .pagination import KeysetPagination
+from .permissions import get_permission_context
+from .scoreboard import (
+    get_contest_scoreboard,
+    get_round_scoreboard,
+)
 from .serializers import (
     AppearanceSerializer,
     AssignmentSerializer,
@@ -117,7 +150,170 @@ from .serializers import (
 log = logging.getLogger(__name__)
 
 
+class ConditionalGetMixin(object):
+    """Answer conditional GETs from `modified` before serializing.
+
+    The ETag hashes the latest `modified` and the row count of the filtered
+    queryset, and of each to-many relationship rendered as linkage, with
+    the requesting user, their roles and the full path, so a changed, added
+    or removed row or link, another page, another viewer or a change of the
+    viewer's permissions each give a new tag.  Detail responses also carry
+    Last-Modified.  Requests that `include` related resources are served
+    without either, since those resources can change on their own.
+    """
+
+    def get_etag(self, request, validators):
+        key = [
+            str(request.user.pk),
+            get_permission_context(request).version,
+            request.get_full_path(),
+        ]
+        for last_modified, count in validators:
+            key.append(last_modified.isoformat() if last_modified else '')
+            key.append(str(count or 0))
+        return '"{0}"'.format(hashlib.md5("|".join(key).encode('utf-8')).hexdigest())
+
+    def get_validators(self, queryset):
+        """Latest `modified` and row count of `queryset` and of each to-many
+        linkage of it, in a single query."""
+        model = queryset.model
+        aggregates = {
+            'last_modified_0': Max('modified'),
+            'count_0': Count('id'),
+        }
+        for field in self.get_serializer().fields.values():
+            if not isinstance(field, ManyRelatedField):
+                continue
+            if isinstance(field, RelatedLinksManyField):
+                continue
+            try:
+                relation = model._meta.get_field(field.source)
+            except FieldDoesNotExist:
+                continue
+            if relation.auto_created:
+                lookup = relation.field.name
+            else:
+                lookup = relation.related_query_name()
+            related = relation.related_model._default_manager.filter(**{
+                '{0}__in'.format(lookup): queryset,
+            }).order_by()
+            # Each linkage is an uncorrelated scalar subquery, so the
+            # database runs it once and the parent rows are not multiplied.
+            index = len(aggregates) // 2
+            aggregates['last_modified_{0}'.format(index)] = Max(Subquery(
+                related.annotate(
+                    value=Func(F('modified'), function='MAX'),
+                ).values('value'),
+                output_field=DateTimeField(),
+            ))
+            aggregates['count_{0}'.format(index)] = Max(Subquery(
+                related.annotate(
+                    value=Func(F('id'), function='COUNT'),
+                ).values('value'),
+                output_field=IntegerField(),
+            ))
+        aggregate = queryset.order_by().aggregate(**aggregates)
+        return [
+            (
+                aggregate['last_modified_{0}'.format(index)],
+                aggregate['count_{0}'.format(index)],
+            )
+            for index in range(len(aggregates) // 2)
+        ]
+
+    def list(self, request, *args, **kwargs):
+        if 'include' in request.query_params:
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        etag = self.get_etag(request, self.get_validators(queryset))
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = super().list(request, *args, **kwargs)
+        response['ETag'] = etag
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        if 'include' in request.query_params:
+            return super().retrieve(request, *args, **kwargs)
+        instance = self.get_object()
+        validators = self.get_validators(
+            type(instance)._default_manager.filter(pk=instance.pk),
+        )
+        etag = self.get_etag(request, validators)
+        last_modified = timegm(
+            max(v[0] for v in validators if v[0]).utctimetuple()
+        )
+        response = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=last_modified,
+        )
+        if response is None:
+            serializer = self.get_serializer(instance)
+            response = Response(serializer.data)
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        return response
+
+
+class RelatedResourceMixin(object):
+    """Serve to-many relationships through paginated endpoints.
+
+    `{pk}/{field}` lists the related resources and
+    `{pk}/relationships/{field}` their resource identifiers.  Both are
+    filtered, permission-checked and paginated by the related resource's own
+    viewset, which the URLconf supplies in `related_viewsets`.
+    """
+    related_fields = []
+    related_viewsets = {}
+
+    def get_related(self, related_field):
+        parent = self.get_object()
+        view = self.related_viewsets[related_field]()
+        view.request = self.request
+        view.args = ()
+        view.kwargs = {}
+        view.format_kwarg = self.format_kwarg
+        view.action = 'list'
+        view.check_permissions(self.request)
+        field = parent._meta.get_field(related_field)
+        queryset = view.filter_queryset(
+            view.get_queryset().filter(**{field.remote_field.name: parent})
+        )
+        self.resource_name = view.resource_name
+        return view, queryset
+
+    def related(self, request, related_field, *args, **kwargs):
+        view, queryset = self.get_related(related_field)
+        page = view.paginate_queryset(queryset)
+        if page is None:
+            serializer = view.get_serializer(queryset, many=True)
+            return Response(serializer.data)
+        serializer = view.get_serializer(page, many=True)
+        return view.get_paginated_response(serializer.data)
+
+    def relationships(self, request, related_field, *args, **kwargs):
+        view, queryset = self.get_related(related_field)
+        # Resource identifiers are rendered as-is.
+        self.resource_name = False
+        rows = queryset.values('id', 'nomen')
+        page = view.paginate_queryset(rows)
+        data = [
+            {'type': view.resource_name, 'id': str(row['id'])}
+            for row in (rows if page is None else page)
+        ]
+        if page is None:
+            return Response({'data': data})
+        paginated = view.get_paginated_response(data).data
+        return Response({
+            'data': data,
+            'meta': paginated.get('meta'),
+            'links': paginated.get('links'),
+        })
+
+
 class AppearanceViewSet(
+    ConditionalGetMixin,
     get_viewset_transition_action_mixin(Appearance),
     viewsets.ModelViewSet,
 ):
@@ -134,6 +330,8 @@ class AppearanceViewSet(
     filter_class = None
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
@@ -156,6 +354,7 @@ class AppearanceViewSet(
 
 
 class AssignmentViewSet(
+        ConditionalGetMixin,
         get_viewset_transition_action_mixin(Assignment),
         viewsets.ModelViewSet,
 ):
@@ -168,6 +367,8 @@ class AssignmentViewSet(
     filter_class = None
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
@@ -177,6 +378,7 @@ class AssignmentViewSet(
 
 
 class AwardViewSet(
+    ConditionalGetMixin,
     get_viewset_transition_action_mixin(Award),
     viewsets.ModelViewSet
 ):
@@ -191,6 +393,8 @@ class AwardViewSet(
     filter_class = AwardFilter
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
@@ -200,6 +404,7 @@ class AwardViewSet(
 
 
 class ChartViewSet(
+    ConditionalGetMixin,
     get_viewset_transition_action_mixin(Chart),
     viewsets.ModelViewSet,
 ):
@@ -212,6 +417,8 @@ class ChartViewSet(
     filter_class = ChartFilter
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
@@ -239,7 +446,10 @@ class ChartViewSet(
             return Response(status=status.HTTP_400_BAD_REQUEST)
 
 
-class ContestViewSet(viewsets.ModelViewSet):
+class ContestViewSet(
+    ConditionalGetMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Contest.objects.select_related(
         'session',
         'award',
@@ -251,6 +461,8 @@ class ContestViewSet(viewsets.ModelViewSet):
     filter_class = None
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
@@ -259,7 +471,10 @@ class ContestViewSet(viewsets.ModelViewSet):
     resource_name = "contest"
 
 
-class ContestantViewSet(viewsets.ModelViewSet):
+class ContestantViewSet(
+    ConditionalGetMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Contestant.objects.select_related(
         'entry',
         'contest',
@@ -269,6 +484,8 @@ class ContestantViewSet(viewsets.ModelViewSet):
     filter_class = ContestantFilter
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
@@ -278,6 +495,7 @@ class ContestantViewSet(viewsets.ModelViewSet):
 
 
 class ConventionViewSet(
+    ConditionalGetMixin,
     get_viewset_transition_action_mixin(Convention),
     viewsets.ModelViewSet
 ):
@@ -296,6 +514,8 @@ class ConventionViewSet(
     filter_class = ConventionFilter
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
@@ -305,6 +525,7 @@ class ConventionViewSet(
 
 
 class EntryViewSet(
+    ConditionalGetMixin,
     get_viewset_transition_action_mixin(Entry),
     viewsets.ModelViewSet
 ):
@@ -325,6 +546,8 @@ class EntryViewSet(
     filter_class = EntryFilter
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
@@ -333,7 +556,10 @@ class EntryViewSet(
     resource_name = "entry"
 
 
-class GrantorViewSet(viewsets.ModelViewSet):
+class GrantorViewSet(
+    ConditionalGetMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Grantor.objects.select_related(
         'organization',
         'session',
@@ -343,6 +569,8 @@ class GrantorViewSet(viewsets.ModelViewSet):
     filter_class = None
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
@@ -352,21 +580,13 @@ class GrantorViewSet(viewsets.ModelViewSet):
 
 
 class GroupViewSet(
+    ConditionalGetMixin,
+    RelatedResourceMixin,
     get_viewset_transition_action_mixin(Group),
     viewsets.ModelViewSet
 ):
     queryset = Group.objects.select_related(
         'organization',
-    ).prefetch_related(
-        'entries',
-        'entries__appearances',
-        'entries__contestants',
-        'entries__session',
-        'entries__participants',
-        'members__participants',
-        'members__person',
-        'repertories',
-        'repertories__chart',
     ).order_by(
         'nomen',
     )
@@ -374,12 +594,19 @@ class GroupViewSet(
     filter_class = GroupFilter
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
         DRYPermissions,
     ]
     resource_name = "group"
+    related_fields = [
+        'entries',
+        'members',
+        'repertories',
+    ]
 
     @detail_route(methods=['POST'], permission_classes=[AllowAny])
     @parser_classes((FormParser, MultiPartParser,))
@@ -402,6 +629,7 @@ class GroupViewSet(
 
 
 class MemberViewSet(
+    ConditionalGetMixin,
     get_viewset_transition_action_mixin(Member),
     viewsets.ModelViewSet
 ):
@@ -414,8 +642,11 @@ class MemberViewSet(
     ).order_by('nomen')
     serializer_class = MemberSerializer
     filter_class = MemberFilter
+    pagination_class = KeysetPagination
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
@@ -424,7 +655,10 @@ class MemberViewSet(
     resource_name = "member"
 
 
-class OfficeViewSet(viewsets.ModelViewSet):
+class OfficeViewSet(
+    ConditionalGetMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Office.objects.select_related(
     ).prefetch_related(
         'officers',
@@ -435,6 +669,8 @@ class OfficeViewSet(viewsets.ModelViewSet):
     filter_class = OfficeFilter
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
@@ -444,6 +680,7 @@ class OfficeViewSet(viewsets.ModelViewSet):
 
 
 class OfficerViewSet(
+    ConditionalGetMixin,
     get_viewset_transition_action_mixin(Officer),
     viewsets.ModelViewSet
 ):
@@ -457,6 +694,8 @@ class OfficerViewSet(
     filter_class = OfficerFilter
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
@@ -466,29 +705,15 @@ class OfficerViewSet(
 
 
 class OrganizationViewSet(
+    ConditionalGetMixin,
+    RelatedResourceMixin,
     get_viewset_transition_action_mixin(Organization),
     viewsets.ModelViewSet
 ):
     queryset = Organization.objects.select_related(
         'parent',
     ).prefetch_related(
-        'awards',
-        'awards__contests',
-        'awards__parent',
-        'awards__children',
-        'conventions',
-        'conventions__sessions',
-        'conventions__assignments',
-        'conventions__venue',
-        'groups',
-        'officers',
-        'officers__person',
-        'officers__office',
         'children',
-        'children__awards',
-        'children__conventions',
-        'children__officers',
-        'children__children',
     ).order_by(
         'nomen',
     )
@@ -496,12 +721,20 @@ class OrganizationViewSet(
     filter_class = OrganizationFilter
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
         DRYPermissions,
     ]
     resource_name = "organization"
+    related_fields = [
+        'awards',
+        'conventions',
+        'groups',
+        'officers',
+    ]
 
     @detail_route(methods=['POST'], permission_classes=[AllowAny])
     @parser_classes((FormParser, MultiPartParser,))
@@ -523,7 +756,10 @@ class OrganizationViewSet(
             return Response(status=status.HTTP_400_BAD_REQUEST)
 
 
-class PanelistViewSet(viewsets.ModelViewSet):
+class PanelistViewSet(
+    ConditionalGetMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Panelist.objects.select_related(
         'round',
         'person',
@@ -535,6 +771,8 @@ class PanelistViewSet(viewsets.ModelViewSet):
     filter_class = PanelistFilter
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
@@ -543,7 +781,10 @@ class PanelistViewSet(viewsets.ModelViewSet):
     resource_name = "panelist"
 
 
-class ParticipantViewSet(viewsets.ModelViewSet):
+class ParticipantViewSet(
+    ConditionalGetMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Participant.objects.select_related(
         'entry',
         'member'
@@ -553,6 +794,8 @@ class ParticipantViewSet(viewsets.ModelViewSet):
     filter_class = ParticipantFilter
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
@@ -561,26 +804,33 @@ class ParticipantViewSet(viewsets.ModelViewSet):
     resource_name = "participant"
 
 
-class PersonViewSet(viewsets.ModelViewSet):
+class PersonViewSet(
+    ConditionalGetMixin,
+    RelatedResourceMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Person.objects.select_related(
         'user',
-    ).prefetch_related(
-        'assignments',
-        'members',
-        'officers',
-        'officers__office',
-        'panelists',
     ).order_by('nomen')
     serializer_class = PersonSerializer
     filter_class = PersonFilter
+    pagination_class = KeysetPagination
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
         DRYPermissions,
     ]
     resource_name = "person"
+    related_fields = [
+        'assignments',
+        'members',
+        'officers',
+        'panelists',
+    ]
 
     @detail_route(methods=['POST'], permission_classes=[AllowAny])
     @parser_classes((FormParser, MultiPartParser,))
@@ -603,6 +853,7 @@ class PersonViewSet(viewsets.ModelViewSet):
 
 
 class RepertoryViewSet(
+    ConditionalGetMixin,
     get_viewset_transition_action_mixin(Repertory),
     viewsets.ModelViewSet
 ):
@@ -615,6 +866,8 @@ class RepertoryViewSet(
     filter_class = None
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
@@ -624,6 +877,7 @@ class RepertoryViewSet(
 
 
 class RoundViewSet(
+    ConditionalGetMixin,
     get_viewset_transition_action_mixin(Round),
     viewsets.ModelViewSet
 ):
@@ -645,6 +899,8 @@ class RoundViewSet(
     filter_class = RoundFilter
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
@@ -662,7 +918,10 @@ class RoundViewSet(
         return Response(serializer.data)
 
 
-class ScoreViewSet(viewsets.ModelViewSet):
+class ScoreViewSet(
+    ConditionalGetMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Score.objects.select_related(
         'song',
         'panelist',
@@ -670,8 +929,11 @@ class ScoreViewSet(viewsets.ModelViewSet):
     ).order_by('nomen')
     serializer_class = ScoreSerializer
     filter_class = ScoreFilter
+    pagination_class = KeysetPagination
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
         # ScoreFilterBackend,
     ]
@@ -682,6 +944,7 @@ class ScoreViewSet(viewsets.ModelViewSet):
 
 
 class SessionViewSet(
+    ConditionalGetMixin,
     get_viewset_transition_action_mixin(Session),
     viewsets.ModelViewSet
 ):
@@ -705,6 +968,8 @@ class SessionViewSet(
     filter_class = SessionFilter
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
@@ -713,7 +978,10 @@ class SessionViewSet(
     resource_name = "session"
 
 
-class SlotViewSet(viewsets.ModelViewSet):
+class SlotViewSet(
+    ConditionalGetMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Slot.objects.select_related(
         'round',
         'appearance',
@@ -723,6 +991,8 @@ class SlotViewSet(viewsets.ModelViewSet):
     filter_class = None
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
@@ -731,7 +1001,10 @@ class SlotViewSet(viewsets.ModelViewSet):
     resource_name = "slot"
 
 
-class SongViewSet(viewsets.ModelViewSet):
+class SongViewSet(
+    ConditionalGetMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Song.objects.select_related(
         'appearance',
         'chart',
@@ -743,6 +1016,8 @@ class SongViewSet(viewsets.ModelViewSet):
     filter_class = None
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
@@ -751,7 +1026,10 @@ class SongViewSet(viewsets.ModelViewSet):
     resource_name = "song"
 
 
-class VenueViewSet(viewsets.ModelViewSet):
+class VenueViewSet(
+    ConditionalGetMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Venue.objects.select_related(
     ).prefetch_related(
         'conventions',
@@ -763,6 +1041,8 @@ class VenueViewSet(viewsets.ModelViewSet):
     filter_class = VenueFilter
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
@@ -784,6 +1064,8 @@ class UserViewSet(viewsets.ModelViewSet):
     filter_class = None
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     permission_classes = [
@@ -803,6 +1085,8 @@ class StateLogViewSet(viewsets.ModelViewSet):
     filter_class = None
     filter_backends = [
         CoalesceFilterBackend,
+        SparseFieldsFilterBackend,
+        IncludeFilterBackend,
         DjangoFilterBackend,
     ]
     # permission_classes = [
@@ -816,6 +1100,60 @@ class StateLogViewSet(viewsets.ModelViewSet):
     #     return Response(serializer.data)
 
 
+class MetricsView(APIView):
+    """Recent request metrics collected by MetricsMiddleware."""
+    permission_classes = [
+        IsAdminUser,
+    ]
+    renderer_classes = [
+        JSONRenderer,
+    ]
+
+    def get(self, request, *args, **kwargs):
+        records = list(metrics)
+        return Response({
+            'endpoints': summarize(records),
+            'requests': records,
+        })
+
+
+class RoundScoreboardView(APIView):
+    """Public results of an announced round, served from the cache."""
+    authentication_classes = []
+    permission_classes = [
+        AllowAny,
+    ]
+
+    def get(self, request, pk, *args, **kwargs):
+        round = get_object_or_404(
+            Round.objects.only('id', 'nomen', 'num', 'kind', 'status', 'modified'),
+            pk=pk,
+            status=Round.STATUS.announced,
+        )
+        return HttpResponse(
+            get_round_scoreboard(round),
+            content_type='application/json',
+        )
+
+
+class ContestScoreboardView(APIView):
+    """Public results of a contest in an announced session, served from the cache."""
+    authentication_classes = []
+    permission_classes = [
+        AllowAny,
+    ]
+
+    def get(self, request, pk, *args, **kwargs):
+        contest = get_object_or_404(
+            Contest.objects.select_related('award', 'session'),
+            pk=pk,
+            session__status=Session.STATUS.announced,
+        )
+        return HttpResponse(
+            get_contest_scoreboard(contest, contest.session),
+            content_type='application/json',
+        )
+
 
 # CSV View
 class OfficeRendererCSV(CSVRenderer):
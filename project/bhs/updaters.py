@@ -1,5 +1,7 @@
 # Standard Libary
 import logging
+import uuid
+from collections import defaultdict
 from datetime import datetime
 
 from email_validator import (
@@ -11,17 +13,24 @@ from django.db import (
     IntegrityError,
     transaction,
 )
+from django.db.models import Q
 from django.utils import (
     dateparse,
     encoding,
 )
 from auth0.v3.management import Auth0
 from auth0.v3.management.rest import Auth0Error
+from nameparser import HumanName
 
 # Django
 from django.conf import settings
 
 # First-Party
+from api.permissions import invalidate_roles
+from api.scoring import (
+    BATCH_SIZE,
+    bulk_update,
+)
 from api.utils import get_auth0_token
 # Local
 from api.models import (
@@ -36,6 +45,7 @@ from api.models import (
     Person,
     Repertory,
     Session,
+    SyncState,
     User,
 )
 
@@ -47,12 +57,31 @@ from bhs.models import (
     Structure,
     Subscription,
     Role,
+    SMJoin,
 )
 
 log = logging.getLogger('updater')
 
 
-def update_or_create_person_from_human(human):
+PERSON_FIELDS = [
+    'name',
+    'status',
+    'email',
+    'birth_date',
+    'phone',
+    'cell_phone',
+    'work_phone',
+    'is_bhs',
+    'bhs_id',
+    'gender',
+    'part',
+    'nomen',
+    'last_name',
+]
+
+
+def get_person_defaults(human, subscriptions):
+    """Person fields for ``human``, given its editable subscription statuses."""
     first_name = human.first_name.strip()
     middle_name = human.middle_name.strip()
     last_name = human.last_name.strip()
@@ -116,17 +145,9 @@ def update_or_create_person_from_human(human):
         part = 4
     else:
         part = None
-    try:
-        subscription = human.subscriptions.get(
-            items_editable=True,
-        )
-        if subscription.status.casefold() == 'active'.casefold() and email:
-            status = 10
-        else:
-            status = -10
-    except Subscription.DoesNotExist:
-        status = -10
-    except Subscription.MultipleObjectsReturned:
+    if len(subscriptions) == 1 and subscriptions[0].casefold() == 'active'.casefold() and email:
+        status = 10
+    else:
         status = -10
     defaults = {
         'name': name,
@@ -141,6 +162,34 @@ def update_or_create_person_from_human(human):
         'gender': gender,
         'part': part,
     }
+    # Denormalizations, as in Person.save()
+    if name:
+        defaults['last_name'] = HumanName(name).last
+    else:
+        defaults['last_name'] = None
+    defaults['nomen'] = " ".join(
+        map(
+            (lambda x: encoding.smart_text(x)),
+            filter(
+                None, [
+                    name,
+                    "[{0}]".format(bhs_id),
+                ]
+            )
+        )
+    )
+    return defaults
+
+
+def update_or_create_person_from_human(human):
+    subscriptions = human.subscriptions.filter(
+        items_editable=True,
+    ).values_list(
+        'status',
+        flat=True,
+    )
+    defaults = get_person_defaults(human, list(subscriptions[:2]))
+    status = defaults['status']
     try:
         person, created = Person.objects.update_or_create(
             bhs_pk=human.id,
@@ -157,6 +206,207 @@ def update_or_create_person_from_human(human):
         )
 
 
+def iterate_chunks(queryset, size=BATCH_SIZE, keys=('pk',), start=None):
+    """Yield ``queryset`` as lists of at most ``size`` rows.
+
+    Each chunk is its own query seeking past the last row by ``keys``, so
+    memory stays bounded; mysqlclient would otherwise buffer the whole view
+    client-side, `iterator()` or not.  Rows may be instances or `values()`
+    dicts, with ``keys`` naming the ordering columns.  ``start`` resumes
+    after a known position.
+    """
+    queryset = queryset.order_by(*keys)
+    last = start
+    while True:
+        if last is None:
+            chunk = list(queryset[:size])
+        else:
+            chunk = list(queryset.filter(seek(keys, last))[:size])
+        if not chunk:
+            return
+        yield chunk
+        last = position(chunk[-1], keys)
+
+
+def position(row, keys):
+    if isinstance(row, dict):
+        return [row[key] for key in keys]
+    return [getattr(row, key) for key in keys]
+
+
+def seek(keys, values):
+    """Rows after ``values`` in ``keys`` order, as (k1 > v1) OR (k1 = v1 AND k2 > v2) ..."""
+    q = Q()
+    for i, key in enumerate(keys):
+        term = Q(**{'{0}__gt'.format(key): values[i]})
+        for prior, value in zip(keys[:i], values[:i]):
+            term &= Q(**{prior: value})
+        q |= term
+    return q
+
+
+def stream(queryset, size=BATCH_SIZE, keys=('pk',)):
+    """Iterate ``queryset`` row by row, reading it in bounded chunks."""
+    for chunk in iterate_chunks(queryset, size=size, keys=keys):
+        for row in chunk:
+            yield row
+
+
+def get_sync_state(model, reset=False, partition=None):
+    """Return the SyncState of ``model``'s BHS view, rewound if ``reset``.
+
+    A (low, high) ``partition`` gets its own state, so each id range of a
+    partitioned sync checkpoints separately.
+    """
+    source = model._meta.db_table
+    if partition is not None:
+        source = '{0}:{1}-{2}'.format(source, partition[0], partition[1] or '')
+    state, created = SyncState.objects.get_or_create(
+        source=source,
+    )
+    if reset:
+        state.updated_ts = None
+        state.last_id = ''
+    return state
+
+
+def get_watermark(state):
+    """The (updated_ts, id) a SyncState stands at, or None if at the start."""
+    if state.updated_ts is None:
+        return None
+    return (state.updated_ts, state.last_id)
+
+
+def iterate_changes(queryset, state, size=BATCH_SIZE):
+    """Yield chunks of the rows changed since ``state``, advancing it.
+
+    Rows come in (updated_ts, id) order from just past the watermark.  The
+    watermark moves to a chunk's last row when the next chunk is asked for,
+    that is once the caller has written it, so an interrupted run resumes
+    with the chunk it was on.
+    """
+    keys = ('updated_ts', 'id')
+    start = None
+    if state.updated_ts is not None:
+        start = [state.updated_ts, state.last_id]
+    for chunk in iterate_chunks(queryset, size=size, keys=keys, start=start):
+        yield chunk
+        state.updated_ts, state.last_id = position(chunk[-1], keys)
+        state.save()
+
+
+def bulk_create_or_log(model, objs):
+    """Insert ``objs`` in batches, falling back to one row at a time.
+
+    A conflicting row fails its whole batch, so the batch is retried row by
+    row and the offenders logged, as `update_or_create` did.  Rows are
+    inserted without `save()` or its signals.  Returns the inserted objects.
+    """
+    try:
+        with transaction.atomic():
+            model.objects.bulk_create(objs, batch_size=BATCH_SIZE)
+        return objs
+    except IntegrityError:
+        pass
+    created = []
+    for obj in objs:
+        try:
+            with transaction.atomic():
+                model.objects.bulk_create([obj])
+        except IntegrityError as e:
+            log.error((obj, str(e)))
+            continue
+        created.append(obj)
+    return created
+
+
+def bulk_update_or_log(model, rows, fields):
+    """Write {pk: {field: value}} rows in batches, falling back to one at a time."""
+    try:
+        with transaction.atomic():
+            return bulk_update(model, rows, fields)
+    except IntegrityError:
+        pass
+    updated = 0
+    for pk, values in rows.items():
+        try:
+            with transaction.atomic():
+                bulk_update(model, {pk: values}, fields)
+        except IntegrityError as e:
+            log.error((pk, str(e)))
+            continue
+        updated += 1
+    return updated
+
+
+def sync_persons_from_humans(humans, state=None):
+    """Create or update Persons from ``humans`` in chunks.
+
+    Each chunk of Humans is read with its editable subscriptions and diffed
+    against the Persons already linked by `bhs_pk`; new Persons are bulk
+    inserted and changed ones written with batched updates.  Users for new
+    active Persons are inserted without the Auth0 signal, so their accounts
+    are left to `crud_auth0`, which the sync commands run afterwards.
+    Given a SyncState, only Humans changed since its watermark are read.
+    Returns the (created, updated) counts.
+    """
+    if state is None:
+        chunks = iterate_chunks(humans)
+    else:
+        chunks = iterate_changes(humans, state)
+    created = 0
+    updated = 0
+    for chunk in chunks:
+        subscriptions = defaultdict(list)
+        for human_id, status in Subscription.objects.filter(
+            human_id__in=[human.id for human in chunk],
+            items_editable=True,
+        ).values_list(
+            'human_id',
+            'status',
+        ):
+            subscriptions[human_id].append(status)
+        rows = dict(
+            (uuid.UUID(human.id), get_person_defaults(human, subscriptions[human.id]))
+            for human in chunk
+        )
+        existing = dict(
+            (person.pop('bhs_pk'), person)
+            for person in Person.objects.filter(
+                bhs_pk__in=list(rows),
+            ).values(
+                'id',
+                'bhs_pk',
+                *PERSON_FIELDS
+            )
+        )
+        new = []
+        changed = {}
+        for bhs_pk, defaults in rows.items():
+            person = existing.get(bhs_pk)
+            if person is None:
+                new.append(Person(bhs_pk=bhs_pk, **defaults))
+                continue
+            pk = person.pop('id')
+            if person != defaults:
+                changed[pk] = defaults
+        with transaction.atomic():
+            new = bulk_create_or_log(Person, new)
+            updated += bulk_update_or_log(Person, changed, PERSON_FIELDS)
+            bulk_create_or_log(User, [
+                User(
+                    email=person.email,
+                    person=person,
+                    password='',
+                    is_active=True,
+                )
+                for person in new if person.status == 10
+            ])
+        created += len(new)
+        log.info((len(chunk), len(new), len(changed)))
+    return created, updated
+
+
 def update_or_create_group_from_structure(structure):
     if not structure.name:
         return
@@ -264,11 +514,20 @@ def update_or_create_group_from_structure(structure):
             group.save()
 
 
-def update_or_create_member_from_smjoin(smjoin):
-    if smjoin.structure.kind not in ['chapter', 'quartet']:
-        return
+def sync_groups_from_structures(structures, state):
+    """Create or update Groups from the Structures changed since ``state``."""
+    total = 0
+    for chunk in iterate_changes(structures, state):
+        for structure in chunk:
+            update_or_create_group_from_structure(structure)
+        total += len(chunk)
+        log.info(total)
+    return total
+
+
+def get_part(vocal_part):
     try:
-        part_stripped = smjoin.vocal_part.strip()
+        part_stripped = vocal_part.strip()
     except AttributeError:
         part_stripped = None
     if part_stripped:
@@ -284,6 +543,13 @@ def update_or_create_member_from_smjoin(smjoin):
             part = None
     else:
         part = None
+    return part
+
+
+def update_or_create_member_from_smjoin(smjoin):
+    if smjoin.structure.kind not in ['chapter', 'quartet']:
+        return
+    part = get_part(smjoin.vocal_part)
     is_current = smjoin.status
     if is_current:
         status = 10
@@ -341,6 +607,261 @@ def update_or_create_member_from_smjoin(smjoin):
         return
 
 
+MEMBER_FIELDS = [
+    'is_current',
+    'status',
+    'valid_through',
+    'part',
+    'bhs_pk',
+]
+
+
+def chunked(iterable, size=BATCH_SIZE):
+    """Yield lists of at most ``size`` items from ``iterable``."""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def get_editable_subscription(subscriptions):
+    """Pick the subscription `update_or_create_member_from_smjoin` would use.
+
+    ``subscriptions`` are a human's editable subscriptions; if there are
+    several, the only active one wins.  None when there is no clear choice.
+    """
+    if len(subscriptions) == 1:
+        return subscriptions[0]
+    active = [
+        subscription for subscription in subscriptions
+        if subscription['status'].casefold() == 'active'.casefold()
+    ]
+    if len(active) == 1:
+        return active[0]
+    return None
+
+
+def iterate_member_smjoins(smjoins):
+    """Yield the deciding SMJoin row of each (structure, human) pair.
+
+    Rows stream in (structure, human, id) order, so each pair's rows arrive
+    together, and the one `order_by('status', 'established_date').last()`
+    would return is kept.
+    """
+    def rank(row):
+        return (
+            row['status'],
+            row['established_date'] is not None,
+            row['established_date'] or datetime.min.date(),
+        )
+    keys = ('structure__id', 'subscription__human__id', 'id')
+    pair = None
+    winner = None
+    rows = smjoins.values(
+        'status',
+        'vocal_part',
+        'established_date',
+        *keys
+    )
+    for row in stream(rows, keys=keys):
+        current = (row['structure__id'], row['subscription__human__id'])
+        if current != pair:
+            if winner is not None:
+                yield winner
+            pair = current
+            winner = row
+        elif rank(row) >= rank(winner):
+            winner = row
+    if winner is not None:
+        yield winner
+
+
+def sync_members_from_smjoins(smjoins):
+    """Create or update Members from the deciding SMJoin of each pair.
+
+    Winners are taken from one ordered stream over ``smjoins``.  Groups,
+    Persons and editable subscriptions are loaded per chunk of winners into
+    `bhs_pk` dictionaries, and Members are diffed and written in bulk.
+    The cached roles of every touched Person are dropped, as the Member
+    signals would.  Returns the (created, updated) counts.
+    """
+    created = 0
+    updated = 0
+    for chunk in chunked(iterate_member_smjoins(smjoins)):
+        groups = dict(
+            (bhs_pk, (pk, nomen))
+            for bhs_pk, pk, nomen in Group.objects.filter(
+                bhs_pk__in=set(row['structure__id'] for row in chunk),
+            ).values_list('bhs_pk', 'id', 'nomen')
+        )
+        humans = set(row['subscription__human__id'] for row in chunk)
+        persons = dict(
+            (bhs_pk, (pk, nomen))
+            for bhs_pk, pk, nomen in Person.objects.filter(
+                bhs_pk__in=humans,
+            ).values_list('bhs_pk', 'id', 'nomen')
+        )
+        subscriptions = defaultdict(list)
+        for subscription in Subscription.objects.filter(
+            human_id__in=humans,
+            items_editable=True,
+        ).values('human_id', 'status', 'valid_through'):
+            subscriptions[subscription['human_id']].append(subscription)
+        rows = {}
+        nomens = {}
+        for row in chunk:
+            group = groups.get(uuid.UUID(row['structure__id']))
+            person = persons.get(uuid.UUID(row['subscription__human__id']))
+            if group is None or person is None:
+                continue
+            subscription = get_editable_subscription(
+                subscriptions[row['subscription__human__id']]
+            )
+            if subscription is None:
+                continue
+            key = (person[0], group[0])
+            rows[key] = {
+                'is_current': row['status'],
+                'status': 10 if row['status'] else -10,
+                'valid_through': subscription['valid_through'],
+                'part': get_part(row['vocal_part']),
+                'bhs_pk': uuid.UUID(row['id']),
+            }
+            nomens[key] = " ".join([
+                person[1] or str(person[0]),
+                group[1] or str(group[0]),
+            ])
+        existing = {}
+        for member in Member.objects.filter(
+            person_id__in=set(key[0] for key in rows),
+            group_id__in=set(key[1] for key in rows),
+        ).values('id', 'person_id', 'group_id', *MEMBER_FIELDS):
+            existing[(member.pop('person_id'), member.pop('group_id'))] = member
+        new = []
+        changed = {}
+        touched = set()
+        for key, defaults in rows.items():
+            member = existing.get(key)
+            if member is None:
+                new.append(Member(
+                    person_id=key[0],
+                    group_id=key[1],
+                    nomen=nomens[key],
+                    **defaults
+                ))
+                continue
+            pk = member.pop('id')
+            if member != defaults:
+                changed[pk] = defaults
+                touched.add(key[0])
+        with transaction.atomic():
+            new = bulk_create_or_log(Member, new)
+            updated += bulk_update_or_log(Member, changed, MEMBER_FIELDS)
+        created += len(new)
+        invalidate_roles(touched.union(member.person_id for member in new))
+        log.info((len(chunk), len(new), len(changed)))
+    return created, updated
+
+
+def get_member_smjoins():
+    """The SMJoins that make Members: those of chapters and quartets."""
+    return SMJoin.objects.filter(
+        structure__kind__in=[
+            'quartet',
+            'chapter',
+        ],
+    )
+
+
+def get_member_changes(smjoins):
+    return smjoins.values(
+        'updated_ts',
+        'id',
+        'structure__id',
+        'subscription__human__id',
+    )
+
+
+def sync_member_changes(chunks, smjoins):
+    """Sync the pairs touched by each chunk of changed SMJoin rows.
+
+    Every SMJoin of a touched pair is weighed, since any of them may decide
+    the pair.  Returns the (created, updated) counts.
+    """
+    created = 0
+    updated = 0
+    for chunk in chunks:
+        counts = sync_members_from_smjoins(smjoins.filter(
+            structure__id__in=set(row['structure__id'] for row in chunk),
+            subscription__human__id__in=set(
+                row['subscription__human__id'] for row in chunk
+            ),
+        ))
+        created += counts[0]
+        updated += counts[1]
+    return created, updated
+
+
+def sync_members(state, full=False):
+    """Sync Members from the chapter and quartet SMJoins changed since ``state``.
+
+    A full run streams all pairs once and leaves the watermark where the
+    view stood when it began.  Returns the (created, updated) counts.
+    """
+    smjoins = get_member_smjoins()
+    if full:
+        mark = get_high_water(smjoins)
+        result = sync_members_from_smjoins(smjoins)
+        if mark:
+            state.updated_ts, state.last_id = mark
+            state.save()
+        return result
+    return sync_member_changes(
+        iterate_changes(get_member_changes(smjoins), state),
+        smjoins,
+    )
+
+
+def get_high_water(queryset):
+    """The (updated_ts, id) of the newest row of ``queryset``, or None."""
+    return queryset.order_by(
+        '-updated_ts',
+        '-id',
+    ).values_list(
+        'updated_ts',
+        'id',
+    ).first()
+
+
+def in_window(start, mark, keys=('updated_ts', 'id')):
+    """Rows after ``start``, if given, up to and including ``mark``."""
+    q = ~seek(keys, mark)
+    if start is not None:
+        q &= seek(keys, start)
+    return q
+
+
+def get_partitions(count):
+    """Split the BHS uuid id space into ``count`` (low, high) ranges.
+
+    Bounds are evenly spaced hex prefixes, so uuid4 ids spread evenly; the
+    last range is open-ended.
+    """
+    bounds = ['{0:08x}'.format(i * 16 ** 8 // count) for i in range(count)]
+    return list(zip(bounds, bounds[1:] + [None]))
+
+
+def in_partition(field, low, high):
+    q = Q(**{'{0}__gte'.format(field): low})
+    if high is not None:
+        q &= Q(**{'{0}__lt'.format(field): high})
+    return q
+
+
 def get_auth0():
     token = get_auth0_token()
     return Auth0(
@@ -67,8 +67,27 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.SessionAuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'api.middleware.MetricsMiddleware',
 ]
 
+# Cache
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# Role snapshots, see api.permissions.get_roles
+ROLES_CACHE_TIMEOUT = 60 * 15
+
+# Announced results, see api.scoreboard
+SCOREBOARD_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Metrics
+METRICS_ENABLED = True
+METRICS_PATH_PREFIX = '/api/'
+METRICS_BUFFER_SIZE = 1000
+
 # Templating
 TEMPLATES = [
     {
@@ -106,7 +125,7 @@ REST_FRAMEWORK = {
         'rest_framework.parsers.JSONParser'
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework_json_api.renderers.JSONRenderer',
+        'api.renderers.JSONRenderer',
         'rest_framework.renderers.JSONRenderer',
         'api.renderers.NoHTMLFormBrowsableAPIRenderer',
         'rest_framework.renderers.AdminRenderer',
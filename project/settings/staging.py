@@ -59,6 +59,14 @@ BUGSNAG_API_KEY = get_env_variable("BUGSNAG_API_KEY")
 MIDDLEWARE = ['bugsnag.django.middleware.BugsnagMiddleware'] + MIDDLEWARE
 
 
+# Redis
+CACHES = {
+    'default': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': get_env_variable("REDIS_URL"),
+    }
+}
+
 # Logging
 LOGGING = {
     'version': 1,
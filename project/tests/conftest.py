@@ -30,6 +30,7 @@ from api.factories import (
     SessionFactory,
     SlotFactory,
     SongFactory,
+    TallyFactory,
     UserFactory,
     VenueFactory,
 )
@@ -194,6 +195,11 @@ def song():
     return SongFactory()
 
 
+@pytest.fixture
+def tally():
+    return TallyFactory()
+
+
 @pytest.fixture
 def venue():
     return VenueFactory()
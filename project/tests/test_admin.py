@@ -154,6 +154,12 @@ def test_song_admin_list(admin_client, song):
     assert response.status_code == status.HTTP_200_OK
 
 
+def test_tally_admin_list(admin_client, tally):
+    path = reverse('admin:api_tally_changelist')
+    response = admin_client.get(path)
+    assert response.status_code == status.HTTP_200_OK
+
+
 def test_venue_admin_list(admin_client, venue):
     path = reverse('admin:api_venue_changelist')
     response = admin_client.get(path)
@@ -304,6 +310,12 @@ def test_song_admin_detail(admin_client, song):
     assert response.status_code == status.HTTP_200_OK
 
 
+def test_tally_admin_detail(admin_client, tally):
+    path = reverse('admin:api_tally_change', args=(str(tally.id),))
+    response = admin_client.get(path)
+    assert response.status_code == status.HTTP_200_OK
+
+
 def test_venue_admin_detail(admin_client, venue):
     path = reverse('admin:api_venue_change', args=(str(venue.id),))
     response = admin_client.get(path)
@@ -1,10 +1,25 @@
 # Third-Party
 import pytest
 from rest_framework import status
+from rest_framework.test import APIClient
 
 # Django
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
+# First-Party
+from api.factories import (
+    OfficerFactory,
+    PersonFactory,
+)
+from api.models import (
+    Officer,
+    Person,
+    Round,
+)
+from api.permissions import get_roles
+
 pytestmark = pytest.mark.django_db
 
 
@@ -314,3 +329,169 @@ def test_user_endpoint_detail(api_client, user):
     path = reverse('user-detail', args=(str(user.id),))
     response = api_client.get(path)
     assert response.status_code == status.HTTP_200_OK
+
+
+def test_metrics_endpoint(api_client, appearance):
+    api_client.get(reverse('appearance-list'))
+    path = reverse('metrics')
+    response = api_client.get(path)
+    assert response.status_code == status.HTTP_200_OK
+    assert 'Server-Timing' in response
+    record = response.json()['requests'][-1]
+    assert record['endpoint'] == 'appearance-list'
+    assert record['sql_count'] > 0
+
+
+def test_metrics_disabled(api_client, settings):
+    settings.METRICS_ENABLED = False
+    response = api_client.get(reverse('appearance-list'))
+    assert response.status_code == status.HTTP_200_OK
+    assert 'Server-Timing' not in response
+
+
+def test_metrics_endpoint_staff_only(api_user_client):
+    path = reverse('metrics')
+    response = api_user_client.get(path)
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_appearance_endpoint_list_include(api_client, score):
+    path = reverse('appearance-list')
+    response = api_client.get(path, {'include': 'songs,songs.scores,entry'})
+    assert response.status_code == status.HTTP_200_OK
+    assert 'included' in response.json()
+
+
+def test_person_endpoint_list_sparse_fields(api_client, person):
+    path = reverse('person-list')
+    response = api_client.get(path, {'fields[person]': 'name,members'})
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_group_endpoint_related_members(api_client, member):
+    path = reverse('group-related', args=(str(member.group.id), 'members'))
+    response = api_client.get(path)
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_group_endpoint_detail_links_only(api_client, member):
+    path = reverse('group-detail', args=(str(member.group.id),))
+    response = api_client.get(path)
+    assert response.status_code == status.HTTP_200_OK
+    members = response.json()['data']['relationships']['members']
+    assert 'data' not in members
+    assert members['links']['related'].endswith(
+        reverse('group-related', args=(str(member.group.id), 'members'))
+    )
+
+
+def test_group_endpoint_relationships_members(api_client, member):
+    path = reverse('group-relationships', args=(str(member.group.id), 'members'))
+    response = api_client.get(path)
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_member_endpoint_include_group_queries(api_client, member):
+    path = reverse('member-list')
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.get(path, {'include': 'group'})
+    assert response.status_code == status.HTTP_200_OK
+    included = response.json()['included']
+    assert [item['id'] for item in included] == [str(member.group.id)]
+    # The group's entries, members and repertories are only links.
+    prefetched = [
+        query for query in context.captured_queries
+        if '"group_id" IN' in query['sql']
+    ]
+    assert prefetched == []
+
+
+def test_person_endpoint_list_cursor(api_client):
+    PersonFactory.create_batch(5)
+    # The name sorts first and tied names fall back to the id.
+    Person.objects.update(nomen='Same')
+    Person.objects.filter(
+        pk=Person.objects.order_by('-id').values('id')[:1],
+    ).update(nomen='Other')
+    expected = [
+        str(pk) for pk in Person.objects.order_by(
+            'nomen',
+            'id',
+        ).values_list('id', flat=True)
+    ]
+    path = reverse('person-list')
+    response = api_client.get(path, {'cursor': '', 'page_size': 2})
+    pages = []
+    while True:
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        pages.append([item['id'] for item in data['data']])
+        if data['links']['next'] is None:
+            break
+        response = api_client.get(data['links']['next'])
+    assert len(pages) > 2
+    assert pages == [expected[i:i + 2] for i in range(0, len(expected), 2)]
+
+
+def test_round_endpoint_detail_not_modified(api_client, round):
+    path = reverse('round-detail', args=(str(round.id),))
+    response = api_client.get(path)
+    assert response.status_code == status.HTTP_200_OK
+    response = api_client.get(path, HTTP_IF_NONE_MATCH=response['ETag'])
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def test_round_endpoint_detail_linkage_modified(api_client, appearance):
+    path = reverse('round-detail', args=(str(appearance.round.id),))
+    response = api_client.get(path)
+    etag = response['ETag']
+    appearance.delete()
+    response = api_client.get(path, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_round_endpoint_detail_roles_modified(user, round):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    path = reverse('round-detail', args=(str(round.id),))
+    response = client.get(path)
+    etag = response['ETag']
+    OfficerFactory(person=user.person, status=Officer.STATUS.active)
+    response = client.get(path, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_officer_moved_drops_previous_roles(person):
+    officer = OfficerFactory(status=Officer.STATUS.active)
+    previous = officer.person
+    assert get_roles(previous)['officers']
+    officer.person = person
+    officer.save()
+    assert not get_roles(previous)['officers']
+    assert get_roles(person)['officers']
+
+
+def test_round_endpoint_detail_include_no_etag(api_client, appearance):
+    path = reverse('round-detail', args=(str(appearance.round.id),))
+    response = api_client.get(path, {'include': 'appearances'})
+    assert response.status_code == status.HTTP_200_OK
+    assert not response.has_header('ETag')
+
+
+def test_round_scoreboard_not_announced(api_client, round):
+    path = reverse('scoreboard-round', args=(str(round.id),))
+    response = api_client.get(path)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_round_scoreboard_score_correction(api_client, score):
+    round = score.song.appearance.round
+    Round.objects.filter(pk=round.pk).update(status=Round.STATUS.announced)
+    path = reverse('scoreboard-round', args=(str(round.id),))
+    response = api_client.get(path)
+    assert response.status_code == status.HTTP_200_OK
+    score.points += 1
+    score.save()
+    response = api_client.get(path)
+    song = response.json()['appearances'][0]['songs'][0]
+    assert song['mus_points'] == score.points
@@ -0,0 +1,498 @@
+# Standard Libary
+from unittest import mock
+
+# Third-Party
+import pytest
+
+# Django
+from django.db.models import (
+    Avg,
+    Sum,
+)
+
+# First-Party
+from api.factories import (
+    AppearanceFactory,
+    AwardFactory,
+    ContestantFactory,
+    ContestFactory,
+    EntryFactory,
+    RoundFactory,
+    ScoreFactory,
+    SessionFactory,
+    SongFactory,
+)
+from api.models import (
+    Appearance,
+    Contestant,
+    Entry,
+    Round,
+    Score,
+    Song,
+    Tally,
+)
+from api.scoring import (
+    CATEGORIES,
+    COUNT_FIELDS,
+    SCORING_FIELDS,
+    advance_round,
+    child_tallies,
+    competition_ranks,
+    find_variances,
+    propagate_score,
+    score_session,
+    score_tallies,
+    tally_values,
+    verify_round,
+    write_tallies,
+)
+
+pytestmark = pytest.mark.django_db
+
+OFF = Score.KIND.official
+PRA = Score.KIND.practice
+COM = Score.KIND.composite
+MUS = Score.CATEGORY.music
+PER = Score.CATEGORY.performance
+SNG = Score.CATEGORY.singing
+
+# (kind, category, points) for each song, by entry and round number.
+SHEETS = [
+    {
+        1: [
+            [(OFF, MUS, 80), (OFF, PER, 75), (OFF, SNG, 78), (PRA, MUS, 90)],
+            [(OFF, MUS, 70), (OFF, PER, 72), (OFF, PER, 44), (OFF, SNG, None), (COM, SNG, 60)],
+        ],
+        2: [
+            [(OFF, MUS, 85), (OFF, PER, 80), (OFF, SNG, 82)],
+        ],
+    },
+    {
+        1: [
+            [(OFF, MUS, 75), (OFF, MUS, 87), (OFF, PER, 80), (OFF, SNG, 78)],
+            [(OFF, MUS, 72), (OFF, PER, 70), (OFF, SNG, None)],
+        ],
+        2: [
+            [(OFF, MUS, None), (OFF, PER, None)],
+        ],
+    },
+    {
+        1: [
+            [(OFF, MUS, 60), (OFF, PER, 74), (OFF, SNG, 75)],
+            [(OFF, MUS, 70), (OFF, PER, 71), (OFF, SNG, 69)],
+        ],
+        2: [
+            [(OFF, MUS, 90), (OFF, PER, 88), (OFF, SNG, 40)],
+        ],
+    },
+]
+
+
+@pytest.fixture
+def scored_session():
+    """Three entries over two rounds and two contests.
+
+    The first and third entries tie in the first round and in the
+    one-round contest; the second entry's finals song has no points.
+    """
+    session = SessionFactory()
+    rounds = {
+        1: RoundFactory(session=session, num=1, kind=Round.KIND.quarters),
+        2: RoundFactory(session=session, num=2, kind=Round.KIND.finals),
+    }
+    contests = [
+        ContestFactory(session=session, award=AwardFactory(rounds=1)),
+        ContestFactory(session=session, award=AwardFactory(rounds=2)),
+    ]
+    entries = []
+    for sheet in SHEETS:
+        entry = EntryFactory(session=session)
+        entries.append(entry)
+        for contest in contests:
+            ContestantFactory(entry=entry, contest=contest)
+        for num, songs in sheet.items():
+            appearance = AppearanceFactory(round=rounds[num], entry=entry)
+            for i, scores in enumerate(songs, start=1):
+                song = SongFactory(appearance=appearance, num=i)
+                for kind, category, points in scores:
+                    ScoreFactory(
+                        song=song,
+                        kind=kind,
+                        category=category,
+                        points=points,
+                    )
+    return {
+        'session': session,
+        'rounds': rounds,
+        'contests': contests,
+        'entries': entries,
+    }
+
+
+def baseline_values(scores):
+    """Official totals as the original per-object aggregates computed them."""
+    values = {}
+    official = scores.filter(kind=OFF)
+    for prefix, category in CATEGORIES:
+        result = official.filter(
+            category=category,
+        ).aggregate(
+            points=Sum('points'),
+            score=Avg('points'),
+        )
+        values['{0}_points'.format(prefix)] = result['points']
+        values['{0}_score'.format(prefix)] = result['score']
+    result = official.aggregate(
+        points=Sum('points'),
+        score=Avg('points'),
+    )
+    values['tot_points'] = result['points']
+    values['tot_score'] = result['score']
+    return values
+
+
+def baseline_rank(point_total, point_totals):
+    """Competition rank (1, 2, 2, 4) as `ranking.Ranking` gave it."""
+    if not point_total:
+        return None
+    return 1 + len([p for p in point_totals if p and p > point_total])
+
+
+def assert_baseline(obj, scores):
+    for name, expected in baseline_values(scores).items():
+        actual = getattr(obj, name)
+        if expected is None:
+            assert actual is None, name
+        else:
+            assert actual == pytest.approx(expected), name
+
+
+def assert_baseline_totals(session):
+    for song in Song.objects.filter(appearance__round__session=session):
+        assert_baseline(song, Score.objects.filter(song=song))
+    for appearance in Appearance.objects.filter(round__session=session):
+        assert_baseline(
+            appearance,
+            Score.objects.filter(song__appearance=appearance),
+        )
+    for entry in Entry.objects.filter(session=session):
+        assert_baseline(
+            entry,
+            Score.objects.filter(song__appearance__entry=entry),
+        )
+    for contestant in Contestant.objects.filter(contest__session=session):
+        assert_baseline(
+            contestant,
+            Score.objects.filter(
+                song__appearance__entry=contestant.entry,
+                song__appearance__round__num__lte=contestant.contest.award.rounds,
+            ),
+        )
+
+
+def baseline_variances(song):
+    """Official scores the original per-score `verify()` flagged."""
+    scores = Score.objects.filter(song=song, kind=OFF)
+    ordered = list(scores.order_by('points').values_list('points', flat=True))
+    flagged = set()
+    for score in scores:
+        avg = scores.filter(
+            category=score.category,
+        ).aggregate(
+            avg=Avg('points'),
+        )['avg']
+        if abs(score.points - avg) > 5:
+            flagged.add(score.id)
+        if ordered[1] - ordered[0] > 5 and ordered[0] == score.points:
+            flagged.add(score.id)
+        if ordered[-1] - ordered[-2] > 5 and ordered[-1] == score.points:
+            flagged.add(score.id)
+    return flagged
+
+
+def assert_baseline_ranks(session):
+    for round in session.rounds.all():
+        appearances = list(round.appearances.all())
+        totals = [a.tot_points for a in appearances]
+        for appearance in appearances:
+            assert appearance.rank == baseline_rank(appearance.tot_points, totals)
+    for contest in session.contests.all():
+        contestants = list(contest.contestants.all())
+        totals = [c.tot_points for c in contestants]
+        for contestant in contestants:
+            assert contestant.rank == baseline_rank(contestant.tot_points, totals)
+    primary = session.contests.first()
+    for entry in session.entries.all():
+        assert entry.rank == entry.contestants.get(contest=primary).rank
+
+
+def get_appearance(scored_session, index, num):
+    return Appearance.objects.get(
+        entry=scored_session['entries'][index],
+        round__num=num,
+    )
+
+
+def get_song_id(scored_session, index, num, song=1):
+    return get_appearance(scored_session, index, num).songs.get(num=song).id
+
+
+def test_tally_values():
+    values = tally_values({MUS: [150, 2], SNG: [0, 0], PER: [70, 1]})
+    assert values['mus_points'] == 150
+    assert values['mus_score'] == 75
+    assert values['mus_count'] == 2
+    assert values['per_points'] == 70
+    assert values['sng_points'] is None
+    assert values['sng_score'] is None
+    assert values['sng_count'] == 0
+    assert values['tot_points'] == 220
+    assert values['tot_score'] == pytest.approx(220 / 3)
+    assert values['tot_count'] == 3
+    assert tally_values({})['tot_points'] is None
+
+
+def test_competition_ranks():
+    totals = [80, 90, 80, None, 0, 70]
+    ranks = competition_ranks(totals)
+    assert ranks == {90: 1, 80: 2, 70: 4}
+    for total in totals:
+        assert ranks.get(total) == baseline_rank(total, totals)
+
+
+def test_score_tallies(scored_session):
+    song = Song.objects.get(pk=get_song_id(scored_session, 0, 1, song=2))
+    tallies = dict(
+        (row['category'], (row['points_sum'], row['points_count']))
+        for row in score_tallies(song.scores.all())
+    )
+    # Practice and composite scores and unscored points do not count.
+    assert tallies == {MUS: (70, 1), PER: (116, 2), SNG: (None, 0)}
+
+
+def test_child_tallies(scored_session):
+    appearance = get_appearance(scored_session, 0, 1)
+    tallies = dict(
+        (row['category'], (row['points_sum'], row['points_count']))
+        for row in child_tallies(Tally.LEVEL.song, appearance.songs.values('id'))
+    )
+    assert tallies == {MUS: (150, 2), PER: (191, 3), SNG: (78, 1)}
+
+
+def test_signals_match_baseline(scored_session):
+    assert_baseline_totals(scored_session['session'])
+
+
+def test_score_session_matches_baseline(scored_session):
+    session = scored_session['session']
+    Tally.objects.all().delete()
+    for model in [Song, Appearance, Entry, Contestant]:
+        model.objects.update(**dict((name, None) for name in SCORING_FIELDS))
+    score_session(session)
+    assert_baseline_totals(session)
+    assert_baseline_ranks(session)
+    first = dict(
+        (a.entry_id, (a.tot_points, a.rank))
+        for a in scored_session['rounds'][1].appearances.all()
+    )
+    entries = scored_session['entries']
+    assert first == {
+        entries[0].id: (419, 2),
+        entries[1].id: (462, 1),
+        entries[2].id: (419, 2),
+    }
+    finals = get_appearance(scored_session, 1, 2)
+    assert finals.tot_points is None
+    assert finals.rank is None
+
+
+def test_score_session_entries_rank_whole_session(scored_session):
+    session = scored_session['session']
+    score_session(session)
+    entries = scored_session['entries']
+    Score.objects.filter(
+        song__appearance__entry=entries[1],
+        points=87,
+    ).update(points=40)
+    score_session(session, entries=Entry.objects.filter(pk=entries[2].pk))
+    # The changed entry's totals are not rewritten, but everyone's rank is.
+    assert get_appearance(scored_session, 1, 1).tot_points == 462
+    ranks = dict(
+        (a.entry_id, a.rank)
+        for a in scored_session['rounds'][1].appearances.all()
+    )
+    assert ranks == {entries[0].id: 1, entries[1].id: 3, entries[2].id: 1}
+
+
+def test_write_tallies(scored_session):
+    song_id = get_song_id(scored_session, 0, 1)
+    write_tallies(Tally.LEVEL.song, {song_id: {(OFF, MUS): [10, 1]}})
+    assert list(
+        Tally.objects.filter(
+            level=Tally.LEVEL.song,
+            object_id=song_id,
+        ).values_list('kind', 'category', 'points', 'count')
+    ) == [(OFF, MUS, 10, 1)]
+
+
+def test_propagate_score(scored_session):
+    session = scored_session['session']
+    score = Score.objects.get(
+        song_id=get_song_id(scored_session, 2, 2),
+        category=SNG,
+    )
+    score.points = 70
+    score.save()
+    assert_baseline_totals(session)
+    # Non-official scores change tallies but no totals.
+    practice = Score.objects.get(kind=PRA)
+    practice.points = 50
+    practice.save()
+    assert_baseline_totals(session)
+    assert Tally.objects.get(
+        level=Tally.LEVEL.contestant,
+        object_id=Contestant.objects.get(
+            entry=scored_session['entries'][0],
+            contest=scored_session['contests'][0],
+        ).id,
+        kind=PRA,
+    ).points == 50
+    Score.objects.filter(
+        song__appearance__entry=scored_session['entries'][0],
+        points=44,
+    ).get().delete()
+    assert_baseline_totals(session)
+    # A change that moves nothing is a no-op.
+    propagate_score(score.song_id, (OFF, SNG, 70), (OFF, SNG, 70))
+    assert_baseline_totals(session)
+
+
+def test_delete_removes_tallies(scored_session):
+    entry = scored_session['entries'][0]
+    ids = [entry.id]
+    ids.extend(entry.contestants.values_list('id', flat=True))
+    ids.extend(entry.appearances.values_list('id', flat=True))
+    ids.extend(
+        Song.objects.filter(
+            appearance__entry=entry,
+        ).values_list('id', flat=True)
+    )
+    assert Tally.objects.filter(object_id__in=ids).exists()
+    entry.delete()
+    assert not Tally.objects.filter(object_id__in=ids).exists()
+    assert Tally.objects.filter(
+        level=Tally.LEVEL.entry,
+        object_id=scored_session['entries'][1].id,
+    ).exists()
+
+
+def test_delete_round_rescores_once(scored_session):
+    session = scored_session['session']
+    with mock.patch('api.signals.propagate_score') as propagate:
+        with mock.patch(
+            'api.signals.score_session',
+            wraps=score_session,
+        ) as rescore:
+            scored_session['rounds'][2].delete()
+    assert not propagate.called
+    assert rescore.call_count == 1
+    assert_baseline_totals(session)
+    assert_baseline_ranks(session)
+
+
+def test_delete_song_rescores_entry(scored_session):
+    session = scored_session['session']
+    appearance = get_appearance(scored_session, 0, 1)
+    with mock.patch('api.signals.propagate_score') as propagate:
+        appearance.songs.get(num=1).delete()
+    assert not propagate.called
+    assert_baseline_totals(session)
+
+
+def test_find_variances(scored_session):
+    flagged = find_variances(
+        Score.objects.filter(song__appearance__round__session=scored_session['session'])
+    )
+    for song in Song.objects.filter(appearance__round__session=scored_session['session']):
+        if song.scores.filter(kind=OFF, points__isnull=True).exists():
+            continue
+        assert flagged & set(song.scores.values_list('id', flat=True)) == baseline_variances(song)
+    # Unscored points are skipped rather than breaking the song's checks.
+    song_id = get_song_id(scored_session, 0, 1, song=2)
+    assert set(
+        Score.objects.filter(song_id=song_id, id__in=flagged).values_list('points', flat=True)
+    ) == {72, 44}
+    assert Score.objects.filter(id__in=flagged).count() == 6
+
+
+def test_verify_round(scored_session):
+    round = scored_session['rounds'][1]
+    flagged = verify_round(round)
+    assert set(
+        Score.objects.filter(is_flagged=True).values_list('id', flat=True)
+    ) == flagged
+    assert set(
+        Score.objects.filter(id__in=flagged).values_list('points', 'original')
+    ) == {(72, 72), (44, 44), (75, 75), (87, 87), (60, 60)}
+
+
+def test_advance_round(scored_session):
+    round = scored_session['rounds'][1]
+    entries = scored_session['entries']
+    # The original cut ordered entries by all their points, of every kind.
+    totals = dict(
+        round.session.entries.annotate(
+            tot=Sum('appearances__songs__scores__points'),
+        ).values_list('id', 'tot')
+    )
+    assert totals == {
+        entries[0].id: 816,
+        entries[1].id: 462,
+        entries[2].id: 637,
+    }
+    advancers, finishers = advance_round(round, 1)
+    assert advancers == [entries[0].id]
+    assert set(finishers) == {entries[1].id, entries[2].id}
+    draws = dict(round.appearances.values_list('entry_id', 'draw'))
+    assert draws == {entries[0].id: 1, entries[1].id: -1, entries[2].id: -1}
+
+
+def test_advance_round_tie(scored_session):
+    round = scored_session['rounds'][1]
+    entries = scored_session['entries']
+    ScoreFactory(
+        song=Song.objects.get(pk=get_song_id(scored_session, 1, 1)),
+        kind=PRA,
+        category=MUS,
+        points=175,
+    )
+    # The second and third entries now tie for the second spot.
+    advancers, finishers = advance_round(round, 2)
+    assert set(advancers) == set(e.id for e in entries)
+    assert finishers == []
+    draws = dict(round.appearances.values_list('entry_id', 'draw'))
+    assert sorted(draws.values()) == [1, 2, 3]
+
+
+def test_score_edit_without_tallies(scored_session):
+    session = scored_session['session']
+    score_session(session)
+    # Sessions scored before tallies and running counts existed.
+    Tally.objects.all().delete()
+    for model in [Song, Appearance, Entry, Contestant]:
+        model.objects.update(**dict((name, None) for name in COUNT_FIELDS))
+    score = Score.objects.get(
+        song__appearance__entry=scored_session['entries'][2],
+        song__appearance__round__num=1,
+        category=MUS,
+        points=60,
+    )
+    score.points = 66
+    score.save()
+    assert_baseline_totals(session)
+    assert Tally.objects.filter(
+        level=Tally.LEVEL.song,
+        object_id=score.song_id,
+        kind=OFF,
+        category=MUS,
+    ).values_list('points', 'count').get() == (66, 1)
@@ -0,0 +1,194 @@
+# Standard Libary
+import datetime
+import uuid
+from unittest import mock
+
+# Third-Party
+import pytest
+
+# Django
+from django.utils import timezone
+
+# First-Party
+from api.models import SyncState
+from bhs.models import Human
+from bhs.updaters import (
+    bulk_create_or_log,
+    bulk_update_or_log,
+    get_partitions,
+    get_sync_state,
+    get_watermark,
+    in_partition,
+    iterate_changes,
+    iterate_member_smjoins,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def make_human(pk, updated):
+    return Human.objects.create(
+        id=pk,
+        username=pk,
+        first_name='First',
+        middle_name='',
+        last_name='Last',
+        nick_name='',
+        email='',
+        birth_date=datetime.date(1970, 1, 1),
+        is_deceased=False,
+        phone='',
+        cell_phone='',
+        work_phone='',
+        bhs_id=0,
+        sex='',
+        primary_voice_part='',
+        created_ts=updated,
+        updated_ts=updated,
+    )
+
+
+def smjoin(pk, structure, human, status, established_date):
+    return {
+        'id': pk,
+        'structure__id': structure,
+        'subscription__human__id': human,
+        'status': status,
+        'vocal_part': '',
+        'established_date': established_date,
+    }
+
+
+def baseline_winner(rows):
+    """The row `order_by('status', 'established_date').last()` gave.
+
+    MySQL sorts NULL dates first; tied rows are taken in id order, as the
+    view reads them.
+    """
+    return sorted(rows, key=lambda row: (
+        row['status'],
+        row['established_date'] is not None,
+        row['established_date'] or datetime.date.min,
+        row['id'],
+    ))[-1]
+
+
+def test_iterate_member_smjoins_winner():
+    rows = [
+        # An older active row beats a newer inactive one.
+        smjoin('a1', 's1', 'h1', False, datetime.date(2015, 1, 1)),
+        smjoin('a2', 's1', 'h1', True, None),
+        smjoin('a3', 's1', 'h1', True, datetime.date(2010, 1, 1)),
+        smjoin('a4', 's1', 'h1', True, datetime.date(2012, 1, 1)),
+        # An active row with no date beats any inactive one.
+        smjoin('b1', 's1', 'h2', True, None),
+        smjoin('b2', 's1', 'h2', False, datetime.date(2018, 1, 1)),
+        # Full ties go to the last row read.
+        smjoin('c1', 's2', 'h1', False, None),
+        smjoin('c2', 's2', 'h1', False, None),
+        smjoin('d2', 's2', 'h2', True, datetime.date(2014, 1, 1)),
+        smjoin('d1', 's2', 'h2', True, datetime.date(2014, 1, 1)),
+    ]
+
+    def stream(queryset, keys):
+        return iter(sorted(rows, key=lambda row: [row[key] for key in keys]))
+
+    with mock.patch('bhs.updaters.stream', side_effect=stream):
+        winners = list(iterate_member_smjoins(mock.MagicMock()))
+    pairs = {}
+    for row in rows:
+        pairs.setdefault(
+            (row['structure__id'], row['subscription__human__id']),
+            [],
+        ).append(row)
+    assert winners == [baseline_winner(pairs[pair]) for pair in sorted(pairs)]
+    assert [winner['id'] for winner in winners] == ['a4', 'b1', 'c2', 'd2']
+
+
+def test_bulk_create_or_log_conflict():
+    SyncState.objects.create(source='taken')
+    with mock.patch('bhs.updaters.log') as log:
+        created = bulk_create_or_log(SyncState, [
+            SyncState(source='taken'),
+            SyncState(source='free'),
+        ])
+    assert [state.source for state in created] == ['free']
+    assert SyncState.objects.filter(source='free').exists()
+    assert log.error.call_count == 1
+
+
+def test_bulk_update_or_log_conflict():
+    SyncState.objects.create(source='taken')
+    first = SyncState.objects.create(source='first')
+    second = SyncState.objects.create(source='second')
+    with mock.patch('bhs.updaters.log') as log:
+        updated = bulk_update_or_log(SyncState, {
+            first.pk: {'source': 'taken'},
+            second.pk: {'source': 'moved'},
+        }, ['source'])
+    assert updated == 1
+    assert SyncState.objects.get(pk=first.pk).source == 'first'
+    assert SyncState.objects.get(pk=second.pk).source == 'moved'
+    assert log.error.call_count == 1
+
+
+def test_iterate_changes_resumes_after_interrupted_chunk():
+    start = timezone.now()
+    # Pairs of rows share an updated_ts, so the id breaks the ties.
+    for i in range(5):
+        make_human('{0:08x}'.format(i), start + datetime.timedelta(minutes=i // 2))
+    ordered = list(
+        Human.objects.order_by('updated_ts', 'id').values_list('id', flat=True)
+    )
+    state = get_sync_state(Human)
+    chunks = iterate_changes(Human.objects.all(), state, size=2)
+    first = next(chunks)
+    next(chunks)
+    # Interrupted while writing the second chunk.
+    chunks.close()
+    state = get_sync_state(Human)
+    assert get_watermark(state) == (first[-1].updated_ts, first[-1].id)
+    resumed = [
+        human.id
+        for chunk in iterate_changes(Human.objects.all(), state, size=2)
+        for human in chunk
+    ]
+    assert resumed == ordered[2:]
+    state = get_sync_state(Human)
+    assert state.last_id == ordered[-1]
+
+
+def test_sync_state_per_partition():
+    whole = get_sync_state(Human)
+    partition = get_sync_state(Human, partition=('00000000', '10000000'))
+    last = get_sync_state(Human, partition=('f0000000', None))
+    assert len(set([whole.pk, partition.pk, last.pk])) == 3
+
+
+@pytest.mark.parametrize('count', [1, 3, 16])
+def test_partitions_cover_id_space(count):
+    partitions = get_partitions(count)
+    assert len(partitions) == count
+    assert partitions[0][0] == '00000000'
+    assert partitions[-1][1] is None
+    for (low, high), (next_low, next_high) in zip(partitions, partitions[1:]):
+        assert low < high == next_low
+    # Ids on and just below every bound, the extremes and a random spread.
+    ids = set([str(uuid.UUID(int=2 ** 128 - 1))])
+    for low, high in partitions:
+        bound = int(low, 16) << 96
+        ids.add(str(uuid.UUID(int=bound)))
+        if bound:
+            ids.add(str(uuid.UUID(int=bound - 1)))
+    ids.update(str(uuid.uuid4()) for _ in range(50))
+    now = timezone.now()
+    for pk in ids:
+        make_human(pk, now)
+    matched = []
+    for low, high in partitions:
+        matched.extend(
+            Human.objects.filter(
+                in_partition('id', low, high),
+            ).values_list('id', flat=True)
+        )
+    assert sorted(matched) == sorted(ids)